@@ -0,0 +1,75 @@
+"""Benchmark of the memory used by a chain of blocks processing an int16
+capture with the different dtype policies of the registry.
+
+The chain consists of an Amplifier, an IIR Filter, a Window and an FFT.
+Measures the bytes held by the outputs and the peak of the allocated memory
+while processing.
+
+Usage:
+    python benchmarks/dtype_policy.py [values]
+"""
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+from mca import blocks
+from mca.framework import Block, cache, data_types, io_registry
+
+
+class SourceBlock(Block):
+    """Block which outputs the signal assigned to it."""
+    name = "Source"
+    signal = None
+
+    def setup_io(self):
+        self.new_output()
+
+    def setup_parameters(self):
+        pass
+
+    def process(self):
+        self.outputs[0].data = self.signal
+
+
+def run(policy, signal):
+    """Processes the signal with the dtype policy.
+
+    Returns:
+        tuple: MiB held by the outputs, peak MiB while processing and time in
+               s.
+    """
+    registry = io_registry.IORegistry(dtype_policy=policy)
+    with registry.activate():
+        source = SourceBlock()
+        chain = [blocks.Amplifier(multiplier={"factor": 0.5}),
+                 blocks.IRRFilter(cut_off=10),
+                 blocks.Window(),
+                 blocks.FFT()]
+    for previous, block in zip([source] + chain, chain):
+        block.inputs[0].connect(previous.outputs[0])
+    chain[-1].outputs[0].pinned = True
+    source.signal = signal
+    tracemalloc.start()
+    start = time.perf_counter()
+    source.trigger_update()
+    duration = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    held = sum(cache.data_size(block.outputs[0]._data) for block in chain)
+    return held / 2 ** 20, peak / 2 ** 20, duration
+
+
+def main(values=10 * 2 ** 20):
+    ordinate = (np.sin(np.arange(values) / 10) * 2 ** 14).astype(np.int16)
+    signal = data_types.Signal(0, values, 1 / 48000, ordinate)
+    print(f"{'policy':>8}  {'held MiB':>9}  {'peak MiB':>9}  {'time s':>7}")
+    for policy in data_types.DTYPE_POLICIES:
+        held, peak, duration = run(policy, signal)
+        print(f"{str(policy):>8}  {held:>9.1f}  {peak:>9.1f}  "
+              f"{duration:>7.2f}")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,85 @@
+"""Benchmark of running a fixed block structure with new source data
+through the update mechanism of the registry and through a compiled
+:class:`.ExecutionPlan`.
+
+Builds a chain of amplifiers fed by a source block and measures the time of
+a single run for different signal lengths.
+
+Usage:
+    python benchmarks/execution_plan.py [blocks] [runs]
+"""
+import sys
+import time
+
+import numpy as np
+
+from mca import blocks
+from mca.framework import Block, data_types, io_registry
+
+
+class SourceBlock(Block):
+    """Block which outputs the signal assigned to it."""
+    name = "Source"
+    signal = None
+
+    def setup_io(self):
+        self.new_output()
+
+    def setup_parameters(self):
+        pass
+
+    def process(self):
+        self.outputs[0].data = self.signal
+
+
+def measure(function, runs):
+    """Returns the time of a single call of the function in µs."""
+    start = time.perf_counter()
+    for index in range(runs):
+        function(index)
+    return (time.perf_counter() - start) / runs * 1e6
+
+
+def run(count, values, runs):
+    """Measures a run of a chain of amplifiers.
+
+    Returns:
+        tuple: Time per run through the registry and through the plan in µs.
+    """
+    registry = io_registry.IORegistry()
+    with registry.activate():
+        source = SourceBlock()
+        chain = [blocks.Amplifier(multiplier={"factor": 1.001})
+                 for _ in range(count)]
+    with registry.batch():
+        for previous, block in zip([source] + chain, chain):
+            block.inputs[0].connect(previous.outputs[0])
+        chain[-1].outputs[0].pinned = True
+    signals = [data_types.Signal(0, values, 0.01, np.full(values, index))
+               for index in range(2)]
+
+    def update(index):
+        source.signal = signals[index % 2]
+        source.trigger_update()
+
+    registry_time = measure(update, runs)
+    plan = registry.compile(feeds=[source.outputs[0]])
+
+    def execute(index):
+        plan.run({source.outputs[0]: signals[index % 2]})
+
+    plan_time = measure(execute, runs)
+    return registry_time, plan_time
+
+
+def main(count=50, runs=200):
+    print(f"{'values':>8}  {'registry µs':>12}  {'plan µs':>9}  "
+          f"{'speedup':>8}")
+    for values in (10, 1000, 100000):
+        registry_time, plan_time = run(count, values, runs)
+        print(f"{values:>8}  {registry_time:>12.1f}  {plan_time:>9.1f}  "
+              f"{registry_time / plan_time:>8.2f}")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
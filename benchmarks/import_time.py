@@ -0,0 +1,53 @@
+"""Benchmark of the import time of the packages of mca in fresh
+interpreters, which is the startup cost of headless processes.
+
+Each statement is run in a new interpreter and the median of the runs is
+reported. ``import mca.framework`` should stay below 200 ms.
+
+Usage:
+    python benchmarks/import_time.py [runs]
+"""
+import statistics
+import subprocess
+import sys
+
+STATEMENTS = (
+    "import numpy",
+    "import mca.framework",
+    "import mca.blocks",
+    "import mca.batch",
+    "from mca import blocks; blocks.Amplifier",
+    "from mca import blocks; blocks.block_classes",
+)
+
+CODE = """
+import time
+start = time.perf_counter()
+{statement}
+duration = time.perf_counter() - start
+import sys
+qt = any(name.startswith("PySide6") for name in sys.modules)
+print(duration * 1e3, qt)
+"""
+
+
+def measure(statement, runs):
+    """Returns the median import time in ms and whether Qt was imported."""
+    times = []
+    for _ in range(runs):
+        output = subprocess.run(
+            [sys.executable, "-c", CODE.format(statement=statement)],
+            capture_output=True, text=True, check=True).stdout.split()
+        times.append(float(output[0]))
+    return statistics.median(times), output[1] == "True"
+
+
+def main(runs=5):
+    print(f"{'statement':<46}  {'ms':>8}  {'Qt':>3}")
+    for statement in STATEMENTS:
+        duration, qt = measure(statement, runs)
+        print(f"{statement:<46}  {duration:>8.1f}  {'yes' if qt else 'no':>3}")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
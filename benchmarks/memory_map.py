@@ -0,0 +1,78 @@
+"""Benchmark of loading a large .wav file with the Audio Loader read into
+memory and memory-mapped.
+
+Writes a stereo int16 file of the given size into a temporary directory and
+measures the time to load it and the increase of the resident memory of the
+process. The Audio Loader normalizes by default, which reads the whole file
+even if it is mapped. Each case runs in a new process. The resident memory is read from
+/proc, so the benchmark only runs on Linux.
+
+Usage:
+    python benchmarks/memory_map.py [MiB]
+"""
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+import scipy.io.wavfile
+
+from mca import blocks
+
+CASES = {
+    "read, normalized": {"memory_map": False, "normalize": True},
+    "default (mapped, normalized)": {"memory_map": True, "normalize": True},
+    "read": {"memory_map": False, "normalize": False},
+    "mapped": {"memory_map": True, "normalize": False},
+    "mapped, cut 1 s": {"memory_map": True, "normalize": False, "cut": True},
+}
+
+
+def resident():
+    """Returns the resident memory of the process in MiB."""
+    with open("/proc/self/statm") as statm:
+        return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / \
+            2 ** 20
+
+
+def load(file_name, memory_map, normalize, cut=False):
+    """Loads the file and returns the time in s and the increase of the
+    resident memory in MiB.
+    """
+    # Import the lazily imported blocks before measuring
+    loader_class, cutter_class = blocks.AudioLoader, blocks.Cutter
+    before = resident()
+    start = time.perf_counter()
+    loader = loader_class(file_name=file_name, memory_map=memory_map,
+                          normalize=normalize)
+    loader.load_wav()
+    if cut:
+        cutter = cutter_class(start_value=10, end_value=11)
+        cutter.inputs[0].connect(loader.outputs[0])
+        np.sum(cutter.outputs[0].data.ordinate)
+    duration = time.perf_counter() - start
+    return duration, resident() - before
+
+
+def main(size=256):
+    with tempfile.TemporaryDirectory() as directory:
+        file_name = os.path.join(directory, "large.wav")
+        frames = size * 2 ** 20 // 4
+        data = np.empty((frames, 2), dtype=np.int16)
+        data[:, 0] = np.arange(frames) % 2 ** 15
+        data[:, 1] = -data[:, 0]
+        scipy.io.wavfile.write(file_name, 48000, data)
+        del data
+        print(f"{size} MiB, {frames / 48000:.0f} s")
+        print(f"{'case':>28}  {'time s':>7}  {'RSS MiB':>8}")
+        context = multiprocessing.get_context("spawn")
+        for name, kwargs in CASES.items():
+            with context.Pool(1) as pool:
+                duration, rss = pool.apply(load, (file_name,), kwargs)
+            print(f"{name:>28}  {duration:>7.3f}  {rss:>8.1f}")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,47 @@
+"""Benchmark of the metadata handling of cheap blocks on short signals.
+
+Measures accessing the metadata of an Output, parsing a unit and the
+process method of an Amplifier and an Absolute block on a signal with few
+values, where the metadata handling dominates the runtime.
+
+Usage:
+    python benchmarks/metadata.py [runs]
+"""
+import sys
+import time
+
+from mca import blocks
+from mca.framework import data_types, io_registry
+
+
+def measure(function, runs):
+    """Returns the time of a single call of the function in µs."""
+    start = time.perf_counter()
+    for _ in range(runs):
+        function()
+    return (time.perf_counter() - start) / runs * 1e6
+
+
+def main(runs=20000):
+    registry = io_registry.IORegistry()
+    with registry.activate():
+        generator = blocks.SignalGeneratorPeriodic(
+            abscissa={"values": 16})
+        amplifier = blocks.Amplifier(multiplier={"factor": 2})
+        absolute = blocks.Absolute()
+    amplifier.inputs[0].connect(generator.outputs[0])
+    absolute.inputs[0].connect(amplifier.outputs[0])
+    generator.trigger_update()
+    print(f"{'operation':>18}  {'µs':>8}")
+    results = (
+        ("Output.metadata", lambda: generator.outputs[0].metadata),
+        ("string_to_unit", lambda: data_types.string_to_unit("(V*s)/A")),
+        ("Amplifier.process", amplifier.process),
+        ("Absolute.process", absolute.process),
+    )
+    for name, function in results:
+        print(f"{name:>18}  {measure(function, runs):>8.2f}")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,95 @@
+"""Benchmark of processing many channels with a chain of blocks for each
+channel and with a single chain of multi-channel signals.
+
+Each chain consists of an Amplifier, an IIR Filter, a Window and an FFT.
+Measures a run for new source data for different amounts of channels.
+
+Usage:
+    python benchmarks/multi_channel.py [values] [runs]
+"""
+import sys
+import time
+
+import numpy as np
+
+from mca import blocks
+from mca.framework import Block, data_types, io_registry
+
+
+class SourceBlock(Block):
+    """Block which outputs the signal assigned to it."""
+    name = "Source"
+    signal = None
+
+    def setup_io(self):
+        self.new_output()
+
+    def setup_parameters(self):
+        pass
+
+    def process(self):
+        self.outputs[0].data = self.signal
+
+
+def chain(source):
+    """Connects a chain of blocks to the source and returns its blocks."""
+    chain_blocks = [blocks.Amplifier(multiplier={"factor": 2}),
+                    blocks.IRRFilter(cut_off=10),
+                    blocks.Window(),
+                    blocks.FFT()]
+    for previous, block in zip([source] + chain_blocks, chain_blocks):
+        block.inputs[0].connect(previous.outputs[0])
+    chain_blocks[-1].outputs[0].pinned = True
+    return chain_blocks
+
+
+def measure(registry, sources, signals, runs):
+    """Returns the time of a run with new data of all sources in ms."""
+    start = time.perf_counter()
+    for index in range(runs):
+        with registry.batch():
+            for source, signal in zip(sources, signals[index % 2]):
+                source.signal = signal
+                source.trigger_update()
+    return (time.perf_counter() - start) / runs * 1e3
+
+
+def run(channels, values, runs):
+    """Measures the runs of separate chains and a multi-channel chain.
+
+    Returns:
+        tuple: Time per run of the separate chains and of the multi-channel
+               chain in ms.
+    """
+    ordinates = [np.random.default_rng(seed).standard_normal(
+        (channels, values)) for seed in range(2)]
+    registry = io_registry.IORegistry()
+    with registry.activate():
+        sources = [SourceBlock() for _ in range(channels)]
+        for source in sources:
+            chain(source)
+    signals = [[data_types.Signal(0, values, 0.001, row) for row in ordinate]
+               for ordinate in ordinates]
+    separate = measure(registry, sources, signals, runs)
+
+    registry = io_registry.IORegistry()
+    with registry.activate():
+        source = SourceBlock()
+        chain(source)
+    signals = [[data_types.MultiChannelSignal(0, values, 0.001, ordinate)]
+               for ordinate in ordinates]
+    multi_channel = measure(registry, [source], signals, runs)
+    return separate, multi_channel
+
+
+def main(values=4096, runs=20):
+    print(f"{'channels':>8}  {'separate ms':>12}  {'multi ms':>9}  "
+          f"{'speedup':>8}")
+    for channels in (8, 16, 64):
+        separate, multi_channel = run(channels, values, runs)
+        print(f"{channels:>8}  {separate:>12.2f}  {multi_channel:>9.2f}  "
+              f"{separate / multi_channel:>8.2f}")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,77 @@
+"""Benchmark of the scaling of the :class:`.IORegistry` with the amount of
+blocks.
+
+Builds chains of pass-through blocks and measures connecting them, accessing
+the data of the inputs and enumerating the blocks. The time per operation
+should stay constant with the amount of blocks.
+
+Usage:
+    python benchmarks/registry_scaling.py [max_blocks]
+"""
+import sys
+import time
+
+from mca.framework import Block, io_registry
+
+
+class PassBlock(Block):
+    """Block which passes its input to its output."""
+    name = "Pass"
+
+    def setup_io(self):
+        self.new_input()
+        self.new_output()
+
+    def setup_parameters(self):
+        pass
+
+    def process(self):
+        self.outputs[0].data = self.inputs[0].data
+
+
+def measure(function, repeat=1):
+    """Returns the time of a single call of the function in µs."""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        function()
+    return (time.perf_counter() - start) / repeat * 1e6
+
+
+def run(count):
+    """Measures the operations for a registry with the amount of blocks.
+
+    Returns:
+        tuple: Time per connect, per input data access and per enumerated
+               block in µs.
+    """
+    registry = io_registry.IORegistry(lazy=True)
+    with registry.activate():
+        blocks = [PassBlock() for _ in range(count)]
+    start = time.perf_counter()
+    with registry.batch():
+        for previous, block in zip(blocks, blocks[1:]):
+            block.inputs[0].connect(previous.outputs[0])
+    connect = (time.perf_counter() - start) / (count - 1) * 1e6
+    inputs = [block.inputs[0] for block in blocks[1:]]
+
+    def access():
+        for input_ in inputs:
+            input_.connected_output
+    data = measure(access, 10) / len(inputs)
+    enumerate_ = measure(registry.get_all_blocks, 3) / count
+    return connect, data, enumerate_
+
+
+def main(max_blocks=10000):
+    print(f"{'blocks':>8}  {'connect µs':>11}  {'data µs':>9}  "
+          f"{'enumerate µs/block':>19}")
+    for count in (1000, 2000, 5000, 10000, 20000, 50000, 100000):
+        if count > max_blocks:
+            break
+        connect, data, enumerate_ = run(count)
+        print(f"{count:>8}  {connect:>11.2f}  {data:>9.3f}  "
+              f"{enumerate_:>19.3f}")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,96 @@
+"""Benchmark of the memory used by a chain of blocks processing a long
+signal at once and in chunks with a :class:`.StreamPlan`.
+
+The chain consists of an Amplifier, an IIR Filter, an Integrator and a
+Differentiator. Measures the peak of the allocated memory while processing
+for different signal lengths. The source signal itself is not counted.
+
+Usage:
+    python benchmarks/streaming.py [chunk_values]
+"""
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+from mca import blocks
+from mca.framework import Block, data_types, io_registry, streaming
+
+
+class SourceBlock(Block):
+    """Block which outputs the signal assigned to it."""
+    name = "Source"
+    signal = None
+
+    def setup_io(self):
+        self.new_output()
+
+    def setup_parameters(self):
+        pass
+
+    def process(self):
+        self.outputs[0].data = self.signal
+
+
+def chain():
+    """Creates the source and the chain of blocks in a new registry."""
+    registry = io_registry.IORegistry()
+    with registry.activate():
+        source = SourceBlock()
+        chain_blocks = [blocks.Amplifier(multiplier={"factor": 0.5}),
+                        blocks.IRRFilter(cut_off=10, order=4),
+                        blocks.Integrator(),
+                        blocks.Differentiator()]
+    for previous, block in zip([source] + chain_blocks, chain_blocks):
+        block.inputs[0].connect(previous.outputs[0])
+    chain_blocks[-1].outputs[0].pinned = True
+    return registry, source, chain_blocks[-1]
+
+
+def measure(function):
+    """Returns the peak MiB allocated by the function and its time in s."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    function()
+    duration = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak / 2 ** 20, duration
+
+
+def run(signal, chunk_values):
+    """Processes the signal at once and in chunks.
+
+    Returns:
+        tuple: Peak MiB and time in s of the processing at once and in
+               chunks.
+    """
+    registry, source, sink = chain()
+    source.signal = signal
+    whole = measure(source.trigger_update)
+    registry, source, sink = chain()
+    plan = registry.compile_stream(feeds=[source.outputs[0]],
+                                   outputs=[sink.outputs[0]])
+
+    def stream():
+        for _ in plan.run({source.outputs[0]: chunk} for chunk in
+                          streaming.iter_chunks(signal, chunk_values)):
+            pass
+    return whole + measure(stream)
+
+
+def main(chunk_values=65536):
+    print(f"{'values':>9}  {'whole MiB':>10}  {'whole s':>8}  "
+          f"{'stream MiB':>11}  {'stream s':>9}")
+    for values in (2 ** 20, 4 * 2 ** 20, 16 * 2 ** 20):
+        ordinate = np.random.default_rng(0).standard_normal(values)
+        signal = data_types.Signal(0, values, 1 / 48000, ordinate)
+        whole_peak, whole_time, stream_peak, stream_time = run(
+            signal, chunk_values)
+        print(f"{values:>9}  {whole_peak:>10.1f}  {whole_time:>8.2f}  "
+              f"{stream_peak:>11.1f}  {stream_time:>9.2f}")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,385 @@
+"""Headless batch processing of block structures.
+
+``mca run`` executes a block structure saved by the GUI for many input
+files without importing Qt. The structure is loaded once per worker
+process, interactive blocks (see :attr:`.Block.interactive`) like plots are
+left out. Each job overrides parameters of the structure, loads the files
+of the loader blocks and writes the results with the saver blocks.
+
+Parameters are addressed by the name of the block and the key of the
+parameter, e.g. ``"Amplifier.multiplier.factor"``. The name of a loader
+or saver block alone addresses the path of its file.
+
+Example:
+    .. code-block:: none
+
+        mca run structure.json recordings/*.wav --input "Audio Loader" \\
+            --output "Audio Saver=results/{stem}.wav" \\
+            --set "Amplifier.multiplier.factor=2" --jobs 4
+
+A manifest is a json file with parameters applied to all jobs and a list of
+jobs, which map parameters to their values:
+
+.. code-block:: json
+
+    {"parameters": {"Amplifier.multiplier.factor": 2},
+     "jobs": [{"Audio Loader": "a.wav", "Audio Saver": "results/a.wav"},
+              {"Audio Loader": "b.wav", "Audio Saver": "results/b.wav"}]}
+"""
+import argparse
+import concurrent.futures
+import json
+import os
+import sys
+
+from mca import blocks, exceptions
+from mca.framework import data_types, io_registry, load, parameters
+
+
+def headless_structure(structure):
+    """Removes the interactive blocks from a block structure.
+
+    Args:
+        structure (dict): Block structure as saved by
+                          :func:`.save.blocks_to_json`.
+
+    Returns:
+        dict: Block structure without interactive blocks.
+    """
+    structure = dict(structure)
+    structure["blocks"] = [
+        block_save for block_save in structure["blocks"]
+        if not blocks.catalog.get(block_save["class"]).load().interactive]
+    return structure
+
+
+def loader_names(structure):
+    """Returns the names of the blocks which load data from files.
+
+    Args:
+        structure (dict): Block structure as saved by
+                          :func:`.save.blocks_to_json`.
+    """
+    return [block_save["parameters"]["name"]
+            for block_save in structure["blocks"]
+            if "Loading" in blocks.catalog.get(block_save["class"]).tags]
+
+
+def _path_parameter(block):
+    """Returns the PathParameter of a block or None."""
+    for parameter in block.parameters.values():
+        if isinstance(parameter, parameters.PathParameter):
+            return parameter
+    return None
+
+
+def _run_actions(block):
+    """Runs the actions of a block, which load or save its file."""
+    for parameter in block.parameters.values():
+        if isinstance(parameter, parameters.ActionParameter):
+            parameter.function()
+
+
+class BatchRunner:
+    """Runs jobs on a block structure which is loaded once. The registry of
+    the blocks is lazy (see :attr:`.IORegistry.lazy`), so the blocks are
+    only processed when the savers request their results.
+
+    Attributes:
+        registry (:class:`.IORegistry`): Registry of the blocks.
+        blocks (list): Blocks of the structure.
+    """
+
+    def __init__(self, structure, dtype_policy=None):
+        """Initializes BatchRunner.
+
+        Args:
+            structure (dict): Block structure as saved by
+                              :func:`.save.blocks_to_json`.
+            dtype_policy (str): Dtype policy of the registry (see
+                                :attr:`.IORegistry.dtype_policy`).
+        """
+        self.registry = io_registry.IORegistry(lazy=True,
+                                               dtype_policy=dtype_policy)
+        with self.registry.activate():
+            self.blocks = load.json_to_blocks(
+                json.dumps(headless_structure(structure)))
+
+    def parameter(self, key):
+        """Returns the parameter addressed by the key.
+
+        Args:
+            key (str): Name of the block and the keys of the parameter and
+                       sub parameter separated by dots. The name of the
+                       block alone addresses the path of its file.
+
+        Raises:
+            :class:`.BatchError`: If the key addresses no parameter.
+        """
+        matches = [block for block in self.blocks
+                   if key == block.parameters["name"].value
+                   or key.startswith(block.parameters["name"].value + ".")]
+        if not matches:
+            raise exceptions.BatchError(f"No block found for '{key}'")
+        # Prefer the longest name in case block names contain dots
+        length = max(len(block.parameters["name"].value) for block in matches)
+        matches = [block for block in matches
+                   if len(block.parameters["name"].value) == length]
+        if len(matches) > 1:
+            raise exceptions.BatchError(
+                f"Multiple blocks are named '{key[:length]}'")
+        block = matches[0]
+        path = key[length + 1:].split(".") if key[length:] else []
+        if not path:
+            parameter = _path_parameter(block)
+            if parameter is None:
+                raise exceptions.BatchError(
+                    f"'{key}' has no file to load or save")
+            return parameter
+        parameter = block.parameters.get(path[0])
+        for sub_key in path[1:]:
+            if not isinstance(parameter, parameters.ParameterBlock):
+                break
+            parameter = parameter.parameters.get(sub_key)
+        else:
+            if parameter is not None:
+                return parameter
+        raise exceptions.BatchError(f"No parameter found for '{key}'")
+
+    def _owner(self, parameter):
+        """Returns the block a parameter belongs to."""
+        for block in self.blocks:
+            for candidate in block.parameters.values():
+                if candidate is parameter or (
+                        isinstance(candidate, parameters.ParameterBlock) and
+                        parameter in candidate.parameters.values()):
+                    return block
+
+    def run(self, job):
+        """Applies the parameters of the job, loads the files of the loaders
+        and saves the results with the savers. The parameters are reset
+        afterwards.
+
+        Args:
+            job (dict): Maps the keys of parameters (see
+                        :meth:`.parameter`) to their values.
+
+        Returns:
+            list: Paths of the files which have been saved.
+        """
+        previous = {}
+        try:
+            for key, value in job.items():
+                parameter = self.parameter(key)
+                previous.setdefault(parameter, parameter.value)
+                parameter.value = value
+            with self.registry.batch():
+                for parameter in previous:
+                    self._owner(parameter).trigger_update()
+                for block in self.blocks:
+                    path = _path_parameter(block)
+                    if path is not None and path.loading and path.value:
+                        _run_actions(block)
+                        block.trigger_update()
+            saved = []
+            for block in self.blocks:
+                path = _path_parameter(block)
+                if path is not None and not path.loading and path.value:
+                    directory = os.path.dirname(path.value)
+                    if directory:
+                        os.makedirs(directory, exist_ok=True)
+                    _run_actions(block)
+                    saved.append(path.value)
+            return saved
+        finally:
+            with self.registry.batch():
+                for parameter, value in previous.items():
+                    parameter.value = value
+                    self._owner(parameter).trigger_update()
+
+
+# Runner of the current worker process
+_runner = None
+
+
+def _init_worker(structure, dtype_policy):
+    """Loads the block structure in a worker process."""
+    global _runner
+    _runner = BatchRunner(structure, dtype_policy)
+
+
+def _run_job(job):
+    """Runs a job in a worker process."""
+    return _runner.run(job)
+
+
+def run_jobs(structure, jobs, workers=None, dtype_policy=None):
+    """Runs the jobs on the block structure in worker processes.
+
+    Args:
+        structure (dict): Block structure as saved by
+                          :func:`.save.blocks_to_json`.
+        jobs (list): Dict for each job, see :meth:`.BatchRunner.run`.
+        workers (int): Amount of worker processes. Defaults to the amount
+                       of CPUs. With a single worker or job, the jobs run in
+                       the current process.
+        dtype_policy (str): Dtype policy of the registries (see
+                            :attr:`.IORegistry.dtype_policy`).
+
+    Returns:
+        list: :class:`concurrent.futures.Future` of each job in the given
+              order. Their result are the paths of the saved files.
+    """
+    if workers == 1 or len(jobs) <= 1:
+        runner = BatchRunner(structure, dtype_policy)
+        futures = []
+        for job in jobs:
+            future = concurrent.futures.Future()
+            try:
+                future.set_result(runner.run(job))
+            except Exception as error:
+                future.set_exception(error)
+            futures.append(future)
+        return futures
+    pool = concurrent.futures.ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_worker,
+        initargs=(structure, dtype_policy))
+    with pool:
+        futures = [pool.submit(_run_job, job) for job in jobs]
+        concurrent.futures.wait(futures)
+    return futures
+
+
+def _parse_value(value):
+    """Parses a value given on the command line as json, values which are
+    no json are kept as string.
+    """
+    try:
+        return json.loads(value)
+    except ValueError:
+        return value
+
+
+def _split(argument, parser):
+    """Splits a KEY=VALUE argument."""
+    key, separator, value = argument.partition("=")
+    if not separator:
+        parser.error(f"'{argument}' is not of the form KEY=VALUE")
+    return key, value
+
+
+def make_jobs(structure, files=(), input_name=None, outputs=(),
+              manifest=None, overrides=None):
+    """Creates the jobs of a batch run.
+
+    Args:
+        structure (dict): Block structure as saved by
+                          :func:`.save.blocks_to_json`.
+        files: Input files. Each file creates a job which loads it with the
+               loader block.
+        input_name (str): Name of the loader block. Defaults to the only
+                          loader of the structure.
+        outputs: Tuples of the name of a saver block and a template of its
+                 path for each input file. The fields {stem}, {name} and
+                 {index} are replaced by the stem, the name and the index of
+                 the input file.
+        manifest (dict): Manifest with the keys "parameters" and "jobs".
+        overrides (dict): Parameters applied to all jobs.
+
+    Returns:
+        list: Dict for each job, see :meth:`.BatchRunner.run`.
+    """
+    manifest = manifest or {}
+    common = dict(manifest.get("parameters", {}))
+    common.update(overrides or {})
+    jobs = [dict(common, **job) for job in manifest.get("jobs", [])]
+    if files:
+        if input_name is None:
+            names = loader_names(structure)
+            if len(names) != 1:
+                raise exceptions.BatchError(
+                    "The loader has to be given with --input")
+            input_name = names[0]
+        for index, file in enumerate(files):
+            job = dict(common)
+            job[input_name] = file
+            fields = {"stem": os.path.splitext(os.path.basename(file))[0],
+                      "name": os.path.basename(file), "index": index}
+            for name, template in outputs:
+                job[name] = template.format(**fields)
+            jobs.append(job)
+    if not jobs:
+        jobs.append(common)
+    return jobs
+
+
+def main(argv=None):
+    """Command line interface of ``mca run``.
+
+    Args:
+        argv (list): Arguments after the subcommand. Defaults to the
+                     arguments of the process.
+
+    Returns:
+        int: Exit code, 1 if any job failed.
+    """
+    parser = argparse.ArgumentParser(
+        prog="mca run",
+        description="Runs a block structure without GUI for input files.")
+    parser.add_argument("structure", help="Block structure file.")
+    parser.add_argument("files", nargs="*",
+                        help="Input files, each one is loaded by the loader "
+                             "block in a separate job.")
+    parser.add_argument("-i", "--input", dest="input_name",
+                        help="Name of the loader block of the input files.")
+    parser.add_argument("-o", "--output", action="append", default=[],
+                        metavar="SAVER=TEMPLATE",
+                        help="Path of the file a saver block writes for "
+                             "each input file. {stem}, {name} and {index} "
+                             "are replaced by the input file.")
+    parser.add_argument("-s", "--set", action="append", default=[],
+                        dest="overrides", metavar="PARAMETER=VALUE",
+                        help="Overrides a parameter, e.g. "
+                             "'Amplifier.multiplier.factor=2'. Values are "
+                             "parsed as json if possible.")
+    parser.add_argument("-m", "--manifest",
+                        help="Json file with parameters and jobs.")
+    parser.add_argument("-j", "--jobs", type=int, default=None,
+                        help="Amount of worker processes. Defaults to the "
+                             "amount of CPUs.")
+    parser.add_argument("-d", "--dtype-policy",
+                        choices=[policy for policy in data_types.DTYPE_POLICIES
+                                 if policy is not None],
+                        help="Dtype of the processed signals. 'preserve' "
+                             "keeps the dtype of the loaded data, e.g. "
+                             "int16 audio, instead of widening it to "
+                             "float64.")
+    args = parser.parse_args(argv)
+
+    with open(args.structure) as structure_file:
+        structure = json.load(structure_file)
+    manifest = None
+    if args.manifest:
+        with open(args.manifest) as manifest_file:
+            manifest = json.load(manifest_file)
+    overrides = {}
+    for argument in args.overrides:
+        key, value = _split(argument, parser)
+        overrides[key] = _parse_value(value)
+    outputs = [_split(argument, parser) for argument in args.output]
+    try:
+        jobs = make_jobs(structure, args.files, args.input_name, outputs,
+                         manifest, overrides)
+    except exceptions.BatchError as error:
+        parser.error(str(error))
+
+    failed = 0
+    futures = run_jobs(structure, jobs, args.jobs, args.dtype_policy)
+    for index, future in enumerate(futures):
+        error = future.exception()
+        if error is None:
+            print(f"Job {index}: saved {', '.join(future.result()) or '-'}")
+        else:
+            failed += 1
+            print(f"Job {index}: {error!r}", file=sys.stderr)
+    return 1 if failed else 0
@@ -1,70 +1,132 @@
-import inspect
-import sys
+"""Blocks of the Multi Channel Analyzer.
 
-from .absolute import Absolute
-from .acf import AutoCorrelation
-from .adder import Adder
-from .amplifier import Amplifier
-from .analytical_signal import AnalyticalSignal
-from .audio_loader import AudioLoader
-from .audio_player import AudioPlayer
-from .audio_recorder import AudioRecorder
-from .audio_saver import AudioSaver
-from .ccf import CrossCorrelation
-from .chirp import Chirp
-from .complex_plot import ComplexPlot
-from .complex_to_real import ComplexToReal
-from .convolution import Convolution
-from .cps import CrossPowerSpectrum
-from .cutter import Cutter
-from .dc_generator import DCGenerator
-from .differentiator import Differentiator
-from .divider import Divider
-from .down_sample import DownSample
-from .envelope import Envelope
-from .fft import FFT
-from .fftplot import FFTPlot
-from .fft_shift import FFTShift
-from .gausspulse import GaussPulse
-from .histogramm import Histogramm
-# from .hs_oscilloscope import HSOscilloscope
-from .iir_filter import IRRFilter
-from .impulse import Impulse
-from .integrator import Integrator
-from .interpolate import Interpolate
-from .limiter import Limiter
-from .multiplier import Multiplier
-from .normalization import Normalization
-from .plot import Plot
-from .polynom_function_generator import PolynomGenerator
-from .power_spectrum import PowerSpectrum
-from .quantization import Quantization
-from .real_to_complex import RealToComplex
-from .resample import Resample
-from .signal_loader import SignalLoader
-from .signal_generator import SignalGenerator
-from .signal_generator_periodic import SignalGeneratorPeriodic
-from .signal_generator_stochastic import SignalGeneratorStochastic
-from .signal_saver import SignalSaver
-from .stft_plot import STFTPlot
-from .window import Window
-from .xy_plot import XYPlot
-from .zerofill import Zerofill
+The blocks are described by the :data:`catalog` (see
+:mod:`mca.framework.catalog`), which also contains the blocks of other
+packages. The block modules are imported when their block is first
+accessed or instantiated, so importing the package does not import the
+dependencies of all blocks, e.g. scipy.signal. Accessing
+:data:`block_classes` or :data:`tag_dict` imports all blocks.
+"""
+from mca.framework.catalog import BlockEntry, Catalog
 
-# Create list of all blocks
-block_classes = [i[1] for i in inspect.getmembers(sys.modules[__name__],
-                                                  inspect.isclass)]
-block_classes.sort(key=lambda x: x.name)
+# Entries of the built-in blocks
+_builtin = [
+    BlockEntry("mca.blocks.absolute:Absolute", "Absolute", ("Processing",)),
+    BlockEntry("mca.blocks.acf:AutoCorrelation",
+               "Autocorrelation", ("Processing",)),
+    BlockEntry("mca.blocks.adder:Adder", "Adder", ("Processing",)),
+    BlockEntry("mca.blocks.amplifier:Amplifier", "Amplifier", ("Processing",)),
+    BlockEntry("mca.blocks.analytical_signal:AnalyticalSignal",
+               "Analytical Signal", ("Processing",)),
+    BlockEntry("mca.blocks.audio_loader:AudioLoader",
+               "Audio Loader", ("Loading", "Audio")),
+    BlockEntry("mca.blocks.audio_player:AudioPlayer",
+               "Audio Player", ("Audio",)),
+    BlockEntry("mca.blocks.audio_recorder:AudioRecorder",
+               "Audio Recorder", ("Audio",)),
+    BlockEntry("mca.blocks.audio_saver:AudioSaver",
+               "Audio Saver", ("Saving", "Audio")),
+    BlockEntry("mca.blocks.ccf:CrossCorrelation",
+               "Crosscorrelation", ("Processing",)),
+    BlockEntry("mca.blocks.channel_merger:ChannelMerger",
+               "Channel Merger", ("Processing",)),
+    BlockEntry("mca.blocks.channel_selector:ChannelSelector",
+               "Channel Selector", ("Processing",)),
+    BlockEntry("mca.blocks.chirp:Chirp", "Chirp", ("Generating",)),
+    BlockEntry("mca.blocks.complex_plot:ComplexPlot",
+               "Complex Plot", ("Plotting",)),
+    BlockEntry("mca.blocks.complex_to_real:ComplexToReal",
+               "Complex-Real", ("Processing",)),
+    BlockEntry("mca.blocks.convolution:Convolution",
+               "Convolution", ("Processing",)),
+    BlockEntry("mca.blocks.cps:CrossPowerSpectrum",
+               "Cross Power Spectrum", ("Processing",)),
+    BlockEntry("mca.blocks.cutter:Cutter", "Cutter", ("Processing",)),
+    BlockEntry("mca.blocks.dc_generator:DCGenerator",
+               "Signal Generator (DC)", ("Generating",)),
+    BlockEntry("mca.blocks.differentiator:Differentiator",
+               "Differentiator", ("Processing",)),
+    BlockEntry("mca.blocks.divider:Divider", "Divider", ("Processing",)),
+    BlockEntry("mca.blocks.down_sample:DownSample",
+               "Downsample", ("Processing",)),
+    BlockEntry("mca.blocks.envelope:Envelope", "Envelope", ("Processing",)),
+    BlockEntry("mca.blocks.fft:FFT",
+               "FFT", ("Processing", "Fouriertransformation")),
+    BlockEntry("mca.blocks.fftplot:FFTPlot",
+               "FFT Plot",
+               ("Processing", "Fouriertransformation", "Plotting")),
+    BlockEntry("mca.blocks.fft_shift:FFTShift",
+               "FFT Shift", ("Processing", "Fouriertransformation")),
+    BlockEntry("mca.blocks.gausspulse:GaussPulse",
+               "Gauss Pulse", ("Generating",)),
+    BlockEntry("mca.blocks.histogramm:Histogramm",
+               "Histogramm", ("Plotting",)),
+    # BlockEntry("mca.blocks.hs_oscilloscope:HSOscilloscope",
+    #            "HS Oscilloscope", ("Generating",)),
+    BlockEntry("mca.blocks.iir_filter:IRRFilter",
+               "IIR Filter", ("Processing",)),
+    BlockEntry("mca.blocks.impulse:Impulse", "Impulse", ("Generating",)),
+    BlockEntry("mca.blocks.integrator:Integrator",
+               "Integrator", ("Processing",)),
+    BlockEntry("mca.blocks.interpolate:Interpolate",
+               "Interpolate", ("Processing",)),
+    BlockEntry("mca.blocks.limiter:Limiter", "Limiter", ("Processing",)),
+    BlockEntry("mca.blocks.multiplier:Multiplier",
+               "Multiplier", ("Processing",)),
+    BlockEntry("mca.blocks.normalization:Normalization",
+               "Normalization", ("Processing",)),
+    BlockEntry("mca.blocks.plot:Plot", "Plot", ("Plotting",)),
+    BlockEntry("mca.blocks.polynom_function_generator:PolynomGenerator",
+               "Signal Generator (Polynom)", ("Generating",)),
+    BlockEntry("mca.blocks.power_spectrum:PowerSpectrum",
+               "Power Spectrum", ("Processing",)),
+    BlockEntry("mca.blocks.quantization:Quantization",
+               "Quantization", ("Processing",)),
+    BlockEntry("mca.blocks.real_to_complex:RealToComplex",
+               "Real-Complex", ("Processing",)),
+    BlockEntry("mca.blocks.resample:Resample", "Resample", ("Processing",)),
+    BlockEntry("mca.blocks.signal_loader:SignalLoader",
+               "Signal Loader", ("Generating", "Loading")),
+    BlockEntry("mca.blocks.signal_generator:SignalGenerator",
+               "Signal Generator", ("Generating",)),
+    BlockEntry("mca.blocks.signal_generator_periodic:SignalGeneratorPeriodic",
+               "Signal Generator (Periodic)", ("Generating",)),
+    BlockEntry("mca.blocks.signal_generator_stochastic:SignalGeneratorStochastic",
+               "Signal Generator (Stochastic)", ("Generating", "Stochastic")),
+    BlockEntry("mca.blocks.signal_saver:SignalSaver",
+               "Signal Saver", ("Saving",)),
+    BlockEntry("mca.blocks.stft_plot:STFTPlot",
+               "STFT Plot", ("Plotting", "Fouriertransformation")),
+    BlockEntry("mca.blocks.window:Window", "Window", ("Processing",)),
+    BlockEntry("mca.blocks.xy_plot:XYPlot", "XY Plot", ("Plotting",)),
+    BlockEntry("mca.blocks.zerofill:Zerofill", "Zerofill", ("Processing",)),
+]
 
-tags = set()
+catalog = Catalog(_builtin)
 
-# Extract all tags
-for block_class in block_classes:
-    tags.update(block_class.tags)
+# Maps the class names of the built-in blocks to their entries
+_builtin_entries = {entry.path.split(":")[1]: entry for entry in _builtin}
 
-tags = list(tags)
-tags.sort()
+__all__ = list(_builtin_entries) + ["catalog", "block_classes", "tags",
+                                    "tag_dict"]
 
-# Map tags to a list of blocks possessing the according tag
-tag_dict = {tag: [block_class for block_class in block_classes
-                  if tag in block_class.tags] for tag in tags}
+
+def __getattr__(name):
+    if name in _builtin_entries:
+        block_class = _builtin_entries[name].load()
+        globals()[name] = block_class
+        return block_class
+    if name == "block_classes":
+        # Create list of all blocks
+        return [entry.load() for entry in catalog.entries]
+    if name == "tags":
+        return catalog.tags
+    if name == "tag_dict":
+        # Map tags to a list of blocks possessing the according tag
+        return {tag: [entry.load() for entry in entries]
+                for tag, entries in catalog.tag_dict.items()}
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -6,6 +6,8 @@ class Absolute(Block):
     name = "Absolute"
     description = "Computes the absolute of the input signal."
     tags = ("Processing",)
+    process_safe = True
+    streamable = True
 
     def setup_io(self):
         self.new_output()
@@ -10,6 +10,7 @@ class AutoCorrelation(Block):
         "signal. The auto correlation measures a signals similarity to a "
         "time-shifted version of itself.")
     tags = ("Processing",)
+    process_safe = True
     references = {"numpy.correlate":
         "https://numpy.org/doc/1.25/reference/generated/numpy.correlate.html"}
 
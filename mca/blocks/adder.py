@@ -1,8 +1,7 @@
-import copy
-
 import numpy as np
 
-from mca.framework import DynamicBlock, data_types, util
+from mca.framework import DynamicBlock, data_types, streaming, util, \
+    validator
 
 
 class Adder(DynamicBlock):
@@ -10,6 +9,9 @@ class Adder(DynamicBlock):
     name = "Adder"
     description = "Adds multiple signals to one signal."
     tags = ("Processing",)
+    process_safe = True
+    multi_channel = True
+    streamable = True
 
     def setup_io(self):
         self.dynamic_input = (1, None)
@@ -26,18 +28,72 @@ class Adder(DynamicBlock):
     @util.validate_intervals
     def process(self):
         # Read the input data
-        signals = [copy.copy(i.data) for i in self.inputs if i.data]
+        signals = [i.data for i in self.inputs if i.data]
+        self.outputs[0].data = self._add(signals)
+        # Apply metadata from the input to the output
+        self.outputs[0].process_metadata = self.inputs[0].metadata
+
+    def _add(self, signals):
+        """Returns the sum of the signals."""
+        validator.check_channels(signals)
         # Fill the signals with zeros so their lengths match
         modified_signals = util.fill_zeros(signals)
-        # Calculate the ordinate
-        ordinate = np.zeros(modified_signals[0].values)
+        # Calculate the ordinate, single channel signals are added to all
+        # channels of multi-channel signals
+        dtype = np.float64
+        if self.registry.dtype_policy is not None:
+            dtype = data_types.working_dtype(
+                np.result_type(*(sgn.ordinate for sgn in modified_signals)),
+                self.registry.dtype_policy)
+        ordinate = np.zeros(np.broadcast_shapes(
+            *(sgn.ordinate.shape for sgn in modified_signals)), dtype=dtype)
         for sgn in modified_signals:
             ordinate += sgn.ordinate
-        # Apply new signal to the output
-        self.outputs[0].data = data_types.Signal(
-            abscissa_start=modified_signals[0].abscissa_start,
-            values=modified_signals[0].values,
-            increment=modified_signals[0].increment,
-            ordinate=ordinate)
+        # The sum is multi-channel if any input is multi-channel
+        template = max(modified_signals, key=lambda sgn: sgn.ordinate.ndim)
+        return template.replace(ordinate=ordinate)
+
+    def start_stream(self):
+        # Values of each input which have not been added yet
+        self._pending = {}
+
+    @util.validate_type_signal
+    @util.validate_units(abscissa=True, ordinate=True)
+    @util.validate_intervals
+    def process_chunk(self):
+        self._take_chunks()
+        # The chunks of the inputs may cover different ranges, only the
+        # range which all inputs have reached is added
+        connected = [input_ for input_ in self.inputs
+                     if input_.connected_output is not None]
+        if any(self._pending.get(input_) is None for input_ in connected):
+            self.outputs[0].data = None
+            return
+        end = min(signal.abscissa_start + signal.values * signal.increment
+                  for signal in self._pending.values())
+        signals = []
+        for input_, signal in self._pending.items():
+            head, tail = streaming.split(signal, round(
+                (end - signal.abscissa_start) / signal.increment))
+            if head.values:
+                signals.append(head)
+            self._pending[input_] = tail
+        self.outputs[0].data = self._add(signals) if signals else None
+        # Apply metadata from the input to the output
+        self.outputs[0].process_metadata = self.inputs[0].metadata
+
+    def finish_stream(self):
+        self._take_chunks()
+        signals = [signal for signal in self._pending.values()
+                   if signal.values]
+        self._pending = {}
+        self.outputs[0].data = self._add(signals) if signals else None
         # Apply metadata from the input to the output
         self.outputs[0].process_metadata = self.inputs[0].metadata
+
+    def _take_chunks(self):
+        """Appends the chunks of the inputs to their pending values."""
+        for input_ in self.inputs:
+            if input_.data is not None:
+                self._pending[input_] = streaming.concatenate(
+                    [self._pending.get(input_), input_.data])
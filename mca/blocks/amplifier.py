@@ -1,6 +1,6 @@
 import numpy as np
 
-from mca.framework import Block, data_types, parameters, util
+from mca.framework import Block, parameters, util
 
 
 class Amplifier(Block):
@@ -8,6 +8,9 @@ class Amplifier(Block):
     name = "Amplifier"
     description = "Amplifies the input signal by the desired factor."
     tags = ("Processing",)
+    process_safe = True
+    multi_channel = True
+    streamable = True
 
     def setup_io(self):
         self.new_output()
@@ -51,11 +54,6 @@ class Amplifier(Block):
         # Calculate the ordinate
         ordinate = amplification * input_signal.ordinate
         # Apply new signal to the output
-        self.outputs[0].data = data_types.Signal(
-            abscissa_start=input_signal.abscissa_start,
-            values=input_signal.values,
-            increment=input_signal.increment,
-            ordinate=ordinate,
-        )
+        self.outputs[0].data = input_signal.replace(ordinate=ordinate)
         # Apply metadata from the input to the output
         self.outputs[0].process_metadata = self.inputs[0].metadata
@@ -8,6 +8,7 @@ class AnalyticalSignal(Block):
     name = "Analytical Signal"
     description = "Computes the analytical signal of the input signal using the Hilbert transform."
     tags = ("Processing",)
+    process_safe = True
     references = {"scipy.signal.hilbert":
         "https://docs.scipy.org/doc/scipy/reference/generated/scipy.signal.hilbert.html"}
 
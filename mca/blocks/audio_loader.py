@@ -1,10 +1,8 @@
-import copy
-
 import numpy as np
 import scipy.io.wavfile
 
 from mca import exceptions
-from mca.framework import Block, data_types, parameters
+from mca.framework import Block, cache, data_types, parameters
 
 
 class AudioLoader(Block):
@@ -17,6 +15,7 @@ class AudioLoader(Block):
     description = ("Loads a .wav to create an output signal. Minimum and maximum"
                 " value depend on the .wav format provided (see reference)")
     tags = ("Loading", "Audio")
+    cacheable = False
     references = {"scipy.io.wavfile.read":
         "https://docs.scipy.org/doc/scipy/reference/generated/scipy.io.wavfile.read.html"}
 
@@ -35,6 +34,13 @@ class AudioLoader(Block):
             name="Normalize", default=True,
             description="Normalize the signal by dividing by the absolute maximum value"
         )
+        self.parameters["memory_map"] = parameters.BoolParameter(
+            name="Memory-mapped", default=True,
+            description="Map the file into memory instead of reading it, "
+                        "only the parts of the file which are processed "
+                        "are read. Normalizing reads the whole file, so "
+                        "the file is only mapped without normalizing."
+        )
 
     def process(self):
         pass
@@ -44,6 +50,7 @@ class AudioLoader(Block):
         # Read out the parameters
         filename = self.parameters["file_name"].value
         normalize = self.parameters["normalize"].value
+        memory_map = self.parameters["memory_map"].value
         # If no file is given set the output to None
         if not filename:
             for output in self.outputs:
@@ -55,13 +62,16 @@ class AudioLoader(Block):
             raise exceptions.DataLoadingError("File has to be a .wav")
         # Read wave file and raise custom error when FileNotFound error is raised
         try:
-            rate, data = scipy.io.wavfile.read(filename)
+            rate, data = self._read(filename, memory_map)
         except FileNotFoundError:
             raise exceptions.DataLoadingError("File not found")
         # Normalize the data
         if normalize:
-            data = data / np.max(np.abs(data))
-            
+            peak = _peak(data)
+            data = data.astype(data_types.working_dtype(
+                data.dtype, self.registry.dtype_policy))
+            data /= peak
+
         values = data.shape[0]
         if len(data.shape) == 2:
             data = np.swapaxes(data, 0, 1)
@@ -69,7 +79,7 @@ class AudioLoader(Block):
             right = data[1]
         else:
             left = data
-            right = copy.copy(data)
+            right = data
             
         # Apply new signal to the output
         self.outputs[0].data = data_types.Signal(
@@ -82,5 +92,34 @@ class AudioLoader(Block):
             values=values,
             increment=1 / rate,
             ordinate=right)
+        # The file identifies the data, so it does not have to be hashed
+        for channel, output in enumerate(self.outputs):
+            output.fingerprint = cache.file_fingerprint(
+                filename, cache.parameters_fingerprint(self), channel)
         # Trigger an update manually since this is not executed within process
         self.trigger_update()
+
+    @staticmethod
+    def _read(filename, memory_map):
+        """Reads the sampling rate and the data of a .wav file. The data is
+        memory-mapped if possible.
+        """
+        if memory_map:
+            try:
+                return scipy.io.wavfile.read(filename, mmap=True)
+            except ValueError:
+                # Formats like 24 bit integers cannot be mapped
+                pass
+        return scipy.io.wavfile.read(filename)
+
+
+def _peak(data, values=2 ** 20):
+    """Returns the absolute maximum of the data. The data is read in blocks of
+    values, so memory-mapped data is not read into memory at once.
+    """
+    peak = 0
+    for start in range(0, data.shape[0], values):
+        block = data[start:start + values]
+        # Python integers do not overflow for the minimum of integer types
+        peak = max(peak, abs(block.max().item()), abs(block.min().item()))
+    return peak
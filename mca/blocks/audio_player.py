@@ -1,5 +1,4 @@
 import numpy as np
-import sounddevice as sd
 from united import Unit
 
 from mca.framework import Block, parameters, util, validator
@@ -16,6 +15,8 @@ class AudioPlayer(Block):
     description = ("Plays the input signal as a sound by using the current "
                    "default sound device.")
     tags = ("Audio",)
+    side_effects = True
+    interactive = True
 
     def setup_io(self):
         self.new_input()
@@ -71,5 +72,7 @@ class AudioPlayer(Block):
                 sampling_frequency = 1/self.inputs[0].data.increment
             elif self.inputs[1].data:
                 sampling_frequency = 1 / self.inputs[1].data.increment
-        # Play the input signal as sound through the default sound device
+        # Play the input signal as sound through the default sound device,
+        # sounddevice is only imported when it is needed
+        import sounddevice as sd
         sd.play(data, sampling_frequency)
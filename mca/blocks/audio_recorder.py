@@ -1,5 +1,3 @@
-import sounddevice as sd
-
 from mca.framework import Block, data_types, parameters
 
 
@@ -8,6 +6,8 @@ class AudioRecorder(Block):
     name = "Audio Recorder"
     description = "Records a sound via the default audio input device."
     tags = ("Audio",)
+    cacheable = False
+    interactive = True
 
     def setup_io(self):
         self.new_output(user_metadata_required=True)
@@ -38,7 +38,9 @@ class AudioRecorder(Block):
         record_time = self.parameters["record_time"].value
         # Calculate the amount of frames needed
         frames = int(sampling_frequency * record_time)
-        # Record the audio from the default audio device
+        # Record the audio from the default audio device, sounddevice is
+        # only imported when it is needed
+        import sounddevice as sd
         recording = sd.rec(frames=frames, samplerate=sampling_frequency,
                            channels=1).reshape(frames)
         # Blocking call until the recording is finished
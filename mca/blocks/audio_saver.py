@@ -1,3 +1,6 @@
+import os
+import uuid
+
 import scipy.io.wavfile
 from united import Unit
 
@@ -10,6 +13,7 @@ class AudioSaver(Block):
     name = "Audio Saver"
     description = "Saves the input signal as a .wav sound file."
     tags = ("Saving", "Audio")
+    side_effects = True
     references = {"scipy.io.wavfile.write":
         "https://docs.scipy.org/doc/scipy/reference/generated/scipy.io.wavfile.write.html"}
 
@@ -48,6 +52,22 @@ class AudioSaver(Block):
         # Verify that the file ends with .wav
         if not filename.endswith(".wav"):
             raise exceptions.DataSavingError("File has to be a .wav.")
-        # Write the file
-        scipy.io.wavfile.write(filename, sampling_frequency,
-                               input_signal.ordinate)
+        # Write a temporary file which replaces the file afterwards, so the
+        # file is kept if writing fails and a loader which maps the file
+        # into memory keeps the previous content
+        temp_name = os.path.join(
+            os.path.dirname(filename),
+            f".{os.path.basename(filename)}.{uuid.uuid4().hex[:8]}")
+        try:
+            scipy.io.wavfile.write(temp_name, sampling_frequency,
+                                   input_signal.ordinate)
+        except BaseException:
+            if os.path.exists(temp_name):
+                os.remove(temp_name)
+            raise
+        try:
+            os.replace(temp_name, filename)
+        except OSError:
+            os.remove(temp_name)
+            raise exceptions.DataSavingError(
+                "File could not be replaced, it may be in use.")
@@ -10,6 +10,7 @@ class CrossCorrelation(Block):
         "signals. The cross correlation measures the similarity "
         "between to signals at different time offsets.")
     tags = ("Processing",)
+    process_safe = True
     references = {"numpy.correlate":
         "https://numpy.org/doc/1.25/reference/generated/numpy.correlate.html"}
 
@@ -0,0 +1,36 @@
+from mca.framework import DynamicBlock, data_types, util
+
+
+class ChannelMerger(DynamicBlock):
+    """Combines signals with the same abscissa into the channels of a
+    multi-channel signal. Blocks which support multi-channel signals process
+    all channels at once, so a single chain of blocks replaces a chain for
+    each channel.
+    """
+    name = "Channel Merger"
+    description = ("Combines signals with the same abscissa into the "
+                   "channels of a multi-channel signal.")
+    tags = ("Processing",)
+    process_safe = True
+    multi_channel = True
+
+    def setup_io(self):
+        self.dynamic_input = (1, None)
+        self.new_output()
+        self.new_input()
+        self.new_input()
+
+    def setup_parameters(self):
+        pass
+
+    @util.abort_all_inputs_empty
+    @util.validate_type_signal
+    @util.validate_units(abscissa=True, ordinate=True)
+    def process(self):
+        # Read the input data
+        signals = [i.data for i in self.inputs if i.data]
+        # Stack the signals into the channels of the output signal
+        self.outputs[0].data = data_types.MultiChannelSignal.from_signals(
+            signals)
+        # Apply metadata from the input to the output
+        self.outputs[0].process_metadata = self.inputs[0].metadata
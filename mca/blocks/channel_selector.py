@@ -0,0 +1,45 @@
+from mca import exceptions
+from mca.framework import Block, data_types, parameters, util
+
+
+class ChannelSelector(Block):
+    """Extracts a single channel of a multi-channel signal, e.g. to plot it.
+    A single channel signal is passed on as its only channel.
+    """
+    name = "Channel Selector"
+    description = "Extracts a single channel of a multi-channel signal."
+    tags = ("Processing",)
+    process_safe = True
+    multi_channel = True
+    streamable = True
+
+    def setup_io(self):
+        self.new_output()
+        self.new_input()
+
+    def setup_parameters(self):
+        self.parameters["channel"] = parameters.IntParameter(
+            name="Channel", min_=1, default=1
+        )
+
+    @util.abort_all_inputs_empty
+    @util.validate_type_signal
+    def process(self):
+        # Read the input data
+        input_signal = self.inputs[0].data
+        # Read parameters values
+        channel = self.parameters["channel"].value
+        if isinstance(input_signal, data_types.MultiChannelSignal):
+            channels = input_signal.channels
+        else:
+            channels = 1
+        if channel > channels:
+            raise exceptions.ParameterValueError(
+                f"The input signal has only {channels} channels.")
+        # Apply new signal to the output
+        if isinstance(input_signal, data_types.MultiChannelSignal):
+            self.outputs[0].data = input_signal.channel(channel - 1)
+        else:
+            self.outputs[0].data = input_signal
+        # Apply metadata from the input to the output
+        self.outputs[0].process_metadata = self.inputs[0].metadata
@@ -13,6 +13,7 @@ class Chirp(Block):
                    "frequency corresponds to the frequency at the end of the "
                    "signal.")
     tags = ("Generating",)
+    process_safe = True
     references = {"scipy.signal.chirp":
         "https://docs.scipy.org/doc/scipy/reference/generated/scipy.signal.chirp.html"}
 
@@ -87,9 +87,9 @@ class ComplexPlot(DynamicBlock, PlotBlock):
         for i in self.inputs:
             validator.check_type_signal(i.data)
         # Read the input data
-        signals = [copy.copy(i.data) for i in self.inputs if i.data]#
+        signals = [i.data for i in self.inputs if i.data]
         # Read the input metadata
-        metadatas = [copy.copy(i.metadata) for i in self.inputs if i.metadata]
+        metadatas = [i.metadata for i in self.inputs if i.metadata]
         # Read the input metadata units
         abscissa_units = [metadata.unit_a for metadata in metadatas]
         ordinate_units = [metadata.unit_o for metadata in metadatas]
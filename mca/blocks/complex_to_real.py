@@ -1,5 +1,3 @@
-import copy
-
 from mca.framework import Block, util
 
 
@@ -16,6 +14,8 @@ class ComplexToReal(Block):
                    "yields the real part and second output yields the "
                    "imaginary part.")
     tags = ("Processing",)
+    process_safe = True
+    streamable = True
 
     def setup_io(self):
         self.new_output(name="Real part")
@@ -29,11 +29,10 @@ class ComplexToReal(Block):
     @util.validate_type_signal
     def process(self):
         # Read the input data
-        real_signal = copy.copy(self.inputs[0].data)
-        imag_signal = copy.copy(self.inputs[0].data)
+        signal = self.inputs[0].data
         # Calculate the ordinates
-        real_signal.ordinate = real_signal.ordinate.real
-        imag_signal.ordinate = imag_signal.ordinate.imag
+        real_signal = signal.replace(ordinate=signal.ordinate.real)
+        imag_signal = signal.replace(ordinate=signal.ordinate.imag)
         # Apply new signal to the outputs
         self.outputs[0].data = real_signal
         self.outputs[1].data = imag_signal
@@ -8,6 +8,7 @@ class Convolution(Block):
     name = "Convolution"
     description = "Computes the convolution of the two input signals."
     tags = ("Processing",)
+    process_safe = True
     references = {"numpy.convolve": "https://numpy.org/doc/stable/reference/generated/numpy.convolve.html"}
 
     def setup_io(self):
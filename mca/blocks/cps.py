@@ -11,6 +11,7 @@ class CrossPowerSpectrum(Block):
         "input signals. The cross power spectrum measures "
         "the similarity between two signals in the frequency domain")
     tags = ("Processing",)
+    process_safe = True
     reference = {"scipy.signal.csd":
         "https://docs.scipy.org/doc/scipy/reference/generated/scipy.signal.csd.html"}
 
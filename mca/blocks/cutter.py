@@ -14,6 +14,8 @@ class Cutter(Block):
                    "range of the abscissa values. Values within the abscissa "
                    "range which do not match any sampling get rounded down.")
     tags = ("Processing",)
+    process_safe = True
+    compare_outputs = True
 
     def setup_io(self):
         self.new_output()
@@ -8,6 +8,7 @@ class DCGenerator(Block):
     name = "Signal Generator (DC)"
     description = "Generates a DC signal."
     tags = ("Generating",)
+    process_safe = True
 
     def setup_io(self):
         self.new_output(user_metadata_required=True)
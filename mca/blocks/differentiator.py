@@ -1,6 +1,6 @@
 import numpy as np
 
-from mca.framework import Block, data_types, util
+from mca.framework import Block, data_types, streaming, util
 
 
 class Differentiator(Block):
@@ -8,6 +8,8 @@ class Differentiator(Block):
     name = "Differentiator"
     description = "Computes the gradient of the input signal."
     tags = ("Processing",)
+    process_safe = True
+    streamable = True
     references = {"numpy.gradient":
         "https://numpy.org/doc/1.25/reference/generated/numpy.gradient.html"}
 
@@ -32,6 +34,10 @@ class Differentiator(Block):
             increment=input_signal.increment,
             ordinate=gradient,
         )
+        self._apply_metadata()
+
+    def _apply_metadata(self):
+        """Applies the metadata of the gradient to the output."""
         # Calculate units for abscissa and ordinate
         unit_a = self.inputs[0].metadata.unit_a
         unit_o = self.inputs[0].metadata.unit_o / self.inputs[0].metadata.unit_a
@@ -39,3 +45,62 @@ class Differentiator(Block):
         self.outputs[0].process_metadata = data_types.MetaData(
             name=None, unit_a=unit_a, unit_o=unit_o
         )
+
+    def start_stream(self):
+        # Last two values of the previous chunks
+        self._context = None
+        self._started = False
+
+    @util.validate_type_signal
+    def process_chunk(self):
+        # The central difference of a value needs the next value, so the
+        # gradient of the last value of a chunk is computed with the next
+        # chunk
+        if self.inputs[0].data is None:
+            self.outputs[0].data = None
+            return
+        input_signal = streaming.concatenate(
+            [self._context, self.inputs[0].data])
+        if input_signal.values < 2:
+            self._context = input_signal
+            self.outputs[0].data = None
+            return
+        if not self._started:
+            # The first value uses the forward difference like np.gradient
+            gradient = np.gradient(input_signal.ordinate)[:-1]
+            abscissa_start = input_signal.abscissa_start
+            self._started = True
+        else:
+            gradient = (input_signal.ordinate[2:] -
+                        input_signal.ordinate[:-2]) / 2
+            abscissa_start = input_signal.abscissa_start + \
+                input_signal.increment
+        self._context = streaming.split(input_signal,
+                                        input_signal.values - 2)[1]
+        # Apply new signal to the output
+        self.outputs[0].data = data_types.Signal(
+            abscissa_start=abscissa_start,
+            values=len(gradient),
+            increment=input_signal.increment,
+            ordinate=gradient / input_signal.increment,
+        )
+        self._apply_metadata()
+
+    def finish_stream(self):
+        self.process_chunk()
+        if not self._started:
+            return
+        # The last value uses the backward difference like np.gradient
+        context = self._context
+        gradient = (context.ordinate[-1:] - context.ordinate[-2:-1]) / \
+            context.increment
+        last = data_types.Signal(
+            abscissa_start=context.abscissa_start +
+            (context.values - 1) * context.increment,
+            values=1,
+            increment=context.increment,
+            ordinate=gradient,
+        )
+        self.outputs[0].data = streaming.concatenate(
+            [self.outputs[0].data, last])
+        self._apply_metadata()
@@ -6,6 +6,7 @@ class Divider(Block):
     name = "Divider"
     description = "Divides the two input signals."
     tags = ("Processing",)
+    process_safe = True
 
     def setup_io(self):
         self.new_output()
@@ -12,6 +12,7 @@ class DownSample(Block):
                   "The overall length of the signal approximately stays " \
                   "the same."
     tags = ("Processing",)
+    process_safe = True
 
     def setup_io(self):
         self.new_output()
@@ -1,7 +1,7 @@
 import numpy as np
 from scipy.signal import hilbert
 
-from mca.framework import Block, data_types, util
+from mca.framework import Block, util
 
 
 class Envelope(Block):
@@ -11,6 +11,8 @@ class Envelope(Block):
         "It is given by the magnitude of the analytical signal "
         "(hilbert transformation)")
     tags = ("Processing",)
+    process_safe = True
+    multi_channel = True
     references = {"scipy.signal.hilbert":
         "https://docs.scipy.org/doc/scipy/reference/generated/scipy.signal.hilbert.html"}
 
@@ -30,11 +32,6 @@ class Envelope(Block):
         analytical_signal = hilbert(input_signal.ordinate)
         envelope = np.abs(analytical_signal)
         # Apply new signal to the output
-        self.outputs[0].data = data_types.Signal(
-            abscissa_start=input_signal.abscissa_start,
-            values=input_signal.values,
-            increment=input_signal.increment,
-            ordinate=envelope,
-        )
+        self.outputs[0].data = input_signal.replace(ordinate=envelope)
         # Apply metadata from the input to the output
         self.outputs[0].process_metadata = self.inputs[0].metadata
@@ -1,6 +1,7 @@
 import numpy as np
 
-from mca.framework import Block, data_types, parameters, util
+from mca import exceptions
+from mca.framework import Block, data_types, parameters, streaming, util
 
 
 class FFT(Block):
@@ -8,6 +9,8 @@ class FFT(Block):
     name = "FFT"
     description = "Computes the FFT or the inverse FFT of the input signal."
     tags = ("Processing", "Fouriertransformation")
+    process_safe = True
+    multi_channel = True
     references = {"numpy.fft.fft":
         "https://numpy.org/doc/1.25/reference/generated/numpy.fft.fft.html",
         "numpy.fft.ifft":
@@ -27,12 +30,22 @@ class FFT(Block):
         self.parameters["inverse"] = parameters.BoolParameter(
             name="Inverse", default=False
         )
+        self.parameters["segment"] = parameters.IntParameter(
+            name="Segment", min_=0, default=0,
+            description="Amount of values of the segments the signal is "
+                        "transformed in, e.g. to stream it. The spectra of "
+                        "the segments are the channels of the output. 0 "
+                        "transforms the whole signal."
+        )
 
-    @util.abort_all_inputs_empty
-    @util.validate_type_signal
-    def process(self):
-        # Read the input data
-        input_signal = self.inputs[0].data
+    @property
+    def streamable(self):
+        return self.parameters["segment"].value > 0
+
+    def _transform(self, input_signal):
+        """Returns the ordinate and the increment of the transformed
+        signal.
+        """
         # Read parameters values
         normalize = self.parameters["normalize"].value
         inverse = self.parameters["inverse"].value
@@ -44,18 +57,33 @@ class FFT(Block):
         # Calculate the increment
         increment = 1 / (
                 input_signal.increment * input_signal.values)
-        # Calculate the amount of values
-        values = input_signal.values
         # Normalize the fft if needed
         if normalize:
-            fft = fft / values
+            fft = fft / input_signal.values
+        return fft, increment
+
+    @util.abort_all_inputs_empty
+    @util.validate_type_signal
+    def process(self):
+        # Read the input data
+        input_signal = self.inputs[0].data
+        segment = self.parameters["segment"].value
+        if segment > 0:
+            self._transform_segments(
+                streaming.Segmenter(segment), input_signal, final=True)
+            return
+        fft, increment = self._transform(input_signal)
         # Apply new signal to the output
-        self.outputs[0].data = data_types.Signal(
+        self.outputs[0].data = input_signal.replace(
             abscissa_start=0,
-            values=values,
+            values=input_signal.values,
             increment=increment,
             ordinate=fft,
         )
+        self._apply_metadata()
+
+    def _apply_metadata(self):
+        """Applies the metadata of the spectrum to the output."""
         # Calculate units for abscissa and ordinate
         unit_o = self.inputs[0].metadata.unit_o
         unit_a = 1 / self.inputs[0].metadata.unit_a
@@ -63,3 +91,53 @@ class FFT(Block):
         self.outputs[0].process_metadata = data_types.MetaData(
             name=None, unit_a=unit_a, unit_o=unit_o
         )
+
+    def start_stream(self):
+        self._segmenter = streaming.Segmenter(
+            self.parameters["segment"].value)
+
+    @util.validate_type_signal
+    def process_chunk(self):
+        self._transform_segments(self._segmenter, self.inputs[0].data,
+                                 final=False)
+
+    @util.validate_type_signal
+    def finish_stream(self):
+        self._transform_segments(self._segmenter, self.inputs[0].data,
+                                 final=True)
+
+    def _transform_segments(self, segmenter, input_signal, final):
+        """Transforms each segment of the signal which has been completed by
+        the given chunk. The spectra of the segments are the channels of the
+        output, the last segment is filled with zeros.
+
+        Args:
+            segmenter (:class:`.Segmenter`): Segmenter collecting the
+                                             chunks of the signal.
+            input_signal: Next chunk of the signal or None.
+            final (bool): True, if this is the end of the signal.
+        """
+        if input_signal is not None and input_signal.ordinate.ndim > 1:
+            raise exceptions.DataTypeError(
+                "Multi-channel signals cannot be transformed in segments.")
+        segments = segmenter.push(input_signal, final)
+        if not segments:
+            self.outputs[0].data = None
+            return
+        values = segmenter.values
+        spectra = []
+        for segment in segments:
+            if segment.values < values:
+                ordinate = np.zeros(values, dtype=segment.ordinate.dtype)
+                ordinate[:segment.values] = segment.ordinate
+                segment = segment.replace(values=values, ordinate=ordinate)
+            fft, increment = self._transform(segment)
+            spectra.append(fft)
+        # Apply new signal to the output
+        self.outputs[0].data = data_types.MultiChannelSignal(
+            abscissa_start=0,
+            values=values,
+            increment=increment,
+            ordinate=np.stack(spectra),
+        )
+        self._apply_metadata()
@@ -8,6 +8,7 @@ class FFTShift(Block):
     name = "FFT Shift"
     description = "Perform an FFT shift on the input signal."
     tags = ("Processing", "Fouriertransformation")
+    process_safe = True
     references = {"numpy.fft.fftshift":
         "https://numpy.org/doc/1.25/reference/generated/numpy.fft.fftshift.html",
         "numpy.fft.ifftshift":
@@ -12,6 +12,7 @@ class GaussPulse(Block):
     description = ("Generates a gaussian pulse signal. Returns real- and "
                    "imaginary part as well as the envelope.")
     tags = ("Generating",)
+    process_safe = True
     references = {"scipy.signal.gausspulse":
         "https://docs.scipy.org/doc/scipy/reference/generated/scipy.signal.gausspulse.html"}
 
@@ -15,6 +15,7 @@ class HSOscilloscope(Block):
     name = "HS Oscilloscope"
     description = "Measure and extract data from a Handyscope oscilloscope"
     tags = ("Generating",)
+    cacheable = False
 
     def __init__(self, **kwargs):
         """Initializes HSOscilloscope."""
@@ -1,7 +1,8 @@
+import numpy as np
 from scipy.signal import butter, cheby1, cheby2, ellip, lfilter, filtfilt
 
 from mca import exceptions
-from mca.framework import Block, data_types, parameters, util
+from mca.framework import Block, parameters, util
 
 
 class IRRFilter(Block):
@@ -16,6 +17,8 @@ class IRRFilter(Block):
                     "specific 'Filter types' certain parameters are ignored "
                     "as well.")
     tags = ("Processing",)
+    process_safe = True
+    multi_channel = True
     references = {"scipy.signal.butter":
         "https://docs.scipy.org/doc/scipy/reference/generated/scipy.signal.butter.html",
         "scipy.signal.cheby1":
@@ -69,11 +72,15 @@ class IRRFilter(Block):
                 name="Phase correction (filtfilt)", default=False
         )
 
-    @util.abort_all_inputs_empty
-    @util.validate_type_signal
-    def process(self):
-        # Read the input data
-        input_signal = self.inputs[0].data
+    @property
+    def streamable(self):
+        # The phase correction filters the whole signal backwards
+        return not self.parameters["phase_corr"].value
+
+    def _design(self, input_signal):
+        """Returns the numerator and denominator of the filter for the
+        sampling of the input signal.
+        """
         # Read parameters values
         filter_type = self.parameters["filter_type"].value
         order = self.parameters["order"].value
@@ -82,7 +89,6 @@ class IRRFilter(Block):
         upper_cut_off = self.parameters["upper_cut_off"].value
         ripple = self.parameters["ripple"].value
         attenuation = self.parameters["attenuation"].value
-        phase_corr = self.parameters["phase_corr"].value
         # Validation for the cut_off frequencies
         if cut_off > (2 / input_signal.increment):
             raise exceptions.ParameterValueError("Cut off frequency can not "
@@ -109,17 +115,47 @@ class IRRFilter(Block):
         elif filter_type == "ellip":
             b, a = ellip(N=order, Wn=f_norm,
                          btype=characteristic, rs=attenuation, rp=ripple)
-        # Apply the phase correction
-        if phase_corr:
+        return b, a
+
+    @util.abort_all_inputs_empty
+    @util.validate_type_signal
+    def process(self):
+        # Read the input data
+        input_signal = self.inputs[0].data
+        b, a = self._design(input_signal)
+        # Apply the phase correction. The filter is computed in float64
+        # since the coefficients of higher orders are numerically unstable
+        # in single precision, the dtype policy of the registry narrows the
+        # result again (see :attr:`.IORegistry.dtype_policy`)
+        if self.parameters["phase_corr"].value:
             ordinate = filtfilt(b, a, input_signal.ordinate)
         else:
             ordinate = lfilter(b, a, input_signal.ordinate)
         # Apply new signal to the output
-        self.outputs[0].data = data_types.Signal(
-            abscissa_start=input_signal.abscissa_start,
-            values=input_signal.values,
-            increment=input_signal.increment,
-            ordinate=ordinate,
-        )
+        self.outputs[0].data = input_signal.replace(ordinate=ordinate)
+        # Apply metadata from the input to the output
+        self.outputs[0].process_metadata = self.inputs[0].metadata
+
+    def start_stream(self):
+        self._coefficients = None
+        self._state = None
+
+    @util.abort_all_inputs_empty
+    @util.validate_type_signal
+    def process_chunk(self):
+        # Read the input data
+        input_signal = self.inputs[0].data
+        if self._coefficients is None:
+            self._coefficients = self._design(input_signal)
+        b, a = self._coefficients
+        # The filter starts at rest like lfilter without initial conditions
+        # and continues with the final conditions of the previous chunk
+        if self._state is None:
+            self._state = np.zeros(input_signal.ordinate.shape[:-1] +
+                                   (max(len(a), len(b)) - 1,))
+        ordinate, self._state = lfilter(b, a, input_signal.ordinate,
+                                        zi=self._state)
+        # Apply new signal to the output
+        self.outputs[0].data = input_signal.replace(ordinate=ordinate)
         # Apply metadata from the input to the output
         self.outputs[0].process_metadata = self.inputs[0].metadata
@@ -13,6 +13,7 @@ class Impulse(Block):
                    "and the shift have no units and are related to the amount "
                    "of values which are set by the abscissa parameter.")
     tags = ("Generating",)
+    process_safe = True
 
     def setup_io(self):
         self.new_output(user_metadata_required=False)
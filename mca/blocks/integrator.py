@@ -9,6 +9,8 @@ class Integrator(Block):
     name = "Integrator"
     description = "Computes the numerical integration of the input signal."
     tags = ("Processing",)
+    process_safe = True
+    streamable = True
     references = {"scipy.integrate.cumulative_trapezoid":
         "https://docs.scipy.org/doc/scipy/reference/generated/scipy.integrate.cumulative_trapezoid.html",
         "numpy.cumsum":
@@ -47,6 +49,10 @@ class Integrator(Block):
             increment=input_signal.increment,
             ordinate=ordinate_int,
         )
+        self._apply_metadata()
+
+    def _apply_metadata(self):
+        """Applies the metadata of the integral to the output."""
         # Calculate units for abscissa and ordinate
         unit_a = self.inputs[0].metadata.unit_a
         unit_o = self.inputs[0].metadata.unit_o * self.inputs[0].metadata.unit_a
@@ -54,3 +60,37 @@ class Integrator(Block):
         self.outputs[0].process_metadata = data_types.MetaData(
             name=None, unit_a=unit_a, unit_o=unit_o
         )
+
+    def start_stream(self):
+        self._last_value = None
+        self._integral = 0
+
+    @util.abort_all_inputs_empty
+    @util.validate_type_signal
+    def process_chunk(self):
+        # Read the input data
+        input_signal = self.inputs[0].data
+        int_rule = self.parameters["int_rule"].value
+        # Calculate the ordinate, which continues the integral of the
+        # previous chunks
+        if int_rule == "trapz":
+            if self._last_value is None:
+                ordinate_int = integrate.cumulative_trapezoid(
+                    y=input_signal.ordinate, dx=input_signal.increment,
+                    initial=0)
+            else:
+                # The trapezoid between the chunks starts at the last value
+                # of the previous chunk
+                ordinate_int = integrate.cumulative_trapezoid(
+                    y=np.concatenate(([self._last_value],
+                                      input_signal.ordinate)),
+                    dx=input_signal.increment) + self._integral
+            self._last_value = input_signal.ordinate[-1]
+        elif int_rule == "rect":
+            ordinate_int = np.cumsum(
+                input_signal.ordinate) * input_signal.increment + \
+                self._integral
+        self._integral = ordinate_int[-1]
+        # Apply new signal to the output
+        self.outputs[0].data = input_signal.replace(ordinate=ordinate_int)
+        self._apply_metadata()
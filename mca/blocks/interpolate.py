@@ -15,6 +15,7 @@ class Interpolate(Block):
                    " The range of the new abscissa has to be within the "
                    "range of the abscissa of the input signal.")
     tags = ("Processing",)
+    process_safe = True
     references = {"scipy.interpolate.interp1d (Legacy)":
         "https://docs.scipy.org/doc/scipy/reference/generated/scipy.interpolate.interp1d.html"}
 
@@ -11,6 +11,9 @@ class Limiter(Block):
     description = ("Limits the values of the input signal. Values exceeding "
                    "this limit get set to the threshold.")
     tags = ("Processing",)
+    process_safe = True
+    streamable = True
+    compare_outputs = True
     references = {"numpy.clip":
         "https://numpy.org/doc/stable/reference/generated/numpy.clip.html"}
 
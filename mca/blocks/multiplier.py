@@ -1,5 +1,3 @@
-import copy
-
 import numpy as np
 
 from mca.framework import DynamicBlock, data_types, util
@@ -10,6 +8,7 @@ class Multiplier(DynamicBlock):
     name = "Multiplier"
     description = "Multiplies the input signals with each other."
     tags = ("Processing",)
+    process_safe = True
 
     def setup_io(self):
         self.dynamic_input = (1, None)
@@ -26,9 +25,9 @@ class Multiplier(DynamicBlock):
     @util.validate_intervals
     def process(self):
         # Read the input data
-        signals = [copy.copy(i.data) for i in self.inputs if i.data]
+        signals = [i.data for i in self.inputs if i.data]
         # Read the input metadata
-        metadatas = [copy.copy(i.metadata) for i in self.inputs if i.metadata]
+        metadatas = [i.metadata for i in self.inputs if i.metadata]
         # Fill the signals with zeros so their lengths match
         matched_signals = util.fill_zeros(signals)
         # Initialize the ordinate and the units
@@ -9,6 +9,7 @@ class Normalization(Block):
     description = ("Normalizes input signal by the specified range "
                    "(By default 0-1).")
     tags = ("Processing",)
+    process_safe = True
 
     def setup_io(self):
         self.new_output()
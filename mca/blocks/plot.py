@@ -1,5 +1,3 @@
-import copy
-
 import numpy as np
 
 from mca.framework import DynamicBlock, PlotBlock, data_types, parameters, \
@@ -65,9 +63,9 @@ class Plot(PlotBlock, DynamicBlock):
         for i in self.inputs:
             validator.check_type_signal(i.data)
         # Read the input data
-        signals = [copy.copy(i.data) for i in self.inputs if i.data]
+        signals = [i.data for i in self.inputs if i.data]
         # Read the input metadata
-        metadatas = [copy.copy(i.metadata) for i in self.inputs if i.metadata]
+        metadatas = [i.metadata for i in self.inputs if i.metadata]
         # Read the input metadata units
         abscissa_units = [metadata.unit_a for metadata in metadatas]
         ordinate_units = [metadata.unit_o for metadata in metadatas]
@@ -11,6 +11,7 @@ class PolynomGenerator(Block):
     description = ("Generates a signal based on a polynomial function "
                     "with the maximum order of 5 (a*x⁵+b*x⁴+c*x³+d*x²+e*x¹+f*x⁰)")
     tags = ("Generating",)
+    process_safe = True
 
     def setup_io(self):
         self.new_output(user_metadata_required=True)
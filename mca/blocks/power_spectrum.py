@@ -12,6 +12,8 @@ class PowerSpectrum(Block):
     description = ("Computes the power spectrum of the input signal using "
                    "Welch's method")
     tags = ("Processing",)
+    process_safe = True
+    multi_channel = True
     references = {"scipy.signal.welch":
         "https://docs.scipy.org/doc/scipy/reference/generated/scipy.signal.welch.html"}
 
@@ -75,7 +77,7 @@ class PowerSpectrum(Block):
         # Calculate the increment
         increment = freq[1] - freq[0]
         # Apply new signal to the output
-        self.outputs[0].data = data_types.Signal(
+        self.outputs[0].data = input_signal.replace(
             abscissa_start=abscissa_start,
             values=values,
             increment=increment,
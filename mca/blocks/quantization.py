@@ -11,6 +11,9 @@ class Quantization(Block):
     description = ("Quantizes the input signal by a given amount of bits. "
                    "Returns optionally the raw bit values.")
     tags = ("Processing",)
+    process_safe = True
+    streamable = True
+    compare_outputs = True
     references = {"numpy.rint":
         "https://numpy.org/doc/stable/reference/generated/numpy.rint.html"}
 
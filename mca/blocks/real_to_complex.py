@@ -15,6 +15,7 @@ class RealToComplex(Block):
                    "of the output signal and the signal of the second input "
                    "turns into the imaginary part of output signal.")
     tags = ("Processing",)
+    process_safe = True
 
     def setup_io(self):
         self.new_output()
@@ -1,6 +1,6 @@
 from scipy.signal import resample
 
-from mca.framework import Block, data_types, parameters, util
+from mca.framework import Block, parameters, util
 
 
 class Resample(Block):
@@ -8,6 +8,8 @@ class Resample(Block):
     name = "Resample"
     description = "Resamples the input signal."
     tags = ("Processing",)
+    process_safe = True
+    multi_channel = True
     references = {"scipy.signal.resample":
         "https://docs.scipy.org/doc/scipy/reference/generated/scipy.signal.resample.html"}
 
@@ -33,12 +35,11 @@ class Resample(Block):
         # Calculate the amount of values
         values = int(measure_time * sample_freq)
         # Calculate the ordinate
-        ordinate = resample(input_signal.ordinate, values)
+        ordinate = resample(input_signal.ordinate, values, axis=-1)
         # Calculate the increment
         increment = 1 / sample_freq
         # Apply new signal to the output
-        self.outputs[0].data = data_types.Signal(
-            abscissa_start=input_signal.abscissa_start,
+        self.outputs[0].data = input_signal.replace(
             values=values,
             increment=increment,
             ordinate=ordinate,
@@ -9,6 +9,7 @@ class SignalGenerator(Block):
     name = "Signal Generator"
     description = "Generates a rectangle or triangle signal."
     tags = ("Generating",)
+    process_safe = True
 
     def setup_io(self):
         self.new_output(user_metadata_required=True)
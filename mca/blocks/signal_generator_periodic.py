@@ -10,6 +10,7 @@ class SignalGeneratorPeriodic(Block):
     description = ("Generates a periodic sinus, rectangle or "
                    "triangle signal.")
     tags = ("Generating",)
+    process_safe = True
 
     def setup_io(self):
         self.new_output(user_metadata_required=True)
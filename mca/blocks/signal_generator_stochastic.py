@@ -11,6 +11,8 @@ class SignalGeneratorStochastic(Block):
     description = ("Generates a stochastic signal "
                    "with either normal or equal distribution.")
     tags = ("Generating", "Stochastic")
+    cacheable = False
+    process_safe = True
 
     def setup_io(self):
         self.new_output(user_metadata_required=True)
@@ -1,6 +1,8 @@
 import dsch
+from dsch import schema
+import numpy as np
 
-from mca.framework import Block, data_types, parameters
+from mca.framework import Block, cache, data_types, parameters
 
 
 class SignalLoader(Block):
@@ -9,6 +11,7 @@ class SignalLoader(Block):
     description = "Loads a signal from a file " \
                   "(previously saved by the SignalSaver)."
     tags = ("Generating", "Loading")
+    cacheable = False
 
     def setup_io(self):
         self.new_output()
@@ -23,6 +26,12 @@ class SignalLoader(Block):
                 name="Load file",
                 function=self.load_file
         )
+        self.parameters["memory_map"] = parameters.BoolParameter(
+                name="Memory-mapped", default=True,
+                description="Map the signal of .npz files into memory "
+                            "instead of reading it, only the parts of the "
+                            "signal which are processed are read."
+        )
 
     def process(self):
         pass
@@ -31,29 +40,79 @@ class SignalLoader(Block):
         """Loads a signal from a file (previously saved by the SignalSaver)."""
         # Read parameters values
         file_name = self.parameters["file_name"].value
+        memory_map = self.parameters["memory_map"].value
 
-        storage = dsch.load(
-            storage_path=file_name,
-            required_schema=data_types.signal_schema
-        )
+        if memory_map and file_name.endswith(".npz"):
+            fields, ordinate = _map_npz(file_name)
+        else:
+            storage = dsch.load(
+                storage_path=file_name,
+                required_schema=data_types.signal_schema
+            )
+            signal = storage.data.signal
+            metadata = storage.data.metadata
+            fields = {
+                "abscissa_start": signal.abscissa_start.value,
+                "values": signal.values.value,
+                "increment": signal.increment.value,
+                "name": metadata.name.value,
+                "abscissa_unit": metadata.abscissa_unit.value,
+                "ordinate_unit": metadata.ordinate_unit.value,
+                "abscissa_quantity": metadata.abscissa_quantity.value,
+                "ordinate_quantity": metadata.ordinate_quantity.value,
+                "abscissa_symbol": metadata.abscissa_symbol.value,
+                "ordinate_symbol": metadata.ordinate_symbol.value,
+            }
+            ordinate = signal.ordinate.value
         # Apply loaded signal to the output
         self.outputs[0].data = data_types.Signal(
-            abscissa_start=storage.data.signal.abscissa_start.value,
-            values=storage.data.signal.values.value,
-            increment=storage.data.signal.increment.value,
-            ordinate=storage.data.signal.ordinate.value
+            abscissa_start=fields["abscissa_start"],
+            values=fields["values"],
+            increment=fields["increment"],
+            ordinate=ordinate
         )
 
         # Apply metadata from the loaded signal
         self.outputs[0].process_metadata = data_types.MetaData(
-                    name=storage.data.metadata.name.value,
-                    unit_a=storage.data.metadata.abscissa_unit.value,
-                    unit_o=storage.data.metadata.ordinate_unit.value,
-                    quantity_a=storage.data.metadata.abscissa_quantity.value,
-                    quantity_o=storage.data.metadata.ordinate_quantity.value,
-                    symbol_a=storage.data.metadata.abscissa_symbol.value,
-                    symbol_o=storage.data.metadata.ordinate_symbol.value,
+                    name=fields["name"],
+                    unit_a=fields["abscissa_unit"],
+                    unit_o=fields["ordinate_unit"],
+                    quantity_a=fields["abscissa_quantity"],
+                    quantity_o=fields["ordinate_quantity"],
+                    symbol_a=fields["abscissa_symbol"],
+                    symbol_o=fields["ordinate_symbol"],
         )
+        # The file identifies the data, so it does not have to be hashed
+        self.outputs[0].fingerprint = cache.file_fingerprint(
+            file_name, cache.parameters_fingerprint(self))
 
         # Trigger an update manually since this is not executed within process
         self.trigger_update()
+
+
+def _map_npz(file_name):
+    """Reads the fields of a signal saved in a .npz file and maps its
+    ordinate into memory. dsch would read the whole ordinate.
+
+    Returns:
+        tuple: Dict of the fields of the signal and the metadata by their
+               name in :data:`.data_types.signal_schema` and the ordinate.
+
+    Raises:
+        dsch.exceptions.InvalidSchemaError: If the file does not contain a
+                                            signal.
+    """
+    with np.load(file_name) as file:
+        stored_schema = schema.node_from_json(file["_schema"][()])
+        if stored_schema.hash() != data_types.signal_schema.hash():
+            raise dsch.exceptions.InvalidSchemaError(
+                data_types.signal_schema.hash(), stored_schema.hash())
+        fields = {key.split(".")[1]: file[key][()] for key in file.files
+                  if key not in ("_schema", "signal.ordinate")}
+        ordinate = data_types.memory_map_npz(file_name, "signal.ordinate")
+        if ordinate is None:
+            ordinate = file["signal.ordinate"]
+    for name, value in fields.items():
+        if isinstance(value, np.str_):
+            fields[name] = str(value)
+    return fields, ordinate
@@ -2,6 +2,7 @@ import os.path
 
 import dsch
 from dsch import schema
+import numpy as np
 
 from mca import exceptions
 from mca.framework import Block, data_types, parameters
@@ -12,6 +13,7 @@ class SignalSaver(Block):
     name = "Signal Saver"
     description = "Saves the input signal in a .npz, .mat, .hdf5 file."
     tags = ("Saving",)
+    side_effects = True
 
     def setup_io(self):
         self.new_input()
@@ -51,7 +53,12 @@ class SignalSaver(Block):
         storage.data.signal.abscissa_start.value = signal.abscissa_start
         storage.data.signal.values.value = signal.values
         storage.data.signal.increment.value = signal.increment
-        storage.data.signal.ordinate.value = signal.ordinate
+        ordinate = signal.ordinate
+        # The file stores real ordinates as float64, e.g. int16 or float32
+        # data of the dtype policy (see :attr:`.IORegistry.dtype_policy`)
+        if ordinate.dtype.kind in "biuf":
+            ordinate = ordinate.astype(np.float64, copy=False)
+        storage.data.signal.ordinate.value = ordinate
         # Write the metadata parameters
         storage.data.metadata.name.value = metadata.name
         storage.data.metadata.abscissa_unit.value = repr(metadata.unit_a)
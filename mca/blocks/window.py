@@ -1,6 +1,6 @@
 from scipy import signal
 
-from mca.framework import Block, data_types, parameters, util
+from mca.framework import Block, parameters, streaming, util
 
 
 class Window(Block):
@@ -8,6 +8,8 @@ class Window(Block):
     name = "Window"
     description = "Applies a window function to the input signal."
     tags = ("Processing",)
+    process_safe = True
+    multi_channel = True
     references = {"scipy.signal.windows.tukey":
         "https://docs.scipy.org/doc/scipy/reference/generated/scipy.signal.windows.tukey.html",
         "scipy.signal.windows.hamming":
@@ -39,12 +41,19 @@ class Window(Block):
         self.parameters["std"] = parameters.FloatParameter(
             name="Standard Deviation (Gaussian)", min_=0, default=1
         )
+        self.parameters["segment"] = parameters.IntParameter(
+            name="Segment", min_=0, default=0,
+            description="Amount of values of the segments the signal is "
+                        "windowed in, e.g. to stream it. 0 windows the "
+                        "whole signal."
+        )
 
-    @util.abort_all_inputs_empty
-    @util.validate_type_signal
-    def process(self):
-        # Read the input data
-        input_signal = self.inputs[0].data
+    @property
+    def streamable(self):
+        return self.parameters["segment"].value > 0
+
+    def _window(self, values):
+        """Returns the window function with the given amount of values."""
         # Read parameters values
         window_name = self.parameters["window_func"].value
         # Set the args
@@ -55,15 +64,46 @@ class Window(Block):
         else:
             args = window_name
         # Get the window function
-        window = signal.get_window(args, input_signal.values)
+        return signal.get_window(args, values)
+
+    @util.abort_all_inputs_empty
+    @util.validate_type_signal
+    def process(self):
+        # Read the input data
+        input_signal = self.inputs[0].data
+        segment = self.parameters["segment"].value
+        if segment > 0:
+            self._window_segments(
+                streaming.Segmenter(segment).push(input_signal, final=True))
+            return
         # Calculate the ordinate
-        ordinate = input_signal.ordinate * window
+        ordinate = input_signal.ordinate * self._window(input_signal.values)
         # Apply new signal to the output
-        self.outputs[0].data = data_types.Signal(
-            abscissa_start=input_signal.abscissa_start,
-            values=input_signal.values,
-            increment=input_signal.increment,
-            ordinate=ordinate,
-        )
+        self.outputs[0].data = input_signal.replace(ordinate=ordinate)
+        # Apply metadata from the input to the output
+        self.outputs[0].process_metadata = self.inputs[0].metadata
+
+    def start_stream(self):
+        self._segmenter = streaming.Segmenter(
+            self.parameters["segment"].value)
+
+    @util.validate_type_signal
+    def process_chunk(self):
+        self._window_segments(
+            self._segmenter.push(self.inputs[0].data, final=False))
+
+    @util.validate_type_signal
+    def finish_stream(self):
+        self._window_segments(
+            self._segmenter.push(self.inputs[0].data, final=True))
+
+    def _window_segments(self, segments):
+        """Windows each segment separately and applies the joined segments
+        on the output.
+        """
+        self.outputs[0].data = streaming.concatenate(
+            [segment.replace(
+                ordinate=segment.ordinate * self._window(segment.values))
+             for segment in segments])
         # Apply metadata from the input to the output
         self.outputs[0].process_metadata = self.inputs[0].metadata
@@ -8,6 +8,7 @@ class Zerofill(Block):
     name = "Zerofill"
     description = "Adds dead time and zero padding to the input signal."
     tags = ("Processing",)
+    process_safe = True
 
     def setup_io(self):
         self.new_output()
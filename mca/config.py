@@ -18,7 +18,13 @@ class Config(dict):
                       "recent_files": [],
                       "explorer_pos": "left",
                       "window_size": None,
-                      "first_startup": True}
+                      "first_startup": True,
+                      "lazy_evaluation": False,
+                      "memory_cache_size": 256,
+                      "disk_cache_size": 0,
+                      "update_debounce": 200,
+                      "background_updates": True,
+                      "dtype_policy": None}
 
     def __init__(self):
         """Initializes the Config class."""
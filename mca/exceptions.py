@@ -163,3 +163,29 @@ class DataLoadingError(MCAError):
             cause (str): Reason why loading was unsuccessful.
         """
         super().__init__(cause)
+
+
+class ExecutionPlanError(MCAError):
+    """Exception raised when an execution plan cannot be run."""
+
+    def __init__(self, cause):
+        """Initializes ExecutionPlanError.
+
+        Args:
+            cause (str): Reason why the plan cannot be run.
+        """
+        super().__init__(cause)
+
+
+class BatchError(MCAError):
+    """Exception raised when a batch run of a block structure cannot be
+    set up.
+    """
+
+    def __init__(self, cause):
+        """Initializes BatchError.
+
+        Args:
+            cause (str): Reason why the batch run cannot be set up.
+        """
+        super().__init__(cause)
@@ -1,11 +1,9 @@
+import contextlib
 import logging
 
-from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg, NavigationToolbar2QT as NavigationToolbar
-from matplotlib.figure import Figure
-from matplotlib.backends.qt_compat import QtWidgets, QtGui
-
 from mca import exceptions
-from mca.framework import block_io, io_registry, parameters
+# The registry has to be imported before the IO classes it depends on
+from mca.framework import io_registry, block_io, parameters
 from mca.language import _
 
 
@@ -15,6 +13,9 @@ class Block:
     All specific Blocks must derive from this basic Block class.
     
     Attributes:
+        registry (:class:`.IORegistry`): Registry the block is bound to. This
+                                         is the current registry at the time
+                                         the block is created.
         inputs: List that contains all its :class:`.Input`.
         outputs: List that contains all its :class:`.Output`.
         parameters: List that contains all parameters.
@@ -23,16 +24,59 @@ class Block:
                          into the save file when saving the block structure
                          and 'run_time_data' holds data is only used while the
                          program is running.
+        thread_safe (bool): Class attribute whether the block may be
+                            updated on a worker thread of a
+                            :class:`.ThreadExecutor`.
+        side_effects (bool): Class attribute whether processing the block
+                             has effects besides setting its outputs, e.g.
+                             drawing a plot or playing a sound.
+        cacheable (bool): Class attribute whether the outputs of the block
+                          only depend on its parameters and inputs, so they
+                          may be restored from the cache of the registry
+                          (see :class:`.MemoryCache`).
+        process_safe (bool): Class attribute whether the block may be
+                             processed in a worker process of a
+                             :class:`.ProcessExecutor`. Only blocks whose
+                             outputs solely depend on their parameters and
+                             inputs are safe to run out-of-process.
+        interactive (bool): Class attribute whether the block interacts
+                            with the user, e.g. shows a plot or plays a
+                            sound. Interactive blocks are left out of
+                            headless runs (see :mod:`mca.batch`).
+        multi_channel (bool): Class attribute whether the block processes
+                              all channels of a :class:`.MultiChannelSignal`
+                              at once. Other blocks reject multi-channel
+                              signals.
+        streamable (bool): Whether the block can process a signal in
+                           consecutive chunks with :meth:`.process_chunk`
+                           (see :class:`.StreamPlan`). Blocks which need the
+                           whole signal at once are materialised instead.
+        compare_outputs (bool): Class attribute whether the outputs of the
+                                block often stay the same although its
+                                inputs changed, e.g. since it saturates the
+                                signal. The outputs are then compared to
+                                their previous data after processing, so
+                                unchanged outputs keep their version (see
+                                :attr:`.IORegistry.early_cutoff`).
     """
     icon_file = None
     tags = []
     references = {}
     svg = None
+    thread_safe = True
+    process_safe = False
+    side_effects = False
+    cacheable = True
+    interactive = False
+    multi_channel = False
+    streamable = False
+    compare_outputs = False
 
     def __init__(self, **kwargs):
         """Initializes the main Block class."""
         super().__init__()
         logging.info(f"Initializing {self}")
+        self.registry = io_registry.current_registry()
         self.inputs = []
         self.outputs = []
         self.parameters = {
@@ -44,9 +88,32 @@ class Block:
         self.setup_parameters()
         self.read_kwargs(kwargs)
 
+    @property
+    def is_observed(self):
+        """Whether the results of the block are currently observed, e.g. by
+        a visible plot. In lazy mode only observed blocks and the blocks
+        they depend on are updated immediately after a change.
+        """
+        return False
+
+    @property
+    def is_sink(self):
+        """Whether the results of the block are consumed outside of the block
+        structure. This is the case for blocks with side effects, blocks
+        without outputs and blocks with a pinned output. Blocks whose
+        outputs do not lead to a sink are not updated until their data is
+        accessed.
+        """
+        return self.side_effects or not self.outputs or any(
+            output.pinned for output in self.outputs)
+
     def trigger_update(self):
-        """Triggers an update from the block."""
-        io_registry.Registry.invalidate_and_update(self)
+        """Triggers an update from the block.
+
+        Returns:
+            int: Number of blocks which processed their data.
+        """
+        return self.registry.invalidate_and_update(self)
 
     def read_kwargs(self, kwargs):
         """Writes keyword arguments into the parameters."""
@@ -68,6 +135,30 @@ class Block:
         """
         raise NotImplementedError
 
+    def start_stream(self):
+        """Resets the state which is carried from one chunk to the next
+        before a new stream starts (see :class:`.StreamPlan`).
+        """
+
+    def process_chunk(self):
+        """Processes the next chunk of the input signals, which the Inputs
+        hold instead of the whole signals, and applies the results of the
+        chunk on the Outputs.
+
+        By default, the chunk is processed like a whole signal, which is
+        correct for blocks that process each value independently. Blocks
+        which depend on neighbouring values keep the required values of the
+        previous chunks, e.g. the state of a filter.
+        """
+        self.process()
+
+    def finish_stream(self):
+        """Processes the last chunks of the input signals, which may be
+        None, and applies the remaining results on the Outputs after the
+        end of the stream.
+        """
+        self.process_chunk()
+
     def setup_parameters(self):
         """Sets up the parameters for a block."""
         raise NotImplementedError
@@ -76,15 +167,39 @@ class Block:
         """Sets up the inputs and outputs of the block."""
         raise NotImplementedError
 
-    def update(self):
+    def update(self, process=None):
         """Updates the data and the flags of the Outputs if all
         Inputs have valid data.
+
+        If the registry has a cache, the outputs get restored from it when
+        the block has already been processed with the same parameters and
+        inputs. If the registry has a profiler, the update gets recorded.
+
+        Args:
+            process: Function which is called instead of :meth:`.process`,
+                     e.g. to apply data which has been processed in another
+                     process.
+
+        Returns:
+            bool: True, if the block processed its data.
         """
         if (not self.inputs) or all(elem == True
                 for elem in [input_.up_to_date for input_ in self.inputs]):
-            self.process()
+            cache = self.registry.cache
+            profiler = self.registry.profiler
+            with profiler.record(self) if profiler is not None else \
+                    contextlib.nullcontext():
+                if process is not None:
+                    process()
+                elif cache is not None and self.cacheable and \
+                        self.outputs and not self.side_effects:
+                    cache.process(self)
+                else:
+                    self.process()
             for output in self.outputs:
                 output.up_to_date = True
+            return True
+        return False
 
     def disconnect_all(self):
         """Disconnects all Inputs and Outputs."""
@@ -110,7 +225,7 @@ class Block:
         """
 
         self.outputs.append(
-            io_registry.Registry.add_node(
+            self.registry.add_node(
                 block_io.Output(
                     self,
                     initial_metadata=metadata,
@@ -142,7 +257,7 @@ class Block:
             :class:`.DynamicBlock`
         """
         self.inputs.append(
-            io_registry.Registry.add_node(block_io.Input(self, name=name))
+            self.registry.add_node(block_io.Input(self, name=name))
         )
 
     def all_inputs_empty(self):
@@ -222,7 +337,7 @@ class DynamicBlock(Block):
             :class:`.InputOutputError`: If adding the Input was not successful.
         """
         logging.info(f"Adding input to {self}")
-        if input_ in io_registry.Registry._graph.nodes:
+        if input_ in self.registry:
             raise exceptions.DynamicIOError("Input already added")
         if not self.dynamic_input:
             raise exceptions.DynamicIOError("No permission to create Input")
@@ -230,9 +345,9 @@ class DynamicBlock(Block):
         if self.dynamic_input[1]:
             if self.dynamic_input[1] <= len(self.inputs):
                 raise exceptions.DynamicIOError("Maximum Inputs reached")
-            self.inputs.append(io_registry.Registry.add_node(input_))
+            self.inputs.append(self.registry.add_node(input_))
         else:
-            self.inputs.append(io_registry.Registry.add_node(input_))
+            self.inputs.append(self.registry.add_node(input_))
 
     def add_output(self, output):
         """Adds an Output to the Block.
@@ -243,16 +358,16 @@ class DynamicBlock(Block):
             :class:`.InputOutputError`: If adding the Output was not successful.
         """
         logging.info(f"Adding output to {self}")
-        if output in io_registry.Registry._graph.nodes:
+        if output in self.registry:
             raise exceptions.DynamicIOError("Output already added")
         if not self.dynamic_output:
             raise exceptions.DynamicIOError("No permission to create Output")
         if self.dynamic_output[1]:
             if self.dynamic_output[1] <= len(self.outputs):
                 raise exceptions.DynamicIOError("Maximum Outputs reached")
-            self.outputs.append(io_registry.Registry.add_node(output))
+            self.outputs.append(self.registry.add_node(output))
         else:
-            self.outputs.append(io_registry.Registry.add_node(output))
+            self.outputs.append(self.registry.add_node(output))
         self.process()
 
     def delete_input(self, input_index):
@@ -269,7 +384,7 @@ class DynamicBlock(Block):
             raise exceptions.DynamicIOError("No permission to delete Input")
         if self.dynamic_input[0] >= len(self.inputs):
             raise exceptions.DynamicIOError("Minimum Inputs reached")
-        io_registry.Registry.remove_input(self.inputs.pop(input_index))
+        self.registry.remove_input(self.inputs.pop(input_index))
 
     def delete_output(self, output_index):
         """Removes an Output from the Block.
@@ -285,7 +400,7 @@ class DynamicBlock(Block):
             raise exceptions.DynamicIOError("No permission to delete Output")
         if self.dynamic_output[0] >= len(self.outputs):
             raise exceptions.DynamicIOError("Minimum Outputs reached")
-        io_registry.Registry.remove_output(self.outputs.pop(output_index))
+        self.registry.remove_output(self.outputs.pop(output_index))
 
     def process(self):
         raise NotImplementedError
@@ -309,6 +424,11 @@ class PlotBlock(Block):
             axis or an array of axes.
         fig(:obj:`matplotlib.figure`): Matplotlib figure object.
     """
+    # Qt widgets must only be drawn from the GUI thread
+    thread_safe = False
+    side_effects = True
+    interactive = True
+
     def __init__(self, rows, cols, **kwargs):
         """Initialize PlotBlock.
 
@@ -318,7 +438,10 @@ class PlotBlock(Block):
         """
         super().__init__(**kwargs)
         self.setup_plot_parameters()
-        self.plot_window = PlotWindow(rows, cols)
+        # Qt is only imported once a plot is created, so the framework can
+        # be used without it
+        from mca.framework import plot_window
+        self.plot_window = plot_window.PlotWindow(rows, cols)
         self.axes = self.plot_window.axes
         self.fig = self.plot_window.canvas.fig
 
@@ -329,6 +452,7 @@ class PlotBlock(Block):
         Returns:
             str: Color of the label as hexadecimal.
         """
+        from matplotlib.backends.qt_compat import QtGui
         return self.plot_window.palette().color(
             QtGui.QPalette.Text).name()
 
@@ -376,8 +500,13 @@ class PlotBlock(Block):
             label = repr(unit)
         axis.set_xlabel(label, color=self.label_color, **kwargs)
 
+    @property
+    def is_observed(self):
+        return self.plot_window.isVisible()
+
     def show(self):
         self.plot_window.show()
+        self.registry.pull(self)
 
     def process(self):
         raise NotImplementedError
@@ -390,75 +519,3 @@ class PlotBlock(Block):
 
     def setup_plot_parameters(self):
         pass
-
-
-class MplCanvas(FigureCanvasQTAgg):
-    """MatplotlibCanvas holding the figure object.
-
-    Attributes:
-        fig(:obj:`matplotlib.figure`): Matplotlib figure object.
-    """
-    def __init__(self, width=5, height=4, dpi=100):
-        """Initialize MplCanvas.
-
-        Args:
-            width: Width of the figure.
-            height: Height of the figure.
-            dpi: DPI of the figure.
-        """
-        self.fig = Figure(figsize=(width, height), dpi=dpi)
-        super(MplCanvas, self).__init__(self.fig)
-
-
-class PlotWindow(QtWidgets.QWidget):
-    """Qt widget containing the :obj:`matplotlib.figure`.
-
-    Attributes:
-        canvas: Matplotlib canvas containing the figure.
-        axes: Axes within the figure.
-    """
-    def __init__(self, rows, cols, **kwargs):
-        """Initialize PlotWindow.
-
-        Args:
-            rows (int): Number of cols in the figure.
-            cols (int): Number of cols in the figure.
-        """
-        super(PlotWindow, self).__init__(**kwargs)
-
-        self.canvas = MplCanvas(width=5, height=4, dpi=100)
-
-        toolbar = NavigationToolbar(self.canvas, parent=self)
-        layout = QtWidgets.QVBoxLayout()
-        layout.addWidget(toolbar)
-        layout.addWidget(self.canvas)
-
-        widget = QtWidgets.QWidget()
-        widget.setLayout(layout)
-        self.setLayout(QtWidgets.QVBoxLayout())
-        self.layout().addWidget(widget)
-        self.axes = self.canvas.fig.subplots(nrows=rows, ncols=cols)
-
-    def paintEvent(self, event):
-        # Get colors depending on the style
-        fig_colour = self.palette().color(QtGui.QPalette.Base).name()
-        ax_colour = self.palette().color(QtGui.QPalette.Window).name()
-        grid_colour = self.palette().color(QtGui.QPalette.Text).name()
-        # Apply the colors to the figure and the axes
-        self.canvas.fig.set_facecolor(fig_colour)
-
-        try:
-            for ax in self.axes:
-                ax.set_facecolor(ax_colour)
-                ax.grid(color=grid_colour)
-                ax.tick_params(colors=grid_colour)
-                ax.xaxis.label.set_color(grid_colour)
-                ax.yaxis.label.set_color(grid_colour)
-        except TypeError:
-            self.axes.tick_params(colors=grid_colour)
-            self.axes.xaxis.label.set_color(grid_colour)
-            self.axes.yaxis.label.set_color(grid_colour)
-            self.axes.set_facecolor(ax_colour)
-            self.axes.grid(color=grid_colour)
-        self.canvas.draw()
-        super().paintEvent(event)
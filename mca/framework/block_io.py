@@ -1,7 +1,22 @@
+import itertools
 import logging
 import uuid
 
-from mca.framework import io_registry, data_types
+from mca.framework import cache, io_registry, data_types
+
+
+def _block_registry(block):
+    """Returns the registry of a block or the current registry if the block
+    is not bound to any registry.
+    """
+    registry = getattr(block, "registry", None)
+    if registry is None:
+        return io_registry.current_registry()
+    return registry
+
+
+# Versions of the data of the Outputs, unique across all Outputs
+_versions = itertools.count()
 
 
 class Input:
@@ -13,6 +28,7 @@ class Input:
     Attributes:
         name (str): Name of the Input.
         block (:class:`.Block`): Block to which the Input belongs to.
+        registry (:class:`.IORegistry`): Registry of the block.
         up_to_date (bool): Flag which indicates if the data of the Input is
             valid or needs to be updated.
     """
@@ -27,6 +43,7 @@ class Input:
         self.name = name
         self.up_to_date = True
         self.block = block
+        self.registry = _block_registry(block)
 
     def connect(self, output):
         """Connects the Input to an Output and triggers an update.
@@ -35,7 +52,7 @@ class Input:
             output (Output): Output to which the Input gets connected.
         """
         logging.info(f"Connecting {self.block}  to {output.block}")
-        io_registry.Registry.connect(output, self)
+        self.registry.connect(output, self)
 
     def disconnect(self):
         """Disconnects the Input from its Output if it is connected
@@ -44,7 +61,7 @@ class Input:
         if self.connected_output:
             logging.info(f"Disconnecting {self.block} from "
                          f"{self.connected_output.block}")
-        io_registry.Registry.disconnect_input(self)
+        self.registry.disconnect_input(self)
 
     @property
     def data(self):
@@ -65,14 +82,14 @@ class Input:
         Returns:
             output (Output): If the Input is connected, the output is returned.
         """
-        return io_registry.Registry.get_output(self)
+        return self.registry.get_output(self)
 
     def delete(self):
         """Removes itself from the registry and removes its reference of
         its block.
         """
         self.block = None
-        io_registry.Registry.remove_input(self)
+        self.registry.remove_input(self)
         logging.info(f"Deleting {self}")
 
 
@@ -85,9 +102,14 @@ class Output:
     Attributes:
         name (str): Name of the Output.
         block (:class:`.Block`): Block to which the Output belongs to.
+        registry (:class:`.IORegistry`): Registry of the block.
         up_to_date (bool): Flag which indicates if the data of the Output is
             valid or needs to be updated.
         data: Data which the Output contains.
+        version (int): Version of the data, which changes whenever new data
+                       is set. Blocks are skipped when the versions of
+                       their inputs did not change (see
+                       :attr:`.IORegistry.early_cutoff`).
         user_metadata_required (bool): True, if user_metadata is forced to be
                                        used to set the metadata for Output.
         use_process_abscissa_metadata (bool): Flag whether the process
@@ -97,6 +119,9 @@ class Output:
                                               ordinate metadata or the user
                                               metadata should be used.
         initial_metadata: MetaData of the attribute data.
+        pinned (bool): True, if the data of the Output should always be kept
+                       up-to-date even if no sink consumes it (see
+                       :attr:`.Block.is_sink`).
         id: Used to identify the Inputs which were connected to the Output
             after saving.
     """
@@ -115,8 +140,13 @@ class Output:
         """
         self.name = name
         self.block = block
+        self.registry = _block_registry(block)
         self.up_to_date = True
-        self.data = None
+        self._data = None
+        self._fingerprint = None
+        self.version = next(_versions)
+        self._metadata = None
+        self._process_metadata = None
         self.user_metadata_required = user_metadata_required
 
         if user_metadata_required:
@@ -132,9 +162,104 @@ class Output:
             self.user_metadata = initial_metadata
 
         self.process_metadata = None
+        self.pinned = False
 
         self.id = uuid.uuid4()
 
+    @property
+    def data(self):
+        """Get the data of the Output. If the block of the Output is stale,
+        it gets updated first (see :attr:`.IORegistry.lazy`).
+        """
+        if self.block is not None:
+            self.registry.pull(self.block)
+        return self._data
+
+    @data.setter
+    def data(self, value):
+        policy = self.registry.dtype_policy
+        if policy is not None:
+            value = data_types.apply_dtype_policy(value, policy,
+                                                  self._source_dtypes())
+        self._data = value
+        self._fingerprint = None
+        self.version = next(_versions)
+
+    def _source_dtypes(self):
+        """Returns the dtypes of the input signals of the block."""
+        if self.block is None:
+            return []
+        dtypes = []
+        for input_ in self.block.inputs:
+            output = input_.connected_output
+            if output is not None and \
+                    isinstance(output._data, data_types.Signal) and \
+                    output._data.ordinate is not None:
+                dtypes.append(output._data.ordinate.dtype)
+        return dtypes
+
+    @property
+    def fingerprint(self):
+        """Get the fingerprint of the data (see :func:`.cache.fingerprint`).
+        The fingerprint is computed once for each new data.
+
+        Blocks can set a cheaper fingerprint after setting the data, e.g.
+        loaders use the fingerprint of the loaded file
+        (see :func:`.cache.file_fingerprint`).
+        """
+        data = self.data
+        if self._fingerprint is None:
+            self._fingerprint = cache.fingerprint(data)
+        return self._fingerprint
+
+    @fingerprint.setter
+    def fingerprint(self, value):
+        self._fingerprint = value
+
+    @property
+    def user_metadata(self):
+        """Get or set the metadata of the Output given by the user."""
+        return self._user_metadata
+
+    @user_metadata.setter
+    def user_metadata(self, value):
+        self._user_metadata = value
+        self._metadata = None
+
+    @property
+    def process_metadata(self):
+        """Get or set the metadata calculated in the process method of the
+        block.
+        """
+        return self._process_metadata
+
+    @process_metadata.setter
+    def process_metadata(self, value):
+        # Blocks often pass on the unchanged metadata of their input
+        if value is not self._process_metadata:
+            self._process_metadata = value
+            self._metadata = None
+
+    @property
+    def use_process_abscissa_metadata(self):
+        """Get or set whether the process abscissa metadata is used."""
+        return self._use_process_abscissa_metadata
+
+    @use_process_abscissa_metadata.setter
+    def use_process_abscissa_metadata(self, value):
+        self._use_process_abscissa_metadata = value
+        self._metadata = None
+
+    @property
+    def use_process_ordinate_metadata(self):
+        """Get or set whether the process ordinate metadata is used."""
+        return self._use_process_ordinate_metadata
+
+    @use_process_ordinate_metadata.setter
+    def use_process_ordinate_metadata(self, value):
+        self._use_process_ordinate_metadata = value
+        self._metadata = None
+
     @property
     def metadata(self):
         """Get the currently used metadata of the Output.
@@ -151,7 +276,19 @@ class Output:
         returned.
 
         The name of the user_metadata is taken by default.
+
+        The composed metadata is cached until the user or process metadata or
+        one of the flags changes. Since :class:`.MetaData` is immutable, the
+        cached metadata can be shared with its consumers.
         """
+        if self.block is not None:
+            self.registry.pull(self.block)
+        if self._metadata is None:
+            self._metadata = self._compose_metadata()
+        return self._metadata
+
+    def _compose_metadata(self):
+        """Composes the metadata of the user and process metadata."""
         if self.use_process_abscissa_metadata and self.process_metadata is not None:
             unit_a = self.process_metadata.unit_a
             symbol_a = ""
@@ -187,12 +324,12 @@ class Output:
     def disconnect(self):
         """Disconnects itself from all Inputs."""
         logging.info(f"Disconnecting {self.block} from all inputs.")
-        io_registry.Registry.disconnect_output(self)
+        self.registry.disconnect_output(self)
 
     def delete(self):
         """Removes itself from the registry and removes its reference of
         its block.
         """
         self.block = None
-        io_registry.Registry.remove_output(self)
+        self.registry.remove_output(self)
         logging.info(f"Deleting {self}")
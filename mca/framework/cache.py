@@ -0,0 +1,470 @@
+"""Memoization of block results.
+
+A cache maps a key, which is computed from the class, the parameter values
+and the fingerprints of the input data of a block, to the data and metadata
+the block has produced for its outputs. If a block gets updated with the same
+key again, its outputs are restored from the cache instead of processing the
+block.
+"""
+import collections
+import hashlib
+import json
+import os
+import pickle
+import shutil
+import sys
+import tempfile
+import threading
+
+import appdirs
+import numpy as np
+
+from mca.framework import data_types, parameters
+
+
+def _digest(buffer):
+    """Returns the hex digest of a bytes-like object."""
+    return hashlib.blake2b(buffer, digest_size=16).hexdigest()
+
+
+def fingerprint(data):
+    """Computes a fingerprint which identifies the content of data.
+
+    Args:
+        data: Data of an :class:`.Output`.
+
+    Returns:
+        tuple: Fingerprint of the data or None, if the data cannot be
+               fingerprinted.
+    """
+    if isinstance(data, data_types.Signal) and \
+            isinstance(data.ordinate, np.ndarray) and \
+            not data.ordinate.dtype.hasobject:
+        ordinate = np.ascontiguousarray(data.ordinate)
+        return ("signal", data.abscissa_start, data.values, data.increment,
+                ordinate.dtype.str, ordinate.shape,
+                _digest(ordinate.view(np.uint8)))
+    try:
+        return "object", _digest(pickle.dumps(data))
+    except Exception:
+        return None
+
+
+def file_fingerprint(file_name, *args):
+    """Computes a fingerprint of data loaded from a file. The fingerprint
+    changes when the file gets modified, so the content of the file does not
+    need to be hashed.
+
+    Args:
+        file_name (str): Path of the file.
+        *args: Further values the loaded data depends on, e.g. parameters.
+
+    Returns:
+        tuple: Fingerprint of the data.
+    """
+    stat = os.stat(file_name)
+    return ("file", os.path.abspath(file_name), stat.st_mtime_ns,
+            stat.st_size) + args
+
+
+def metadata_fingerprint(metadata):
+    """Computes a fingerprint of :class:`.MetaData`."""
+    if metadata is None:
+        return None
+    return (metadata.name, repr(metadata.unit_a), repr(metadata.unit_o),
+            metadata.quantity_a, metadata.quantity_o, metadata.symbol_a,
+            metadata.symbol_o)
+
+
+def input_fingerprints(block):
+    """Computes the fingerprints of the data and metadata of all inputs of a
+    block.
+
+    Args:
+        block: Block to compute the fingerprints of.
+
+    Returns:
+        list: Fingerprints of the inputs or None, if any input cannot be
+              fingerprinted.
+    """
+    inputs = []
+    for input_ in block.inputs:
+        output = input_.connected_output
+        if output is None:
+            inputs.append(None)
+            continue
+        data_fingerprint = output.fingerprint
+        if data_fingerprint is None:
+            return None
+        inputs.append((data_fingerprint,
+                       metadata_fingerprint(output.metadata)))
+    return inputs
+
+
+def parameters_fingerprint(block):
+    """Computes a fingerprint of the parameter values of a block, e.g. for
+    loaders which fingerprint their outputs by the loaded file (see
+    :func:`.file_fingerprint`).
+    """
+    return repr(sorted(parameters.get_values(block.parameters).items()))
+
+
+def block_key(block):
+    """Computes the cache key of a block from its class, its parameter values,
+    the fingerprints of its inputs and the dtype policy of its registry (see
+    :attr:`.IORegistry.dtype_policy`), which determines the precision of the
+    stored results.
+
+    Args:
+        block: Block to compute the key of.
+
+    Returns:
+        str: Key of the block or None, if any input cannot be fingerprinted.
+    """
+    inputs = input_fingerprints(block)
+    if inputs is None:
+        return None
+    key = (type(block).__module__, type(block).__qualname__,
+           parameters_fingerprint(block), repr(inputs), len(block.outputs),
+           block.registry.dtype_policy)
+    return _digest(repr(key).encode())
+
+
+def data_size(data):
+    """Estimates the memory used by data in bytes. Ordinates which are
+    memory-mapped from a file (see :func:`.data_types.mapped_file`) are not
+    counted, since their pages can be dropped and read again.
+    """
+    if isinstance(data, data_types.Signal) and \
+            isinstance(data.ordinate, np.ndarray) and \
+            data_types.mapped_file(data.ordinate) is None:
+        return data.ordinate.nbytes + sys.getsizeof(data)
+    return sys.getsizeof(data)
+
+
+class Cache:
+    """Base class of caches for block results.
+
+    Attributes:
+        hits (int): Amount of updates served from the cache.
+        misses (int): Amount of updates which had to process the block.
+    """
+
+    def __init__(self):
+        """Initializes Cache."""
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        """Returns the entry of a key.
+
+        Args:
+            key (str): Key of the entry.
+
+        Returns:
+            list: Data and process metadata for each output or None, if the
+                  key is not cached.
+        """
+        raise NotImplementedError
+
+    def put(self, key, results):
+        """Stores the results of a block.
+
+        Args:
+            key (str): Key of the entry.
+            results (list): Data and process metadata for each output.
+        """
+        raise NotImplementedError
+
+    def clear(self):
+        """Removes all entries."""
+        raise NotImplementedError
+
+    def process(self, block):
+        """Processes a block or restores its outputs from the cache if it has
+        already been processed with the same parameters and inputs.
+
+        Args:
+            block: Block to process.
+        """
+        key = block_key(block)
+        if key is None:
+            block.process()
+            return
+        results = self.get(key)
+        if results is not None:
+            self.hits += 1
+            for output, (data, metadata) in zip(block.outputs, results):
+                output.data = data
+                output.process_metadata = metadata
+            return
+        self.misses += 1
+        block.process()
+        self.put(key, [(output.data, output.process_metadata)
+                       for output in block.outputs])
+
+
+class MemoryCache(Cache):
+    """Least recently used cache of block results held in memory.
+
+    Attributes:
+        max_bytes (int): Memory budget of the cache. The least recently used
+                         entries are evicted once the budget is exceeded.
+    """
+
+    def __init__(self, max_bytes=256 * 2 ** 20):
+        """Initializes MemoryCache.
+
+        Args:
+            max_bytes (int): Memory budget of the cache in bytes.
+        """
+        super().__init__()
+        self.max_bytes = max_bytes
+        self._entries = collections.OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    @property
+    def size(self):
+        """Gets the estimated memory used by the entries in bytes."""
+        return self._bytes
+
+    def get(self, key):
+        """Returns the entry of a key and marks it as recently used."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+            return entry[0]
+
+    def put(self, key, results):
+        """Stores the results of a block. Results which exceed the whole
+        budget are not stored.
+        """
+        size = sum(data_size(data) for data, metadata in results)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._bytes -= self._entries.pop(key)[1]
+            self._entries[key] = (results, size)
+            self._bytes += size
+            while self._bytes > self.max_bytes:
+                self._bytes -= self._entries.popitem(last=False)[1][1]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+
+def _metadata_to_json(metadata):
+    """Converts :class:`.MetaData` into a json serializable dict."""
+    if metadata is None:
+        return None
+    return {"signal_name": metadata.name,
+            "quantity_a": metadata.quantity_a,
+            "symbol_a": metadata.symbol_a,
+            "unit_a": repr(metadata.unit_a),
+            "fixed_unit_a": metadata.fixed_unit_a,
+            "quantity_o": metadata.quantity_o,
+            "symbol_o": metadata.symbol_o,
+            "unit_o": repr(metadata.unit_o),
+            "fixed_unit_o": metadata.fixed_unit_o}
+
+
+def _json_to_metadata(metadata):
+    """Restores :class:`.MetaData` converted by
+    :func:`._metadata_to_json`.
+    """
+    if metadata is None:
+        return None
+    return data_types.MetaData(metadata["signal_name"],
+                               metadata["unit_a"],
+                               metadata["unit_o"],
+                               metadata["quantity_a"],
+                               metadata["quantity_o"],
+                               metadata["symbol_a"],
+                               metadata["symbol_o"],
+                               metadata["fixed_unit_a"],
+                               metadata["fixed_unit_o"])
+
+
+class DiskCache(Cache):
+    """Persistent cache of block results. Each entry is a directory named
+    by its key, holding the ordinates as .npy files and the remaining data
+    and metadata as json. Only results consisting of :class:`.Signal`
+    objects or None are stored.
+
+    Attributes:
+        directory (str): Directory of the cache.
+        max_bytes (int): Disk budget of the cache. The least recently used
+                         entries are removed once the budget is exceeded.
+    """
+    entry_file = "entry.json"
+
+    def __init__(self, directory=None, max_bytes=2 ** 30):
+        """Initializes DiskCache.
+
+        Args:
+            directory (str): Directory of the cache. Defaults to the user
+                             cache directory of mca.
+            max_bytes (int): Disk budget of the cache in bytes.
+        """
+        super().__init__()
+        if directory is None:
+            directory = os.path.join(appdirs.user_cache_dir("mca"),
+                                     "results")
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        os.makedirs(self.directory, exist_ok=True)
+
+    def _entries(self):
+        """Returns the paths, sizes and last usage of all entries."""
+        entries = []
+        for entry in os.scandir(self.directory):
+            try:
+                files = list(os.scandir(entry.path))
+                used = os.stat(
+                    os.path.join(entry.path, self.entry_file)).st_mtime
+            except (NotADirectoryError, FileNotFoundError):
+                continue
+            size = sum(file.stat().st_size for file in files)
+            entries.append((used, entry.path, size))
+        return entries
+
+    @property
+    def size(self):
+        """Gets the disk space used by the entries in bytes."""
+        with self._lock:
+            return sum(size for used, path, size in self._entries())
+
+    def get(self, key):
+        """Returns the entry of a key and marks it as recently used."""
+        path = os.path.join(self.directory, key)
+        with self._lock:
+            try:
+                with open(os.path.join(path, self.entry_file)) as file:
+                    entry = json.load(file)
+                results = []
+                for index, output in enumerate(entry):
+                    data = None
+                    if output["data"] is not None:
+                        signal_class = data_types.Signal
+                        if output["data"].get("multi_channel"):
+                            signal_class = data_types.MultiChannelSignal
+                        data = signal_class(
+                            abscissa_start=output["data"]["abscissa_start"],
+                            values=output["data"]["values"],
+                            increment=output["data"]["increment"],
+                            ordinate=np.load(
+                                os.path.join(path, f"{index}.npy")))
+                    results.append(
+                        (data, _json_to_metadata(output["metadata"])))
+                os.utime(os.path.join(path, self.entry_file))
+            except (OSError, ValueError, KeyError):
+                return None
+        return results
+
+    def put(self, key, results):
+        """Stores the results of a block. Results which contain other data
+        than signals or exceed the whole budget are not stored.
+        """
+        entry = []
+        size = 0
+        for data, metadata in results:
+            if data is None:
+                entry.append({"data": None,
+                              "metadata": _metadata_to_json(metadata)})
+                continue
+            if not isinstance(data, data_types.Signal) or \
+                    not isinstance(data.ordinate, np.ndarray) or \
+                    data.ordinate.dtype.hasobject:
+                return
+            size += data.ordinate.nbytes
+            entry.append({"data": {"abscissa_start": data.abscissa_start,
+                                   "values": data.values,
+                                   "increment": data.increment,
+                                   "multi_channel": isinstance(
+                                       data, data_types.MultiChannelSignal)},
+                          "metadata": _metadata_to_json(metadata)})
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            path = os.path.join(self.directory, key)
+            if os.path.exists(path):
+                return
+            # Write into a temporary directory first, so incomplete entries
+            # are never visible
+            temp_path = tempfile.mkdtemp(dir=self.directory, prefix=".")
+            try:
+                for index, (data, metadata) in enumerate(results):
+                    if data is not None:
+                        np.save(os.path.join(temp_path, f"{index}.npy"),
+                                data.ordinate)
+                with open(os.path.join(temp_path, self.entry_file),
+                          "w") as file:
+                    json.dump(entry, file)
+                os.rename(temp_path, path)
+            except OSError:
+                shutil.rmtree(temp_path, ignore_errors=True)
+                return
+            self._evict()
+
+    def _evict(self):
+        """Removes the least recently used entries until the size of the
+        cache is within the budget.
+        """
+        entries = sorted(self._entries())
+        total = sum(size for used, path, size in entries)
+        for used, path, size in entries:
+            if total <= self.max_bytes:
+                break
+            shutil.rmtree(path, ignore_errors=True)
+            total -= size
+
+    def clear(self):
+        with self._lock:
+            for used, path, size in self._entries():
+                shutil.rmtree(path, ignore_errors=True)
+
+
+class TieredCache(Cache):
+    """Combines multiple caches, e.g. a fast :class:`.MemoryCache` in front
+    of a :class:`.DiskCache`. Entries found in a later cache are copied into
+    the earlier ones.
+
+    Attributes:
+        caches (list): Caches ordered from the fastest to the slowest.
+    """
+
+    def __init__(self, caches):
+        """Initializes TieredCache.
+
+        Args:
+            caches (list): Caches ordered from the fastest to the slowest.
+        """
+        super().__init__()
+        self.caches = caches
+
+    def get(self, key):
+        for index, cache in enumerate(self.caches):
+            results = cache.get(key)
+            if results is not None:
+                for faster_cache in self.caches[:index]:
+                    faster_cache.put(key, results)
+                return results
+        return None
+
+    def put(self, key, results):
+        for cache in self.caches:
+            cache.put(key, results)
+
+    def clear(self):
+        for cache in self.caches:
+            cache.clear()
@@ -0,0 +1,173 @@
+"""Catalog of the available blocks.
+
+The catalog describes each block by its name, tags and the path of its
+class without importing the module of the block. The module is imported
+once the block is first instantiated, so startup and loading a block
+structure only import the blocks which are actually used.
+
+Blocks of other packages are discovered through the entry point group
+``mca.blocks``. An entry point refers to a :class:`.BlockEntry`, an
+iterable of them or a block class, e.g. in the ``setup.py`` of a plugin:
+
+.. code-block:: python
+
+    entry_points={
+        "mca.blocks": ["my_blocks = my_blocks.catalog:entries"],
+    }
+
+with ``my_blocks/catalog.py``:
+
+.. code-block:: python
+
+    from mca.framework.catalog import BlockEntry
+
+    entries = [BlockEntry("my_blocks.filters:Smoother", "Smoother",
+                          ("Processing",))]
+"""
+import importlib
+import logging
+from importlib import metadata
+
+#: Entry point group of blocks of other packages
+ENTRY_POINT_GROUP = "mca.blocks"
+
+
+class BlockEntry:
+    """Description of a block class, which gets imported when the block is
+    first instantiated.
+
+    Calling the entry instantiates the block, so an entry can be used in
+    place of its block class.
+
+    Attributes:
+        path (str): Module and name of the class separated by a colon,
+                    e.g. ``"mca.blocks.amplifier:Amplifier"``.
+        name (str): Name of the block (see :attr:`.Block.name`).
+        tags (tuple): Tags of the block.
+        icon_file (str): Icon file of the block or None.
+    """
+
+    def __init__(self, path, name, tags=(), icon_file=None):
+        """Initializes BlockEntry.
+
+        Args:
+            path (str): Module and name of the class separated by a colon.
+            name (str): Name of the block.
+            tags: Tags of the block.
+            icon_file (str): Icon file of the block.
+        """
+        self.path = path
+        self.name = name
+        self.tags = tuple(tags)
+        self.icon_file = icon_file
+        self._block_class = None
+
+    @classmethod
+    def from_class(cls, block_class):
+        """Creates the entry of an already imported block class."""
+        entry = cls(f"{block_class.__module__}:{block_class.__qualname__}",
+                    block_class.name, block_class.tags,
+                    block_class.icon_file)
+        entry._block_class = block_class
+        return entry
+
+    @property
+    def class_string(self):
+        """Returns the string of the class written into save files (see
+        :func:`.save.blocks_to_json`).
+        """
+        module, name = self.path.split(":")
+        return f"<class '{module}.{name}'>"
+
+    def load(self):
+        """Imports and returns the block class."""
+        if self._block_class is None:
+            module, name = self.path.split(":")
+            self._block_class = getattr(importlib.import_module(module), name)
+        return self._block_class
+
+    def __call__(self, **kwargs):
+        """Instantiates the block."""
+        return self.load()(**kwargs)
+
+    def __repr__(self):
+        return f"BlockEntry({self.path!r})"
+
+
+class Catalog:
+    """Collection of :class:`.BlockEntry`. The entry points of other
+    packages are discovered on first access of the entries.
+    """
+
+    def __init__(self, entries=(), group=ENTRY_POINT_GROUP):
+        """Initializes Catalog.
+
+        Args:
+            entries: Entries of the built-in blocks.
+            group (str): Entry point group of blocks of other packages or
+                         None, to disable the discovery.
+        """
+        self._entries = {}
+        self._group = group
+        for entry in entries:
+            self.add(entry)
+
+    def add(self, entry):
+        """Adds a :class:`.BlockEntry` or a block class to the catalog."""
+        if not isinstance(entry, BlockEntry):
+            entry = BlockEntry.from_class(entry)
+        self._entries[entry.class_string] = entry
+
+    def discover(self):
+        """Adds the blocks of the entry points of other packages. Entry
+        points which cannot be loaded are logged and skipped.
+        """
+        group, self._group = self._group, None
+        if group is None:
+            return
+        entry_points = metadata.entry_points()
+        if hasattr(entry_points, "select"):
+            entry_points = entry_points.select(group=group)
+        else:
+            entry_points = entry_points.get(group, [])
+        for entry_point in entry_points:
+            try:
+                loaded = entry_point.load()
+                if isinstance(loaded, (BlockEntry, type)):
+                    loaded = [loaded]
+                for entry in loaded:
+                    self.add(entry)
+            except Exception as error:
+                logging.error(f"Could not load blocks of {entry_point}: "
+                              f"{error!r}")
+
+    @property
+    def entries(self):
+        """Returns all entries sorted by the names of the blocks."""
+        self.discover()
+        return sorted(self._entries.values(), key=lambda entry: entry.name)
+
+    @property
+    def tags(self):
+        """Returns the sorted tags of all blocks."""
+        return sorted({tag for entry in self.entries for tag in entry.tags})
+
+    @property
+    def tag_dict(self):
+        """Returns a dict which maps each tag to the entries of the blocks
+        with the tag.
+        """
+        entries = self.entries
+        return {tag: [entry for entry in entries if tag in entry.tags]
+                for tag in self.tags}
+
+    def get(self, class_string):
+        """Returns the entry of the block class with the given string as
+        written into save files (see :attr:`.BlockEntry.class_string`).
+
+        Raises:
+            KeyError: If the block is not part of the catalog.
+        """
+        if class_string not in self._entries:
+            self.discover()
+        return self._entries[class_string]
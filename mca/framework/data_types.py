@@ -1,7 +1,14 @@
+import copyreg
+import functools
+import mmap
+import struct
+import zipfile
+
 from dsch import schema
 import numpy as np
-from united import Unit
+from united import Unit, united
 
+from mca import exceptions
 from mca.language import _
 
 
@@ -13,13 +20,23 @@ class Signal:
     data type only allows equidistant sampled signals the abscissa is described
     with three parameters: starting point (abscissa_start), amount of values
     (values) and the sampling increment (increment).
+
+    Signal is immutable and its ordinate is a read-only view, so a signal can
+    be passed to any amount of blocks without copying. Blocks which need to
+    modify the data use :meth:`.ordinate_copy` and :meth:`.replace`.
+
+    The ordinate may be memory-mapped from a file (see :func:`.mapped_file`),
+    e.g. by loaders. Blocks which only select values like the Cutter keep
+    views of the file, so only the pages of the values which are processed
+    are read.
     
     Attributes:
         abscissa_start (float): Starting point of the signal.
         values (int): Amount of values the signal contains.
         increment (float): Increment between two values.
-        ordinate : Ordinate as a :py:class:`numpy.ndarray` .
+        ordinate : Ordinate as a read-only :py:class:`numpy.ndarray` .
     """
+    __slots__ = ("abscissa_start", "values", "increment", "ordinate")
 
     def __init__(self, abscissa_start, values, increment, ordinate):
         """Initializes Signal.
@@ -30,10 +47,50 @@ class Signal:
             increment (float): Increment between two values.
             ordinate : Ordinate stored in a numpy_array.
         """
-        self.abscissa_start = abscissa_start
-        self.values = values
-        self.increment = increment
-        self.ordinate = ordinate
+        if ordinate is not None:
+            ordinate = np.asarray(ordinate)
+            if ordinate.flags.writeable:
+                ordinate = ordinate.view()
+                ordinate.setflags(write=False)
+        _set_abscissa_start(self, abscissa_start)
+        _set_values(self, values)
+        _set_increment(self, increment)
+        _set_ordinate(self, ordinate)
+
+    def __setattr__(self, key, value):
+        raise AttributeError(f"Signal is immutable, use replace() to change "
+                             f"'{key}'")
+
+    def __delattr__(self, key):
+        raise AttributeError("Signal is immutable")
+
+    def __reduce__(self):
+        return self.__class__, (self.abscissa_start, self.values,
+                                self.increment, self.ordinate)
+
+    def replace(self, **changes):
+        """Returns a signal with the given attributes changed. Attributes
+        which are not changed are shared with this signal, the ordinate is
+        not copied.
+
+        Example:
+            >>> real_signal = signal.replace(ordinate=signal.ordinate.real)
+        """
+        attributes = {"abscissa_start": self.abscissa_start,
+                      "values": self.values,
+                      "increment": self.increment,
+                      "ordinate": self.ordinate}
+        unknown = set(changes) - set(attributes)
+        if unknown:
+            raise TypeError(f"Signal has no attributes {sorted(unknown)}")
+        attributes.update(changes)
+        return self.__class__(**attributes)
+
+    def ordinate_copy(self):
+        """Returns a writable copy of the ordinate, which can be modified
+        and passed to a new signal.
+        """
+        return np.array(self.ordinate)
 
     def __eq__(self, other):
         """Defines equality of two Signal objects."""
@@ -50,6 +107,228 @@ class Signal:
         return True
 
 
+# Setters of the slots, which bypass the immutability of Signal
+_set_abscissa_start = Signal.abscissa_start.__set__
+_set_values = Signal.values.__set__
+_set_increment = Signal.increment.__set__
+_set_ordinate = Signal.ordinate.__set__
+
+
+class MultiChannelSignal(Signal):
+    """Signal with several channels which share one abscissa.
+
+    The ordinate is a two dimensional numpy array of the shape
+    (channels, values). Blocks which support multi-channel signals (see
+    :attr:`.Block.multi_channel`) process all channels at once along the last
+    axis, so a single chain of blocks replaces a chain for each channel.
+    Other blocks reject multi-channel signals, :meth:`.channel` or the
+    :class:`.ChannelSelector` block extract a single channel.
+
+    Attributes:
+        abscissa_start (float): Starting point of the signal.
+        values (int): Amount of values of each channel.
+        increment (float): Increment between two values.
+        ordinate : Ordinate as a read-only :py:class:`numpy.ndarray` of the
+                   shape (channels, values).
+    """
+    __slots__ = ()
+
+    def __init__(self, abscissa_start, values, increment, ordinate):
+        """Initializes MultiChannelSignal.
+
+        Args:
+            abscissa_start (float): Starting point of the signal.
+            values (int): Amount of values of each channel.
+            increment (float): Increment between two values.
+            ordinate : Ordinate of the shape (channels, values).
+
+        Raises:
+            :class:`.DataTypeError`: If the ordinate is not two dimensional.
+        """
+        ordinate = np.asarray(ordinate)
+        if ordinate.ndim != 2:
+            raise exceptions.DataTypeError(
+                "The ordinate of a multi-channel signal needs the shape "
+                "(channels, values)")
+        super().__init__(abscissa_start, values, increment, ordinate)
+
+    @classmethod
+    def from_signals(cls, signals):
+        """Combines signals with the same abscissa into the channels of a
+        multi-channel signal. Multi-channel signals contribute all their
+        channels.
+
+        Raises:
+            :class:`.IntervalError`: If the abscissas of the signals differ.
+        """
+        first = signals[0]
+        for signal in signals:
+            if (signal.abscissa_start, signal.values, signal.increment) != \
+                    (first.abscissa_start, first.values, first.increment):
+                raise exceptions.IntervalError(
+                    "The channels of a multi-channel signal need the same "
+                    "abscissa.")
+        ordinate = np.concatenate(
+            [np.atleast_2d(signal.ordinate) for signal in signals])
+        return cls(first.abscissa_start, first.values, first.increment,
+                   ordinate)
+
+    @property
+    def channels(self):
+        """Returns the amount of channels."""
+        return self.ordinate.shape[0]
+
+    def channel(self, index):
+        """Returns the channel with the given index as :class:`.Signal`."""
+        return Signal(self.abscissa_start, self.values, self.increment,
+                      self.ordinate[index])
+
+
+#: Dtype policies of the registry (see :attr:`.IORegistry.dtype_policy`)
+DTYPE_POLICIES = (None, "preserve", "float32", "float64")
+
+
+def working_dtype(dtype, policy="preserve"):
+    """Returns the floating point dtype in which data of the given dtype is
+    processed and stored under a dtype policy.
+
+    - None: Integers are processed as float64, floating point and complex
+      data keeps its dtype. This is the behaviour of numpy.
+    - "preserve": Like None, but integers of up to 16 bit, e.g. audio data,
+      are processed as float32, which represents them exactly.
+    - "float32" or "float64": Floating point data is processed in the given
+      precision, complex data in the according complex precision.
+
+    Args:
+        dtype: Dtype of the data.
+        policy (str): One of :data:`.DTYPE_POLICIES`.
+
+    Raises:
+        ValueError: If the policy is unknown.
+    """
+    if policy not in DTYPE_POLICIES:
+        raise ValueError(f"Unknown dtype policy {policy!r}")
+    dtype = np.dtype(dtype)
+    if policy in ("float32", "float64"):
+        precision = np.dtype(policy)
+    elif dtype.kind in "fc":
+        return dtype
+    elif policy == "preserve" and dtype.itemsize <= 2:
+        precision = np.dtype(np.float32)
+    else:
+        precision = np.dtype(np.float64)
+    if dtype.kind == "c":
+        return np.result_type(precision, np.complex64)
+    return precision
+
+
+def apply_dtype_policy(signal, policy, source_dtypes=()):
+    """Converts the ordinate of a signal produced by a block according to a
+    dtype policy (see :func:`.working_dtype`). Integer ordinates, e.g.
+    loaded int16 audio data, are passed through unchanged.
+
+    With the "preserve" policy floating point results are narrowed to the
+    precision of the source data the block processed, so blocks which
+    compute in float64 internally do not widen float32 or int16 data. The
+    ordinate is never widened. Signals of blocks without input signals,
+    e.g. generators, keep their dtype. With "float32" or "float64" floating
+    point results, including generated signals, are converted to the given
+    precision.
+
+    Args:
+        signal: Data produced by a block. Other data than signals is
+                returned unchanged.
+        policy (str): One of :data:`.DTYPE_POLICIES`.
+        source_dtypes: Dtypes of the ordinates of the input signals of the
+                       block.
+
+    Returns:
+        Signal with the converted ordinate or the unchanged signal.
+    """
+    if policy is None or not isinstance(signal, Signal) or \
+            signal.ordinate is None:
+        return signal
+    dtype = signal.ordinate.dtype
+    if dtype.kind not in "fc":
+        return signal
+    if policy == "preserve":
+        precisions = [np.finfo(working_dtype(source, policy)).dtype
+                      for source in source_dtypes
+                      if np.dtype(source).kind in "biufc"]
+        if not precisions:
+            return signal
+        target = np.result_type(*precisions)
+        if dtype.kind == "c":
+            target = np.result_type(target, np.complex64)
+        if target.itemsize >= dtype.itemsize:
+            return signal
+    else:
+        target = working_dtype(dtype, policy)
+    if target == dtype:
+        return signal
+    return signal.replace(ordinate=signal.ordinate.astype(target))
+
+
+def mapped_file(array):
+    """Returns the file an array is memory-mapped from, i.e. if it is a
+    view of a :class:`numpy.memmap` of a file. Only the pages of the file
+    which are accessed are read into memory.
+
+    Returns:
+        tuple: Path of the file and the offset of the first value of the
+               array in the file in bytes or None, if the array is not
+               memory-mapped from a file.
+    """
+    # Views of a memmap are memmaps as well, the memmap which maps the file
+    # is the one based on the mmap
+    base = array
+    while isinstance(base, np.ndarray) and not (
+            isinstance(base, np.memmap) and isinstance(base.base, mmap.mmap)):
+        base = base.base
+    if not isinstance(base, np.memmap) or base.filename is None:
+        return None
+    offset = array.__array_interface__["data"][0] - \
+        base.__array_interface__["data"][0] + base.offset
+    return base.filename, offset
+
+
+def memory_map_npz(file_name, key):
+    """Maps an array of a .npz file read-only into memory, so it is not read
+    until it is accessed.
+
+    Args:
+        file_name (str): Path of the .npz file.
+        key (str): Name of the array in the file.
+
+    Returns:
+        numpy.memmap: The array or None, if the array is compressed or
+                      contains objects, which cannot be mapped.
+    """
+    with zipfile.ZipFile(file_name) as archive:
+        info = archive.getinfo(key + ".npy")
+        if info.compress_type != zipfile.ZIP_STORED:
+            return None
+        with archive.open(info) as member:
+            version = np.lib.format.read_magic(member)
+            if version == (1, 0):
+                header = np.lib.format.read_array_header_1_0(member)
+            else:
+                header = np.lib.format.read_array_header_2_0(member)
+            header_size = member.tell()
+    shape, fortran_order, dtype = header
+    if dtype.hasobject:
+        return None
+    # The data of a member follows its local file header in the archive
+    with open(file_name, "rb") as file:
+        file.seek(info.header_offset)
+        local_header = file.read(30)
+    name_length, extra_length = struct.unpack("<HH", local_header[26:30])
+    offset = info.header_offset + 30 + name_length + extra_length + \
+        header_size
+    return np.memmap(file_name, dtype=dtype, mode="r", offset=offset,
+                     shape=shape, order="F" if fortran_order else "C")
+
+
 # Dsch schema to save and load signals
 signal_schema = schema.Compilation({
     "signal": schema.Compilation(
@@ -76,6 +355,9 @@ signal_schema = schema.Compilation({
 class MetaData:
     """Metadata class for the :class:`.Signal` class.
 
+    MetaData is immutable, so it can be shared between Outputs and cached.
+    Use :meth:`.replace` to derive metadata with changed attributes.
+
     Attributes:
         name (str): Name of the Signal.
         unit_a (Unit): Unit for the abscissa.
@@ -108,55 +390,51 @@ class MetaData:
                                  string.
         """
         self.name = name
-        if isinstance(unit_a, Unit):
-            self._unit_a = unit_a
-        elif isinstance(unit_a, str):
-            self._unit_a = string_to_unit(unit_a, fixed_unit_a)
-        if isinstance(unit_o, Unit):
-            self._unit_o = unit_o
-        elif isinstance(unit_o, str):
-            self._unit_o = string_to_unit(unit_o, fixed_unit_o)
-
-        self.quantity_a = quantity_a
-        if not self.quantity_a:
-            self.quantity_a = _(self.unit_a.quantity)
-
-        self.quantity_o = quantity_o
-        if not self.quantity_o:
-            self.quantity_o = _(self.unit_o.quantity)
+        if isinstance(unit_a, str):
+            unit_a = string_to_unit(unit_a, fixed_unit_a)
+        self.unit_a = unit_a
+        if isinstance(unit_o, str):
+            unit_o = string_to_unit(unit_o, fixed_unit_o)
+        self.unit_o = unit_o
+
+        self.quantity_a = quantity_a or _(self.unit_a.quantity)
+        self.quantity_o = quantity_o or _(self.unit_o.quantity)
 
         self.symbol_a = symbol_a
         self.symbol_o = symbol_o
         self.fixed_unit_a = fixed_unit_a
         self.fixed_unit_o = fixed_unit_o
+        self._frozen = True
 
-    @property
-    def unit_a(self):
-        """Gets or sets the abscissa unit. Either a string or a Unit can be
-        handed over.
-        """
-        return self._unit_a
+    def __setattr__(self, key, value):
+        if getattr(self, "_frozen", False):
+            raise AttributeError(f"MetaData is immutable, use replace() to "
+                                 f"change '{key}'")
+        object.__setattr__(self, key, value)
 
-    @unit_a.setter
-    def unit_a(self, value):
-        if isinstance(value, Unit):
-            self._unit_a = value
-        elif isinstance(value, str):
-            self._unit_a = string_to_unit(value, fixed_unit=self.fixed_unit_a)
+    def replace(self, **changes):
+        """Returns a copy of the metadata with the given attributes changed.
 
-    @property
-    def unit_o(self):
-        """Gets or sets the ordinate unit. Either a string or a Unit can be
-        handed over.
-        """
-        return self._unit_o
+        Units can be given as string or Unit. The quantities are kept unless
+        they are changed as well.
 
-    @unit_o.setter
-    def unit_o(self, value):
-        if isinstance(value, Unit):
-            self._unit_o = value
-        elif isinstance(value, str):
-            self._unit_o = string_to_unit(value, fixed_unit=self.fixed_unit_a)
+        Example:
+            >>> metadata = metadata.replace(name="Signal", unit_a="ms")
+        """
+        attributes = {"name": self.name,
+                      "unit_a": self.unit_a,
+                      "unit_o": self.unit_o,
+                      "quantity_a": self.quantity_a,
+                      "quantity_o": self.quantity_o,
+                      "symbol_a": self.symbol_a,
+                      "symbol_o": self.symbol_o,
+                      "fixed_unit_a": self.fixed_unit_a,
+                      "fixed_unit_o": self.fixed_unit_o}
+        unknown = set(changes) - set(attributes)
+        if unknown:
+            raise TypeError(f"MetaData has no attributes {sorted(unknown)}")
+        attributes.update(changes)
+        return MetaData(**attributes)
 
     def __eq__(self, other):
         """Defines equality of two Metadata objects."""
@@ -176,10 +454,18 @@ class MetaData:
             return False
         return True
 
+    def __hash__(self):
+        # Equal units can have different representations, so they are left
+        # out of the hash
+        return hash((self.quantity_a, self.symbol_a, self.quantity_o,
+                     self.symbol_o))
+
 
+@functools.lru_cache(maxsize=1024)
 def string_to_unit(string, fixed_unit=False):
     """Converts a string fraction to an Unit object. The string has to be
-    in a certain format.
+    in a certain format. The results are memoized, the returned Unit is
+    shared and must not be modified.
 
     Example:
          >>> string_1 = "(V*s)/(A*C)"
@@ -218,3 +504,21 @@ def default_metadata():
         fixed_unit_o=True,
         fixed_unit_a=True
     )
+
+
+def _named_unit(key):
+    """Returns the SI unit of united with the given key."""
+    return united.si_units[key]
+
+
+def _reduce_named_unit(named_unit):
+    """Pickles SI units of united by reference since units are compared by
+    identity.
+    """
+    for key, si_unit in united.si_units.items():
+        if named_unit is si_unit:
+            return _named_unit, (key,)
+    return united.NamedUnit, (named_unit.unit, named_unit.quantity)
+
+
+copyreg.pickle(united.NamedUnit, _reduce_named_unit)
@@ -0,0 +1,120 @@
+"""Compiled execution plans for running a fixed block structure repeatedly.
+
+:meth:`.IORegistry.compile` freezes the blocks of a registry into an
+:class:`.ExecutionPlan`, a flat list of the bound process methods of the
+blocks in topological order. Running the plan processes the blocks one after
+another on the calling thread. The scheduling, invalidation, caching and
+early cutoff of the registry are skipped, which leaves the processing of
+the blocks as the only work per run.
+
+New source data is fed into the plan through the Outputs given when
+compiling it, e.g. the output of a loader. Blocks which neither depend on
+the fed Outputs nor have side effects are constant, they are only processed
+in the first run.
+
+Example:
+    >>> plan = io_registry.Registry.compile(feeds=[loader.outputs[0]])
+    >>> for signal in signals:
+    ...     plan.run({loader.outputs[0]: signal})
+    ...     results.append(amplifier.outputs[0].data)
+"""
+from mca import exceptions
+
+
+class ExecutionPlan:
+    """Blocks of a registry frozen into a topologically ordered list of
+    steps. The plan has to be compiled again after the structure or the
+    blocks changed, i.e. after any update of the registry.
+
+    Attributes:
+        registry (:class:`.IORegistry`): Registry the plan was compiled
+                                         from.
+        blocks (list): All blocks of the plan in topological order.
+        feeds (tuple): Outputs whose data is given to :meth:`.run`. Their
+                       blocks are not processed by the plan.
+        steps (list): Tuples of the block and its bound process method for
+                      each block which is processed in every run.
+        constants (list): Tuples like in :attr:`.steps` of the blocks which
+                          are only processed in the first run.
+        generation (int): :attr:`.IORegistry.generation` at the time the
+                          plan was compiled.
+    """
+
+    def __init__(self, registry, blocks, dependencies, feeds=()):
+        """Initializes ExecutionPlan.
+
+        Args:
+            registry: Registry the plan is compiled from.
+            blocks: Blocks in topological order.
+            dependencies (dict): Maps each block to the blocks of the plan
+                                 it directly depends on.
+            feeds: Outputs whose data is given to :meth:`.run`.
+        """
+        self.registry = registry
+        self.blocks = list(blocks)
+        self.feeds = tuple(feeds)
+        self.generation = registry.generation
+        fed = dict.fromkeys(output.block for output in self.feeds)
+        self._fed_blocks = list(fed)
+        varying = set(fed)
+        self.steps = []
+        self.constants = []
+        # The first run processes all blocks in topological order
+        self._first_steps = []
+        for block in self.blocks:
+            if block in fed:
+                continue
+            step = (block, block.process)
+            self._first_steps.append(step)
+            if block.side_effects or any(
+                    dependency in varying
+                    for dependency in dependencies[block]):
+                varying.add(block)
+                self.steps.append(step)
+            else:
+                self.constants.append(step)
+
+    def run(self, data=None):
+        """Processes the blocks of the plan with new data of the fed
+        Outputs.
+
+        Args:
+            data (dict): Maps fed Outputs to their new data. Outputs which
+                         are not given keep their data.
+
+        Returns:
+            int: Number of blocks which processed their data.
+
+        Raises:
+            :class:`.ExecutionPlanError`: If the registry changed since the
+                                          plan was compiled or data is given
+                                          for an Output which is not fed.
+        """
+        if self.registry.generation != self.generation:
+            raise exceptions.ExecutionPlanError(
+                "The blocks changed since the plan was compiled")
+        if data:
+            for output, value in data.items():
+                if output not in self.feeds:
+                    raise exceptions.ExecutionPlanError(
+                        f"{output} is not fed into the plan")
+                output.data = value
+        steps = self._first_steps if self._first_steps else self.steps
+        blocks = [block for block, process in steps]
+        # Consumers must not pull the fed blocks or the blocks which are
+        # about to be processed
+        self.registry._mark_processed(self._fed_blocks + blocks)
+        profiler = self.registry.profiler
+        index = 0
+        try:
+            for index, (block, process) in enumerate(steps):
+                if profiler is None:
+                    process()
+                else:
+                    with profiler.record(block):
+                        process()
+        except BaseException:
+            self.registry._mark_stale(blocks[index:])
+            raise
+        self._first_steps = None
+        return len(steps)
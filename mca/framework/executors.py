@@ -0,0 +1,493 @@
+"""Executors which run the block updates scheduled by the
+:class:`.IORegistry`.
+
+An executor receives the affected blocks in topological order together with
+the blocks each of them depends on. It has to make sure a block is only
+updated after all blocks it depends on have been updated.
+"""
+import concurrent.futures
+import ctypes
+import multiprocessing
+import os
+import threading
+import weakref
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from mca.framework import block_io, data_types, io_registry, parameters
+
+
+class CancellationToken:
+    """Token to cooperatively cancel an update. Executors stop to start
+    updating further blocks once the token has been cancelled, blocks which
+    are already processing are finished.
+    """
+
+    def __init__(self):
+        """Initializes CancellationToken."""
+        self._event = threading.Event()
+
+    def cancel(self):
+        """Requests the cancellation of the update."""
+        self._event.set()
+
+    @property
+    def cancelled(self):
+        """Gets whether the cancellation has been requested."""
+        return self._event.is_set()
+
+
+class SerialExecutor:
+    """Updates blocks one after another on the calling thread."""
+
+    def run(self, blocks, dependencies, update, token=None):
+        """Updates the given blocks in their topological order.
+
+        Args:
+            blocks (list): Blocks in topological order.
+            dependencies (dict): Maps every block to the set of blocks it
+                                 depends on.
+            update: Function which updates a single block and returns
+                    whether the block processed its data.
+            token (CancellationToken): Token to cancel the update of the
+                                       remaining blocks.
+
+        Returns:
+            int: Number of blocks which processed their data.
+        """
+        processed = 0
+        for block in blocks:
+            if token is not None and token.cancelled:
+                break
+            if update(block):
+                processed += 1
+        return processed
+
+    def shutdown(self):
+        """Releases resources held by the executor."""
+        pass
+
+
+class PoolExecutor:
+    """Base class for executors which update blocks concurrently on a pool.
+    A block gets submitted as soon as all blocks it depends on have been
+    updated. Blocks which cannot be submitted to the pool are updated on the
+    calling thread.
+
+    Attributes:
+        max_workers (int): Maximum amount of workers of the pool.
+    """
+
+    def __init__(self, max_workers=None):
+        """Initializes PoolExecutor.
+
+        Args:
+            max_workers (int): Maximum amount of workers of the pool.
+                               Defaults to the amount of CPUs.
+        """
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self._pool = None
+        self._lock = threading.Lock()
+
+    @property
+    def pool(self):
+        """Gets the pool which gets created on first use."""
+        with self._lock:
+            if self._pool is None:
+                self._pool = self._create_pool()
+            return self._pool
+
+    def _create_pool(self):
+        """Creates the :class:`concurrent.futures.Executor` of the
+        executor.
+        """
+        raise NotImplementedError
+
+    def _submit(self, block, update):
+        """Submits the update of a block to the pool.
+
+        Args:
+            block: Block to update.
+            update: Function which updates a single block.
+
+        Returns:
+            The future of the submitted update or None, if the block has to
+            be updated on the calling thread.
+        """
+        raise NotImplementedError
+
+    def _complete(self, block, future, update):
+        """Finishes the update of a block submitted to the pool.
+
+        Args:
+            block: Block which has been submitted.
+            future: Future returned by :meth:`._submit`.
+            update: Function which updates a single block.
+
+        Returns:
+            bool: True, if the block processed its data.
+        """
+        raise NotImplementedError
+
+    def run(self, blocks, dependencies, update, token=None):
+        """Updates the given blocks as soon as all blocks they depend on
+        have been updated.
+
+        Args:
+            blocks (list): Blocks in topological order.
+            dependencies (dict): Maps every block to the set of blocks it
+                                 depends on.
+            update: Function which updates a single block and returns
+                    whether the block processed its data.
+            token (CancellationToken): Token to cancel the update of the
+                                       remaining blocks. Blocks which have
+                                       already been submitted are finished.
+
+        Returns:
+            int: Number of blocks which processed their data.
+
+        Raises:
+            Exception: The first exception raised by a block. Blocks which
+                       have already been submitted are finished before the
+                       exception gets raised.
+        """
+        remaining = {block: set(dependencies[block]) for block in blocks}
+        dependents = {block: [] for block in blocks}
+        for block in blocks:
+            for dependency in remaining[block]:
+                dependents[dependency].append(block)
+        ready = [block for block in blocks if not remaining[block]]
+        running = {}
+        processed = 0
+        error = None
+
+        def finish(block):
+            for dependent in dependents[block]:
+                remaining[dependent].discard(block)
+                if not remaining[dependent]:
+                    ready.append(dependent)
+
+        while ready or running:
+            if token is not None and token.cancelled:
+                ready.clear()
+            while ready and error is None:
+                block = ready.pop(0)
+                future = None
+                # Avoid the pool overhead when there is nothing to
+                # parallelize
+                if ready or running:
+                    future = self._submit(block, update)
+                if future is not None:
+                    running[future] = block
+                    continue
+                try:
+                    processed += update(block)
+                except Exception as e:
+                    error = e
+                else:
+                    finish(block)
+            if not running:
+                break
+            done, _ = concurrent.futures.wait(
+                running, return_when=concurrent.futures.FIRST_COMPLETED)
+            for future in done:
+                block = running.pop(future)
+                try:
+                    processed += self._complete(block, future, update)
+                except Exception as e:
+                    if error is None:
+                        error = e
+                else:
+                    finish(block)
+        if error is not None:
+            raise error
+        return processed
+
+    def shutdown(self):
+        """Shuts down the pool."""
+        with self._lock:
+            if self._pool is not None:
+                self._pool.shutdown()
+                self._pool = None
+
+
+class ThreadExecutor(PoolExecutor):
+    """Updates blocks concurrently on a thread pool. Blocks which are not
+    thread safe (see :attr:`.Block.thread_safe`) are updated on the calling
+    thread.
+
+    Most numpy and scipy kernels release the GIL, so independent branches of
+    the block structure run in parallel.
+    """
+
+    def _create_pool(self):
+        return concurrent.futures.ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="mca-executor")
+
+    def _submit(self, block, update):
+        if not block.thread_safe:
+            return None
+        return self.pool.submit(update, block)
+
+    def _complete(self, block, future, update):
+        return future.result()
+
+
+class ProcessExecutor(PoolExecutor):
+    """Updates blocks concurrently on a process pool. Only blocks which
+    declare to be safe to run out-of-process (see
+    :attr:`.Block.process_safe`) are submitted, all other blocks are updated
+    on the calling thread.
+
+    The submitted block gets rebuilt in the worker process from its class and
+    its parameter values. The ordinates of :class:`.Signal` objects are
+    passed between the processes via shared memory instead of pickling them.
+    Ordinates computed in a worker stay in shared memory, so passing them to
+    the next worker does not copy them again.
+    """
+
+    def __init__(self, max_workers=None):
+        """Initializes ProcessExecutor.
+
+        Args:
+            max_workers (int): Maximum amount of worker processes.
+                               Defaults to the amount of CPUs.
+        """
+        super().__init__(max_workers)
+        self._buffers = {}
+
+    def _create_pool(self):
+        return concurrent.futures.ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            mp_context=multiprocessing.get_context("spawn"))
+
+    def _submit(self, block, update):
+        if not block.process_safe:
+            return None
+        # Blocks with outdated inputs do not process
+        for input_ in block.inputs:
+            output = input_.connected_output
+            if output is not None and not output.up_to_date:
+                return None
+        # Skipped blocks are not worth to be sent to a worker
+        if not block.registry.inputs_changed(block):
+            return None
+        buffers = []
+        inputs = [(_pack(input_.data, buffers), input_.metadata)
+                  for input_ in block.inputs]
+        future = self.pool.submit(_process_remote, type(block),
+                                  parameters.get_values(block.parameters),
+                                  inputs, len(block.outputs))
+        # Keep the shared memory alive until the worker is done
+        self._buffers[future] = buffers
+        return future
+
+    def _complete(self, block, future, update):
+        try:
+            results = [(_unpack(data), metadata)
+                       for data, metadata in future.result()]
+        finally:
+            del self._buffers[future]
+
+        def process():
+            for output, (data, metadata) in zip(block.outputs, results):
+                output.data = data
+                output.process_metadata = metadata
+        return update(block, process)
+
+
+class _Segment(shared_memory.SharedMemory):
+    """Shared memory segment holding ordinates. Segments are owned by the
+    parent process, which removes them once they are no longer referenced.
+    """
+
+    def __init__(self, name=None, create=False, size=0):
+        super().__init__(name, create, size)
+        self.owner = multiprocessing.parent_process() is None
+
+    def __del__(self):
+        # The memory stays mapped until the last array using it is gone
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+        if self.owner:
+            try:
+                self.unlink()
+            except FileNotFoundError:
+                pass
+
+
+# Buffers of the segments opened by this process mapped by their name
+_open_buffers = weakref.WeakValueDictionary()
+
+
+def _open_buffer(segment):
+    """Creates a buffer on a shared memory segment. Arrays created on the
+    buffer keep the segment alive.
+    """
+    buffer = (ctypes.c_byte * segment.size).from_buffer(segment.buf)
+    buffer.segment = segment
+    _open_buffers[segment.name] = buffer
+    return buffer
+
+
+def _array_buffer(array):
+    """Returns the shared memory buffer of an array or None, if the array is
+    not backed by shared memory.
+    """
+    base = array.base
+    while isinstance(base, np.ndarray):
+        base = base.base
+    if hasattr(base, "segment"):
+        return base
+    return None
+
+
+def _export_array(array, buffers):
+    """Describes an array by its shared memory segment. Arrays which are not
+    backed by shared memory yet get copied into a new segment.
+
+    Args:
+        array: Array to export.
+        buffers (list): Buffers which need to be kept alive until the
+                        array has been imported.
+
+    Returns:
+        tuple: Name of the segment, offset, shape and dtype of the array.
+    """
+    buffer = _array_buffer(array)
+    if buffer is None or not array.flags.c_contiguous:
+        buffer = _open_buffer(_Segment(create=True, size=array.nbytes))
+        shared = np.frombuffer(buffer, dtype=array.dtype,
+                               count=array.size).reshape(array.shape)
+        shared[...] = array
+        array = shared
+    offset = array.ctypes.data - ctypes.addressof(buffer)
+    buffers.append(buffer)
+    return buffer.segment.name, offset, array.shape, array.dtype.str
+
+
+def _import_array(name, offset, shape, dtype):
+    """Opens an array exported by :func:`._export_array`."""
+    buffer = _open_buffers.get(name)
+    if buffer is None:
+        buffer = _open_buffer(_Segment(name))
+    dtype = np.dtype(dtype)
+    return np.frombuffer(buffer, dtype=dtype, count=int(np.prod(shape)),
+                         offset=offset).reshape(shape)
+
+
+def _export_mapped(array, file_name, offset):
+    """Describes an array which is memory-mapped from a file by the range of
+    the file it covers, so the other process maps the file as well instead
+    of copying the array.
+
+    Returns:
+        tuple: Path of the file, offset and size of the range in bytes,
+               offset of the array in the range, shape, strides and dtype of
+               the array.
+    """
+    # Negative strides point below the first value of the array
+    low = sum(stride * (length - 1) for stride, length
+              in zip(array.strides, array.shape) if stride < 0)
+    high = sum(stride * (length - 1) for stride, length
+               in zip(array.strides, array.shape) if stride > 0)
+    return (file_name, offset + low, high - low + array.itemsize, -low,
+            array.shape, array.strides, array.dtype.str)
+
+
+def _import_mapped(file_name, offset, size, array_offset, shape, strides,
+                   dtype):
+    """Maps an array exported by :func:`._export_mapped`."""
+    buffer = np.memmap(file_name, dtype=np.uint8, mode="r", offset=offset,
+                       shape=(size,))
+    return np.ndarray(shape, dtype=np.dtype(dtype), buffer=buffer,
+                      offset=array_offset, strides=strides)
+
+
+def _pack(data, buffers):
+    """Prepares data to be sent to another process. Ordinates of signals are
+    passed via shared memory, ordinates which are memory-mapped from a file
+    are mapped by the other process.
+    """
+    if isinstance(data, data_types.Signal) and \
+            isinstance(data.ordinate, np.ndarray) and \
+            not data.ordinate.dtype.hasobject and data.ordinate.size:
+        mapped = data_types.mapped_file(data.ordinate)
+        if mapped is not None:
+            return ("mapped", type(data), data.abscissa_start, data.values,
+                    data.increment, _export_mapped(data.ordinate, *mapped))
+        return ("signal", type(data), data.abscissa_start, data.values,
+                data.increment, _export_array(data.ordinate, buffers))
+    return "object", data
+
+
+def _unpack(packed):
+    """Restores data prepared by :func:`._pack`."""
+    if packed[0] in ("signal", "mapped"):
+        if packed[0] == "signal":
+            ordinate = _import_array(*packed[5])
+        else:
+            ordinate = _import_mapped(*packed[5])
+        return packed[1](abscissa_start=packed[2], values=packed[3],
+                         increment=packed[4], ordinate=ordinate)
+    return packed[1]
+
+
+class _SourceOutput(block_io.Output):
+    """Output providing data and metadata received from another process."""
+
+    def __init__(self, block, data, metadata):
+        super().__init__(block)
+        self.data = data
+        self._metadata = metadata
+        # Prevent processing before all inputs are connected
+        self.up_to_date = False
+
+    @property
+    def metadata(self):
+        return self._metadata
+
+
+class _SourceBlock:
+    """Block providing the input data of a block processed in a worker."""
+
+    def __init__(self, inputs):
+        self.registry = io_registry.current_registry()
+        self.inputs = []
+        self.outputs = [
+            self.registry.add_node(_SourceOutput(self, data, metadata))
+            for data, metadata in inputs]
+
+
+def _process_remote(block_class, parameter_values, inputs, output_count):
+    """Rebuilds and processes a block in a worker process.
+
+    Args:
+        block_class: Class of the block.
+        parameter_values (dict): Values of the parameters of the block.
+        inputs (list): Packed data and metadata of the inputs.
+        output_count (int): Amount of outputs of the block.
+
+    Returns:
+        list: Packed data and process metadata of the outputs.
+    """
+    with io_registry.IORegistry().activate():
+        block = block_class()
+        while len(block.inputs) < len(inputs):
+            block.add_input(block_io.Input(block))
+        while len(block.outputs) < output_count:
+            block.add_output(block_io.Output(block))
+        block.read_kwargs(parameter_values)
+        source = _SourceBlock([(_unpack(data), metadata)
+                               for data, metadata in inputs])
+        for input_, output in zip(block.inputs, source.outputs):
+            input_.connect(output)
+        for output in source.outputs:
+            output.up_to_date = True
+        block.trigger_update()
+    buffers = []
+    results = [(_pack(output.data, buffers), output.process_metadata)
+               for output in block.outputs]
+    return results
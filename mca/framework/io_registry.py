@@ -1,7 +1,21 @@
-import networkx as nx
+import collections
+import contextlib
+import contextvars
+import threading
+import weakref
 
 from mca import exceptions
-from mca.framework import block_io
+from mca.framework import block_io, cache, executors, execution_plan, \
+    streaming
+
+# Registry activated in the current context, see IORegistry.activate
+_active_registry = contextvars.ContextVar("active_registry", default=None)
+# Set while updates run in the background, see IORegistry.background
+_background = contextvars.ContextVar("background", default=False)
+# Maps each registry with a batch open in the current context to the blocks
+# changed within the batch, see IORegistry.batch. The dict is replaced
+# instead of modified.
+_batches = contextvars.ContextVar("batches", default={})
 
 
 class IORegistry:
@@ -9,43 +23,546 @@ class IORegistry:
     created and also handles connections  between Outputs and Inputs and the 
     consistency of the data through updates.
     
+    The structure is stored as an adjacency index: each Input references its
+    connected Output and each Output the set of its connected Inputs. Both
+    are looked up in constant time, :meth:`.to_networkx` exports the
+    structure for debugging.
+
     Attributes:
-        _graph: `Networkx DiGraph <https://networkx.org/documentation/stable/reference/classes/digraph>`_ which is base of
-                IORegistry.
+        _sources (dict): Maps each registered Input to its connected Output
+                         or None.
+        _consumers (dict): Maps each registered Output to its connected
+                           Inputs. The Inputs are stored as keys of a dict
+                           to keep the order of the connections.
+        _owners (dict): Maps each registered Input and Output to its block.
+                        Nodes lose the reference of their block when they
+                        get deleted.
+        _blocks (dict): Maps each block to the amount of its registered
+                        Inputs and Outputs.
+        executor: Executor which runs the block updates, e.g.
+                  :class:`.SerialExecutor` or :class:`.ThreadExecutor`.
+        lazy (bool): True, if changes only update observed blocks (see
+                     :attr:`.Block.is_observed`) and the blocks they depend
+                     on. Otherwise, changes update all affected blocks
+                     whose results reach a sink (see :attr:`.Block.is_sink`).
+                     All other affected blocks are marked stale and get
+                     updated once the data of their outputs is accessed.
+        cache: Cache of block results, e.g. :class:`.MemoryCache`, or None
+               to always process the blocks.
+        profiler: :class:`.Profiler` which records the block updates and
+                  update passes or None, to disable profiling.
+        early_cutoff (bool): True, if blocks affected by a change are
+                             skipped when the versions of the data of their
+                             inputs (see :attr:`.Output.version`) are the
+                             same as when they were processed last. Blocks
+                             which often produce the same outputs (see
+                             :attr:`.Block.compare_outputs`) keep the
+                             versions of unchanged outputs, so the change
+                             does not propagate further.
+        generation (int): Counter which is incremented by every change of
+                          the structure or the blocks. Used to detect
+                          outdated :class:`.ExecutionPlan`.
+        dtype_policy (str): Dtype in which the outputs store the ordinates
+                            of signals, one of
+                            :data:`.data_types.DTYPE_POLICIES` (see
+                            :func:`.data_types.apply_dtype_policy`). None
+                            stores the data as produced by the blocks.
     """
 
-    def __init__(self):
-        """Initializes the IORegistry."""
-        self._graph = nx.DiGraph()
+    def __init__(self, executor=None, lazy=False, cache=None,
+                 early_cutoff=True, dtype_policy=None):
+        """Initializes the IORegistry.
 
-    def _invalidate_descendants(self, output):
-        """Sets a flag of the output itself and all descendants to indicate
-        their data may be invalid.
-        
         Args:
-            output: Output from which the invalidation starts.
+            executor: Executor which runs the block updates. Defaults to a
+                      :class:`.SerialExecutor`.
+            lazy (bool): True, to only update observed blocks eagerly.
+            cache: Cache of block results. Defaults to no cache.
+            early_cutoff (bool): True, to skip blocks whose inputs did not
+                                 change.
+            dtype_policy (str): Dtype policy of the outputs.
         """
-        output.up_to_date = False
-        for descendant in nx.descendants(self._graph, output):
-            descendant.up_to_date = False
+        self._sources = {}
+        self._consumers = {}
+        self._owners = {}
+        self._blocks = {}
+        if executor is None:
+            executor = executors.SerialExecutor()
+        self.executor = executor
+        self.lazy = lazy
+        self.cache = cache
+        self.early_cutoff = early_cutoff
+        self.dtype_policy = dtype_policy
+        self.profiler = None
+        self.generation = 0
+        self._stale = weakref.WeakSet()
+        # Blocks in which a change occurred since they were processed last
+        self._changed = weakref.WeakSet()
+        # Versions of the inputs each block was processed with last
+        self._processed_inputs = weakref.WeakKeyDictionary()
+        # Tokens of the updates in progress mapped to their blocks and the
+        # blocks of newer updates superseding them
+        self._running = {}
+        self._block_locks = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+        # Guards the structure against changes while updates run in the
+        # background
+        self._graph_lock = threading.RLock()
+        # Blocks which have not been updated in the background
+        self._deferred = weakref.WeakSet()
+
+    def _consumer_blocks(self, block):
+        """Returns the blocks connected to the Outputs of the block. A block
+        connected multiple times is contained multiple times.
+        """
+        return [input_.block for output in block.outputs
+                for input_ in self._consumers.get(output, ())]
+
+    def _descendants(self, blocks):
+        """Returns the given blocks and all blocks which depend on them.
+
+        Returns:
+            dict: Blocks as keys in the order they have been found.
+        """
+        found = dict.fromkeys(blocks)
+        stack = list(found)
+        while stack:
+            for consumer in self._consumer_blocks(stack.pop()):
+                if consumer not in found:
+                    found[consumer] = None
+                    stack.append(consumer)
+        return found
+
+    def _invalidate(self, blocks):
+        """Sets a flag of the Outputs of the blocks and the Inputs connected
+        to them to indicate their data may be invalid.
+
+        Args:
+            blocks: Blocks whose Outputs are invalidated.
+        """
+        for block in blocks:
+            for output in block.outputs:
+                output.up_to_date = False
+                for input_ in self._consumers.get(output, ()):
+                    input_.up_to_date = False
+
+    def _schedule(self, blocks):
+        """Computes the blocks affected by a change in the given blocks and
+        orders them topologically. Every affected block is contained exactly
+        once, so each block can be updated after all blocks it depends on.
+
+        Args:
+            blocks: Blocks in which the change occurred.
+
+        Returns:
+            tuple: Affected blocks in topological order and a dict which
+                   maps each affected block to the affected blocks it
+                   directly depends on.
+        """
+        affected = self._descendants(blocks)
+        dependencies = {block: set() for block in affected}
+        for block in affected:
+            for consumer in self._consumer_blocks(block):
+                dependencies[consumer].add(block)
+        # Kahn's algorithm, blocks are ordered once all blocks they depend
+        # on are ordered
+        remaining = {block: len(dependencies[block]) for block in affected}
+        ready = collections.deque(
+            block for block in affected if not remaining[block])
+        ordered = []
+        while ready:
+            block = ready.popleft()
+            ordered.append(block)
+            for consumer in dict.fromkeys(self._consumer_blocks(block)):
+                remaining[consumer] -= 1
+                if not remaining[consumer]:
+                    ready.append(consumer)
+        return ordered, dependencies
+
+    def _update_block(self, block, process=None):
+        """Synchronizes the flags of the Inputs with their connected Outputs
+        and updates the block.
+
+        Args:
+            block: Block to update.
+            process: Function replacing the process method of the block,
+                     see :meth:`.Block.update`.
+
+        Returns:
+            bool: True, if the block processed its data.
+        """
+        with self._lock:
+            block_lock = self._block_locks.setdefault(block,
+                                                      threading.RLock())
+        # Updates superseding each other must not process a block
+        # concurrently
+        with block_lock:
+            return self._update_block_locked(block, process)
+
+    def _update_block_locked(self, block, process=None):
+        """Updates the block while its lock is held, see
+        :meth:`._update_block`.
+        """
+        for input_ in block.inputs:
+            output = self.get_output(input_)
+            input_.up_to_date = output.up_to_date if output else True
+        versions = None
+        if self.early_cutoff:
+            versions = _input_versions(block)
+            if self._unchanged(block, versions):
+                for output in block.outputs:
+                    output.up_to_date = True
+                return False
+            if block.compare_outputs:
+                previous = [(output.version, output.fingerprint)
+                            for output in block.outputs]
+        processed = block.update(process)
+        if processed:
+            self._changed.discard(block)
+            self._processed_inputs[block] = versions
+            if versions is not None and block.compare_outputs:
+                for output, (version, fingerprint) in zip(block.outputs,
+                                                          previous):
+                    if fingerprint is not None and \
+                            output.fingerprint == fingerprint:
+                        output.version = version
+        return processed
+
+    def _unchanged(self, block, versions):
+        """Returns True, if neither the block itself nor its inputs changed
+        since the block was processed with the given input versions.
+        """
+        return block not in self._changed and \
+            all(input_.up_to_date for input_ in block.inputs) and \
+            self._processed_inputs.get(block) == versions
+
+    def inputs_changed(self, block):
+        """Returns True, if the block has to be processed in an update
+        because it changed itself or its inputs changed, see
+        :attr:`.early_cutoff`.
+        """
+        if not self.early_cutoff:
+            return True
+        return not self._unchanged(block, _input_versions(block))
+
+    def _update_blocks(self, blocks):
+        """Invalidates the given blocks and their descendants and updates
+        them in a single topologically ordered pass.
 
-    def _update_descendants(self, output):
-        """Goes through all descendants and updates the flags and tries to update
-        the block of the descendants. For example if an output is updated
-        all connected inputs will be updated and the outputs of the same Block 
-        as the inputs and so on.
-        
         Note:
             A block will only update itself if all inputs are up-to-date.
+            Within a :meth:`.batch` the blocks are only collected.
         Args:
-            output: Output from which the update process starts.
+            blocks: Blocks in which the change occurred.
+
+        Returns:
+            int: Number of blocks which processed their data.
         """
-        for edge in nx.bfs_edges(self._graph, output):
-            if isinstance(edge[0], block_io.Output) and isinstance(
-                    edge[1], block_io.Input
-            ):
-                edge[1].up_to_date = edge[0].up_to_date
-                edge[1].block.update()
+        self.generation += 1
+        batch = _batches.get().get(self)
+        if batch is not None:
+            batch.extend(blocks)
+            return 0
+        self._changed.update(blocks)
+        with self._graph_lock:
+            ordered, dependencies = self._schedule(blocks)
+            self._invalidate(ordered)
+            if self.lazy:
+                required = [block for block in ordered if block.is_observed]
+            else:
+                required = self._live_blocks(ordered)
+        if _background.get():
+            required = self._defer(required, ordered, dependencies)
+        if len(required) == len(ordered) and not self._stale:
+            return self._run(ordered, dependencies, supersede=True)
+        self._stale.update(ordered)
+        return self._pull(required, supersede=True)
+
+    def _defer(self, required, ordered, dependencies):
+        """Defers the update of blocks which are not thread safe (see
+        :attr:`.Block.thread_safe`) and of the blocks depending on them
+        while updating in the background.
+
+        Args:
+            required: Blocks which have to be updated.
+            ordered: Affected blocks in topological order.
+            dependencies (dict): Maps every affected block to the affected
+                                 blocks it directly depends on.
+
+        Returns:
+            list: Required blocks which can be updated in the background.
+        """
+        deferred = set()
+        for block in ordered:
+            if not block.thread_safe or dependencies[block] & deferred:
+                deferred.add(block)
+        self._deferred.update(block for block in required
+                              if block in deferred)
+        return [block for block in required if block not in deferred]
+
+    def _live_blocks(self, ordered):
+        """Determines the blocks whose results reach a sink (see
+        :attr:`.Block.is_sink`). All other blocks are dead branches which
+        do not need to be updated.
+
+        Args:
+            ordered: Affected blocks in topological order. All consumers of
+                     their outputs have to be contained as well.
+
+        Returns:
+            list: Live blocks in topological order.
+        """
+        live = set()
+        for block in reversed(ordered):
+            if block.is_sink or any(
+                    input_.block in live for output in block.outputs
+                    for input_ in self._consumers.get(output, ())):
+                live.add(block)
+        return [block for block in ordered if block in live]
+
+    def _pull_schedule(self, blocks):
+        """Computes the stale blocks the given blocks depend on including
+        the given blocks themselves if they are stale.
+
+        Args:
+            blocks: Blocks whose data is requested.
+
+        Returns:
+            tuple: Stale blocks in topological order and a dict which maps
+                   each of them to the stale blocks it directly depends on.
+        """
+        with self._graph_lock:
+            return self._pull_schedule_locked(blocks)
+
+    def _pull_schedule_locked(self, blocks):
+        """Computes the schedule of :meth:`._pull_schedule` while the graph
+        is locked.
+        """
+        ordered = []
+        visited = set()
+        # Depth-first search, blocks are appended after their dependencies
+        stack = [(block, False) for block in reversed(blocks)]
+        while stack:
+            block, expanded = stack.pop()
+            if expanded:
+                ordered.append(block)
+                continue
+            if block in visited or block not in self._stale:
+                continue
+            visited.add(block)
+            stack.append((block, True))
+            for input_ in block.inputs:
+                output = self.get_output(input_)
+                if output is not None:
+                    stack.append((output.block, False))
+        dependencies = {block: set() for block in ordered}
+        for block in ordered:
+            for input_ in block.inputs:
+                output = self.get_output(input_)
+                if output is not None and output.block in dependencies:
+                    dependencies[block].add(output.block)
+        return ordered, dependencies
+
+    def _pull(self, blocks, supersede=False):
+        """Updates the given blocks and the stale blocks they depend on.
+
+        Args:
+            blocks: Blocks whose data is requested.
+            supersede (bool): True, to cancel updates in progress which
+                              contain any of the updated blocks.
+
+        Returns:
+            int: Number of blocks which processed their data.
+        """
+        ordered, dependencies = self._pull_schedule(blocks)
+        self._stale.difference_update(ordered)
+        return self._run(ordered, dependencies, supersede)
+
+    def _run(self, ordered, dependencies, supersede=False):
+        """Runs the update of the given blocks on the executor. When the
+        update gets cancelled by a newer change, the blocks which have not
+        been updated are marked stale.
+
+        Args:
+            ordered: Blocks in topological order.
+            dependencies (dict): Maps every block to the set of blocks it
+                                 depends on.
+            supersede (bool): True, if the update results from a change. It
+                              then cancels updates in progress which
+                              contain any of the blocks, since their results
+                              are outdated.
+
+        Returns:
+            int: Number of blocks which processed their data.
+        """
+        token = executors.CancellationToken()
+        blocks = set(ordered)
+        # Blocks which are updated by the update superseding this one
+        superseded = set()
+        updated = set()
+        with self._lock:
+            if supersede:
+                for other_token, (other_blocks, other_superseded) in \
+                        self._running.items():
+                    if not blocks.isdisjoint(other_blocks):
+                        other_token.cancel()
+                        other_superseded.update(blocks)
+            self._running[token] = (blocks, superseded)
+
+        def update(block, process=None):
+            if token.cancelled:
+                return False
+            processed = self._update_block(block, process)
+            updated.add(block)
+            if not processed and not all(
+                    input_.up_to_date for input_ in block.inputs):
+                # The inputs are still being updated by another update,
+                # so the block has to be updated once they are done
+                self._stale.add(block)
+            return processed
+
+        profiler = self.profiler
+        try:
+            with profiler.record_update(ordered) if profiler is not None \
+                    else contextlib.nullcontext():
+                return self.executor.run(ordered, dependencies, update,
+                                         token)
+        finally:
+            with self._lock:
+                del self._running[token]
+                if token.cancelled:
+                    self._stale.update(blocks - updated - superseded)
+
+    def pull(self, block):
+        """Updates a stale block and the stale blocks it depends on. Blocks
+        become stale when they are affected by a change but their results
+        are not required, see :attr:`.lazy`.
+
+        Args:
+            block: Block whose data is requested.
+
+        Returns:
+            int: Number of blocks which processed their data.
+        """
+        if block not in self._stale:
+            return 0
+        return self._pull([block])
+
+    def pull_deferred(self):
+        """Updates the blocks whose update has been deferred by updates in
+        the :meth:`.background`. Has to be called from the thread the blocks
+        which are not thread safe belong to, e.g. the GUI thread.
+
+        Returns:
+            int: Number of blocks which processed their data.
+        """
+        blocks = list(self._deferred)
+        self._deferred.clear()
+        return self._pull(blocks)
+
+    def cancel(self, block):
+        """Cancels the updates in progress which contain the block, e.g.
+        since a newer change of the block is about to be applied. The blocks
+        which have not been updated yet are marked stale.
+
+        Args:
+            block: Block whose updates get cancelled.
+        """
+        with self._lock:
+            for token, (blocks, superseded) in self._running.items():
+                if block in blocks:
+                    token.cancel()
+
+    def is_updating(self, block):
+        """Returns True, if the block is part of an update in progress."""
+        with self._lock:
+            return any(block in blocks
+                       for blocks, superseded in self._running.values())
+
+    def is_stale(self, block):
+        """Returns True, if the block has not been updated after a change
+        since its results have not been required yet.
+        """
+        return block in self._stale
+
+    @contextlib.contextmanager
+    def activate(self):
+        """Context manager which makes the registry the current registry.
+        Blocks created within the context are bound to this registry. The
+        context is local to the thread or task, so independent block
+        structures can be built and updated concurrently.
+
+        Example:
+            >>> registry = IORegistry()
+            >>> with registry.activate():
+            ...     a = SignalGeneratorPeriodic()
+        """
+        token = _active_registry.set(self)
+        try:
+            yield self
+        finally:
+            _active_registry.reset(token)
+
+    @contextlib.contextmanager
+    def background(self):
+        """Context manager for updates which run on a background thread.
+        Blocks which are not thread safe are not updated within the context,
+        their updates are deferred until :meth:`.pull_deferred` gets called.
+
+        Example:
+            >>> with Registry.background():
+            ...     block.trigger_update()
+        """
+        token = _background.set(True)
+        try:
+            yield self
+        finally:
+            _background.reset(token)
+
+    @contextlib.contextmanager
+    def batch(self):
+        """Context manager which defers all updates caused by changes in the
+        structure or in parameters until the context is left. The affected
+        blocks are then updated in a single pass. Nested batches are merged
+        into the outermost one. If the context is left by an exception, the
+        affected blocks are not updated but marked stale. Like
+        :meth:`.activate`, the batch is local to the thread or task, so
+        changes in other threads, e.g. updates in the :meth:`.background`,
+        are not deferred.
+
+        Example:
+            >>> with Registry.batch():
+            ...     b.inputs[0].connect(a.outputs[0])
+            ...     c.inputs[0].connect(b.outputs[0])
+        """
+        batches = _batches.get()
+        if self in batches:
+            yield
+            return
+        changed = []
+        token = _batches.set({**batches, self: changed})
+        try:
+            yield
+        except BaseException:
+            _batches.reset(token)
+            blocks = self._existing(changed)
+            self._changed.update(blocks)
+            with self._graph_lock:
+                affected = self._descendants(blocks)
+                self._invalidate(affected)
+            self._stale.update(affected)
+            raise
+        else:
+            _batches.reset(token)
+            self._update_blocks(self._existing(changed))
+
+    def _existing(self, blocks):
+        """Returns the blocks without duplicates except the blocks which
+        have been deleted, e.g. within a :meth:`.batch`.
+        """
+        return [block for block in dict.fromkeys(blocks)
+                if block is not None and
+                all(node in self for node in block.inputs + block.outputs)]
 
     def invalidate_and_update(self, block):
         """Method which is called when a change (connect, disconnect,
@@ -55,12 +572,15 @@ class IORegistry:
         
         Args:
             block (:class:`.Block`): Block in which the change occurred.
+
+        Returns:
+            int: Number of blocks which processed their data.
         """
-        for output in block.outputs:
-            self._invalidate_descendants(output)
-        block.update()
-        for output in block.outputs:
-            self._update_descendants(output)
+        return self._update_blocks([block])
+
+    def __contains__(self, node):
+        """Returns True, if the Input or Output is part of the registry."""
+        return node in self._sources or node in self._consumers
 
     def add_node(self, node):
         """Adds an Input or Output to the registry.
@@ -71,16 +591,34 @@ class IORegistry:
         Returns:
             The node which has been added to the structure.
         """
-        self._graph.add_node(node)
-        if isinstance(node, block_io.Output):
-            for input_ in node.block.inputs:
-                self._graph.add_edge(input_, node)
-            return node
-        elif isinstance(node, block_io.Input):
-            for output in node.block.outputs:
-                self._graph.add_edge(node, output)
+        with self._graph_lock:
+            if isinstance(node, block_io.Output):
+                index, empty = self._consumers, {}
+            elif isinstance(node, block_io.Input):
+                index, empty = self._sources, None
+            else:
+                return None
+            if node not in index:
+                self.generation += 1
+                index[node] = empty
+                self._owners[node] = node.block
+                self._blocks[node.block] = self._blocks.get(node.block, 0) + 1
             return node
 
+    def _remove_node(self, node, index):
+        """Removes an Input or Output from its index and the block from the
+        block index once it has no registered nodes left.
+        """
+        with self._graph_lock:
+            if node not in index:
+                return
+            self.generation += 1
+            del index[node]
+            block = self._owners.pop(node)
+            self._blocks[block] -= 1
+            if not self._blocks[block]:
+                del self._blocks[block]
+
     def remove_input(self, input_):
         """Disconnects and removes an Input from the registry.
         
@@ -88,7 +626,7 @@ class IORegistry:
             input_: Input which gets removed.
         """
         self.disconnect_input(input_)
-        self._graph.remove_node(input_)
+        self._remove_node(input_, self._sources)
 
     def remove_output(self, output):
         """Disconnects and removes an Output from the registry.
@@ -97,7 +635,7 @@ class IORegistry:
             output: Output which gets removed.
         """
         self.disconnect_output(output)
-        self._graph.remove_node(output)
+        self._remove_node(output, self._consumers)
 
     def connect(self, output, input_):
         """Connects an Output to an Input.
@@ -117,18 +655,26 @@ class IORegistry:
         if not isinstance(output, block_io.Output):
             message = f"{output} is not instance of {block_io.Output}"
             raise exceptions.BlockConnectionError(message)
-        # Input is already connected
-        if list(self._graph.predecessors(input_)):
-            raise exceptions.BlockConnectionError("Input already connected")
-        # Add an edge between the input and output
-        self._graph.add_edge(output, input_)
-        # Test if the edge caused a cycle
-        if not nx.is_directed_acyclic_graph(self._graph):
-            # Remove the edge
-            self._graph.remove_edge(output, input_)
-            raise exceptions.BlockCircleError(input_.block)
+        with self._graph_lock:
+            if input_ not in self._sources or output not in self._consumers:
+                raise exceptions.BlockConnectionError(
+                    "Input and Output are not part of the same registry")
+            # Input is already connected
+            if self._sources[input_] is not None:
+                raise exceptions.BlockConnectionError(
+                    "Input already connected")
+            # The connection would close a cycle if the block of the
+            # output depends on the block of the input. Only the blocks
+            # downstream of the input get searched.
+            if output.block in self._descendants([input_.block]):
+                raise exceptions.BlockCircleError(input_.block)
+            self._sources[input_] = output
+            self._consumers[output][input_] = None
         # Update the blocks
         self.invalidate_and_update(input_.block)
+        # Validate the connection even if the block has no consumers yet
+        if not self.lazy and self not in _batches.get():
+            self.pull(input_.block)
 
     def disconnect_input(self, input_):
         """Disconnects an Input from an Output if connected.
@@ -136,9 +682,12 @@ class IORegistry:
         Args:
             input_: Input which gets disconnected.
         """
-        output = list(self._graph.predecessors(input_))
-        if output:
-            self._graph.remove_edge(output[0], input_)
+        with self._graph_lock:
+            output = self._sources.get(input_)
+            if output is not None:
+                self._sources[input_] = None
+                del self._consumers[output][input_]
+        if output is not None:
             self.invalidate_and_update(input_.block)
 
     def disconnect_output(self, output):
@@ -147,17 +696,13 @@ class IORegistry:
         Args:
             output: Output which gets disconnected.
         """
-        inputs = [x for x in self._graph.neighbors(output)]
-        for input_ in inputs:
-            self._graph.remove_edge(output, input_)
-        for input_ in inputs:
-            for output in input_.block.outputs:
-                self._invalidate_descendants(output)
-        for block in set([x.block for x in inputs]):
-            block.update()
-        for input_ in inputs:
-            for output in input_.block.outputs:
-                self._update_descendants(output)
+        with self._graph_lock:
+            inputs = list(self._consumers.get(output, ()))
+            for input_ in inputs:
+                self._sources[input_] = None
+            if inputs:
+                self._consumers[output].clear()
+        self._update_blocks(list(dict.fromkeys(x.block for x in inputs)))
 
     def get_output(self, input_):
         """Returns the connected Output from an Input.
@@ -165,22 +710,140 @@ class IORegistry:
         Args:
             input_: Input to which the Output is connected to.
         """
-        if list(self._graph.predecessors(input_)):
-            return list(self._graph.predecessors(input_))[0]
+        return self._sources.get(input_)
 
     def clear(self):
         """Removes all Inputs and Outputs (thus all blocks)
         from the IORegistry.
         """
-        self._graph.clear()
+        with self._graph_lock:
+            self._sources.clear()
+            self._consumers.clear()
+            self._owners.clear()
+            self._blocks.clear()
+        self._stale.clear()
+        self._deferred.clear()
+        self._changed.clear()
+        self._processed_inputs.clear()
 
     def get_all_blocks(self):
         """Returns all blocks currently in the IORegistry."""
-        all_blocks = []
-        for node in self._graph.nodes:
-            if node.block not in all_blocks:
-                all_blocks.append(node.block)
-        return all_blocks
+        with self._graph_lock:
+            return list(self._blocks)
+
+    def _ancestors(self, blocks):
+        """Returns the given blocks and all blocks they depend on."""
+        found = dict.fromkeys(blocks)
+        stack = list(found)
+        while stack:
+            for input_ in stack.pop().inputs:
+                output = self._sources.get(input_)
+                if output is not None and output.block not in found:
+                    found[output.block] = None
+                    stack.append(output.block)
+        return found
+
+    def compile(self, feeds=(), targets=None):
+        """Freezes the blocks into an :class:`.ExecutionPlan` which
+        processes them repeatedly with new data of the fed Outputs.
+
+        Args:
+            feeds: Outputs whose data is given to
+                   :meth:`.ExecutionPlan.run`, e.g. outputs of loaders.
+            targets: Blocks whose results are required. The plan contains
+                     them and the blocks they depend on. Defaults to all
+                     blocks.
+
+        Returns:
+            :class:`.ExecutionPlan`: Plan of the blocks.
+        """
+        with self._graph_lock:
+            if targets is None:
+                blocks = dict.fromkeys(self._blocks)
+            else:
+                blocks = self._ancestors(targets)
+            for output in feeds:
+                if output not in self._consumers:
+                    raise exceptions.BlockConnectionError(
+                        f"{output} is not part of the registry")
+            ordered, dependencies = self._schedule(blocks)
+            ordered = [block for block in ordered if block in blocks]
+            return execution_plan.ExecutionPlan(
+                self, ordered, dependencies, feeds)
+
+    def compile_stream(self, feeds=(), outputs=(), targets=None):
+        """Freezes the blocks into a :class:`.StreamPlan` which processes
+        the fed Outputs in chunks.
+
+        Args:
+            feeds: Outputs whose chunks are given to
+                   :meth:`.StreamPlan.run`, e.g. outputs of loaders.
+            outputs: Outputs whose data is returned for each chunk.
+            targets: Blocks whose results are required. The plan contains
+                     them and the blocks they depend on. Defaults to the
+                     blocks of the outputs or all blocks.
+
+        Returns:
+            :class:`.StreamPlan`: Plan of the blocks.
+        """
+        if targets is None and outputs:
+            targets = list(dict.fromkeys(output.block for output in outputs))
+        with self._graph_lock:
+            if targets is None:
+                blocks = dict.fromkeys(self._blocks)
+            else:
+                blocks = self._ancestors(targets)
+            for output in tuple(feeds) + tuple(outputs):
+                if output not in self._consumers:
+                    raise exceptions.BlockConnectionError(
+                        f"{output} is not part of the registry")
+            ordered, dependencies = self._schedule(blocks)
+            ordered = [block for block in ordered if block in blocks]
+            return streaming.StreamPlan(
+                self, ordered, dependencies, feeds, outputs)
+
+    def _mark_processed(self, blocks):
+        """Marks blocks which are processed outside of an update pass, e.g.
+        by an :class:`.ExecutionPlan`, as up-to-date. The fingerprints of
+        their inputs are dropped, since the blocks have not been processed
+        with them.
+        """
+        for block in blocks:
+            self._stale.discard(block)
+            self._changed.discard(block)
+            self._processed_inputs.pop(block, None)
+            for input_ in block.inputs:
+                input_.up_to_date = True
+            for output in block.outputs:
+                output.up_to_date = True
+
+    def _mark_stale(self, blocks):
+        """Marks blocks which have not been processed as stale."""
+        self._stale.update(blocks)
+
+    def to_networkx(self):
+        """Exports the structure as `networkx DiGraph <https://networkx.org/documentation/stable/reference/classes/digraph>`_
+        for debugging. The nodes are the Inputs and Outputs. Each Input has
+        an edge to the Outputs of its block and each Output to its connected
+        Inputs.
+
+        Returns:
+            networkx.DiGraph: Graph of the structure.
+        """
+        import networkx as nx
+
+        graph = nx.DiGraph()
+        with self._graph_lock:
+            graph.add_nodes_from(self._sources)
+            graph.add_nodes_from(self._consumers)
+            for input_ in self._sources:
+                for output in input_.block.outputs:
+                    if output in self._consumers:
+                        graph.add_edge(input_, output)
+            for output, inputs in self._consumers.items():
+                for input_ in inputs:
+                    graph.add_edge(output, input_)
+        return graph
 
     def remove_block(self, block):
         """Removes Inputs and Outputs of a block (thus removing the block)
@@ -196,7 +859,37 @@ class IORegistry:
             self.remove_input(input_)
         for output in block.outputs:
             self.remove_output(output)
+        self._stale.discard(block)
+        self._deferred.discard(block)
+        self._changed.discard(block)
+        self._processed_inputs.pop(block, None)
+
+
+def _input_versions(block):
+    """Returns the versions of the data and the fingerprints of the
+    metadata of all inputs of a block, see :attr:`.IORegistry.early_cutoff`.
+    """
+    versions = []
+    for input_ in block.inputs:
+        output = input_.connected_output
+        if output is None:
+            versions.append(None)
+        else:
+            versions.append((output.version,
+                             cache.metadata_fingerprint(output.metadata)))
+    return versions
+
+
+def current_registry():
+    """Returns the registry new blocks get bound to. This is the registry
+    activated with :meth:`.IORegistry.activate` or the default
+    :data:`.Registry`.
+    """
+    registry = _active_registry.get()
+    if registry is None:
+        return Registry
+    return registry
 
 
-# The registry should be handled as a singleton
+# Default registry of all blocks created outside of an activated registry
 Registry = IORegistry()
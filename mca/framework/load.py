@@ -15,7 +15,7 @@ def load_block_structure(file_path):
         list: List of blocks created by the save file.
     """
     logging.info(f"Loading block structure from {file_path}")
-    if io_registry.Registry.get_all_blocks():
+    if io_registry.current_registry().get_all_blocks():
         raise exceptions.DataLoadingError("Cannot load block structure"
                                           "into an existing structure.")
     with open(file_path, "r") as load_file:
@@ -25,16 +25,32 @@ def load_block_structure(file_path):
 
 
 def json_to_blocks(json_string):
+    """Creates a block structure from its json representation. The blocks
+    are updated once after the whole structure has been built.
+
+    Args:
+        json_string (str): Json representation of the block structure.
+
+    Returns:
+        list: List of the created blocks.
+    """
+    with io_registry.current_registry().batch():
+        return _create_blocks(json_string)
+
+
+def _create_blocks(json_string):
     # Load the json
     load_data = json.loads(json_string)
-    # Create dict which maps strings to block classes
-    str_to_block_types = {str(block_class): block_class
-                          for block_class in blocks.block_classes}
     block_structure = []
     # Create all blocks in the save file
     for block_save in load_data["blocks"]:
-        # Create a block instance
-        block_instance = str_to_block_types[block_save["class"]]()
+        # Create a block instance, only the used blocks get imported
+        try:
+            entry = blocks.catalog.get(block_save["class"])
+        except KeyError:
+            raise exceptions.DataLoadingError(
+                f"Unknown block {block_save['class']}")
+        block_instance = entry()
         block_structure.append(block_instance)
         # Pass the saved gui data
         block_instance.gui_data["save_data"] = block_save["gui_data"]
@@ -407,3 +407,25 @@ class ParameterBlock:
             if source in conversion.main_parameters:
                 if conversion.conversion_func:
                     conversion.conversion_func()
+
+
+def get_values(parameters):
+    """Extracts the values of the given parameters. The values of a
+    :class:`.ParameterBlock` are returned as a dict. Action parameters have no
+    value and are skipped.
+
+    Args:
+        parameters (dict): Parameters mapped by their name.
+
+    Returns:
+        dict: Values of the parameters mapped by their name.
+    """
+    values = {}
+    for name, parameter in parameters.items():
+        if isinstance(parameter, ParameterBlock):
+            values[name] = {sub_name: sub_parameter.value for
+                            sub_name, sub_parameter in
+                            parameter.parameters.items()}
+        elif not isinstance(parameter, ActionParameter):
+            values[name] = parameter.value
+    return values
@@ -0,0 +1,80 @@
+"""Qt widgets embedding the matplotlib figures of the :class:`.PlotBlock`.
+
+The module is imported when the first plot block gets created, so the rest
+of the framework does not depend on Qt.
+"""
+from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg, NavigationToolbar2QT as NavigationToolbar
+from matplotlib.figure import Figure
+from matplotlib.backends.qt_compat import QtWidgets, QtGui
+
+
+class MplCanvas(FigureCanvasQTAgg):
+    """MatplotlibCanvas holding the figure object.
+
+    Attributes:
+        fig(:obj:`matplotlib.figure`): Matplotlib figure object.
+    """
+    def __init__(self, width=5, height=4, dpi=100):
+        """Initialize MplCanvas.
+
+        Args:
+            width: Width of the figure.
+            height: Height of the figure.
+            dpi: DPI of the figure.
+        """
+        self.fig = Figure(figsize=(width, height), dpi=dpi)
+        super(MplCanvas, self).__init__(self.fig)
+
+
+class PlotWindow(QtWidgets.QWidget):
+    """Qt widget containing the :obj:`matplotlib.figure`.
+
+    Attributes:
+        canvas: Matplotlib canvas containing the figure.
+        axes: Axes within the figure.
+    """
+    def __init__(self, rows, cols, **kwargs):
+        """Initialize PlotWindow.
+
+        Args:
+            rows (int): Number of cols in the figure.
+            cols (int): Number of cols in the figure.
+        """
+        super(PlotWindow, self).__init__(**kwargs)
+
+        self.canvas = MplCanvas(width=5, height=4, dpi=100)
+
+        toolbar = NavigationToolbar(self.canvas, parent=self)
+        layout = QtWidgets.QVBoxLayout()
+        layout.addWidget(toolbar)
+        layout.addWidget(self.canvas)
+
+        widget = QtWidgets.QWidget()
+        widget.setLayout(layout)
+        self.setLayout(QtWidgets.QVBoxLayout())
+        self.layout().addWidget(widget)
+        self.axes = self.canvas.fig.subplots(nrows=rows, ncols=cols)
+
+    def paintEvent(self, event):
+        # Get colors depending on the style
+        fig_colour = self.palette().color(QtGui.QPalette.Base).name()
+        ax_colour = self.palette().color(QtGui.QPalette.Window).name()
+        grid_colour = self.palette().color(QtGui.QPalette.Text).name()
+        # Apply the colors to the figure and the axes
+        self.canvas.fig.set_facecolor(fig_colour)
+
+        try:
+            for ax in self.axes:
+                ax.set_facecolor(ax_colour)
+                ax.grid(color=grid_colour)
+                ax.tick_params(colors=grid_colour)
+                ax.xaxis.label.set_color(grid_colour)
+                ax.yaxis.label.set_color(grid_colour)
+        except TypeError:
+            self.axes.tick_params(colors=grid_colour)
+            self.axes.xaxis.label.set_color(grid_colour)
+            self.axes.yaxis.label.set_color(grid_colour)
+            self.axes.set_facecolor(ax_colour)
+            self.axes.grid(color=grid_colour)
+        self.canvas.draw()
+        super().paintEvent(event)
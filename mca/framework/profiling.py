@@ -0,0 +1,254 @@
+"""Instrumentation of block updates.
+
+A :class:`.Profiler` assigned to :attr:`.IORegistry.profiler` records the
+wall time, CPU time, input and output sizes and optionally the peak memory
+allocation of every processed block as well as the update passes of the
+registry. Without a profiler the only overhead is a single attribute
+lookup per update.
+
+Example:
+    >>> with profiling.profile() as profiler:
+    ...     generator.trigger_update()
+    >>> print(profiler.summary_table())
+    >>> profiler.save_chrome_trace("trace.json")
+"""
+import contextlib
+import json
+import os
+import threading
+import time
+import tracemalloc
+
+from mca.framework import cache, io_registry
+
+
+class Record:
+    """Measurement of a single block update or update pass.
+
+    Attributes:
+        name (str): Name of the block or the pass.
+        category (str): "block" or "update".
+        block: Recorded block or None for passes.
+        start (int): Start in ns of :func:`time.perf_counter_ns`.
+        wall_time (int): Elapsed wall time in ns.
+        cpu_time (int): CPU time of the thread in ns.
+        thread_id (int): Identifier of the thread which ran the update.
+        input_bytes (int): Estimated size of the input data in bytes.
+        output_bytes (int): Estimated size of the output data in bytes.
+        peak_memory (int): Peak of the memory allocated during the update
+                           in bytes or None, if memory is not traced.
+    """
+
+    def __init__(self, name, category, block, start, wall_time, cpu_time,
+                 input_bytes=0, output_bytes=0, peak_memory=None):
+        """Initializes Record."""
+        self.name = name
+        self.category = category
+        self.block = block
+        self.start = start
+        self.wall_time = wall_time
+        self.cpu_time = cpu_time
+        self.thread_id = threading.get_ident()
+        self.input_bytes = input_bytes
+        self.output_bytes = output_bytes
+        self.peak_memory = peak_memory
+
+
+def _block_name(block):
+    """Returns the name of a block for the reports."""
+    name = block.parameters["name"].value
+    if name != block.name:
+        return f"{name} ({block.name})"
+    return name
+
+
+class Profiler:
+    """Records the updates of blocks.
+
+    Attributes:
+        records (list): :class:`.Record` of each processed block and each
+                        update pass in the order they have finished.
+        trace_memory (bool): True, if the peak memory allocation of the
+                             blocks gets traced with :mod:`tracemalloc`.
+                             The peak is global, so it also contains the
+                             allocations of blocks running concurrently.
+    """
+
+    def __init__(self, trace_memory=False):
+        """Initializes Profiler.
+
+        Args:
+            trace_memory (bool): True, to trace the peak memory allocation.
+                                 Tracing slows down the allocations.
+        """
+        self.records = []
+        self.trace_memory = trace_memory
+
+    def clear(self):
+        """Removes all records."""
+        self.records = []
+
+    @contextlib.contextmanager
+    def record(self, block):
+        """Context manager which records the update of a block.
+
+        Args:
+            block: Block which gets processed within the context.
+        """
+        input_bytes = sum(cache.data_size(input_.data)
+                          for input_ in block.inputs)
+        trace_memory = self.trace_memory and tracemalloc.is_tracing()
+        if trace_memory:
+            tracemalloc.reset_peak()
+            memory = tracemalloc.get_traced_memory()[0]
+        start = time.perf_counter_ns()
+        cpu_start = time.thread_time_ns()
+        try:
+            yield
+        finally:
+            cpu_time = time.thread_time_ns() - cpu_start
+            wall_time = time.perf_counter_ns() - start
+            peak_memory = None
+            if trace_memory:
+                peak_memory = tracemalloc.get_traced_memory()[1] - memory
+            output_bytes = sum(cache.data_size(output._data)
+                               for output in block.outputs)
+            self.records.append(Record(
+                _block_name(block), "block", block, start, wall_time,
+                cpu_time, input_bytes, output_bytes, peak_memory))
+
+    @contextlib.contextmanager
+    def record_update(self, blocks):
+        """Context manager which records an update pass of the registry.
+
+        Args:
+            blocks: Blocks scheduled in the pass.
+        """
+        start = time.perf_counter_ns()
+        cpu_start = time.thread_time_ns()
+        try:
+            yield
+        finally:
+            self.records.append(Record(
+                f"Update ({len(blocks)} blocks)", "update", None, start,
+                time.perf_counter_ns() - start,
+                time.thread_time_ns() - cpu_start))
+
+    def summary(self):
+        """Aggregates the records of each block.
+
+        Returns:
+            list: Dict for each block with the keys "name", "calls",
+                  "wall_time" and "cpu_time" in s, "input_bytes",
+                  "output_bytes" and "peak_memory" (maximum over all
+                  calls).
+        """
+        rows = {}
+        for record in self.records:
+            if record.category != "block":
+                continue
+            row = rows.setdefault(id(record.block), {
+                "name": record.name, "calls": 0, "wall_time": 0.0,
+                "cpu_time": 0.0, "input_bytes": 0, "output_bytes": 0,
+                "peak_memory": None})
+            row["calls"] += 1
+            row["wall_time"] += record.wall_time / 1e9
+            row["cpu_time"] += record.cpu_time / 1e9
+            row["input_bytes"] += record.input_bytes
+            row["output_bytes"] += record.output_bytes
+            if record.peak_memory is not None:
+                row["peak_memory"] = max(row["peak_memory"] or 0,
+                                         record.peak_memory)
+        return list(rows.values())
+
+    def summary_table(self, sort_by="wall_time"):
+        """Formats the summary as a table.
+
+        Args:
+            sort_by (str): Column to sort the blocks by in descending order.
+
+        Returns:
+            str: Table with a row for each block.
+        """
+        columns = ("name", "calls", "wall_time", "cpu_time", "input_bytes",
+                   "output_bytes", "peak_memory")
+        rows = sorted(self.summary(),
+                      key=lambda row: row[sort_by] or 0,
+                      reverse=sort_by != "name")
+        cells = [columns]
+        for row in rows:
+            cells.append((row["name"], str(row["calls"]),
+                          f"{row['wall_time']:.6f}",
+                          f"{row['cpu_time']:.6f}",
+                          str(row["input_bytes"]), str(row["output_bytes"]),
+                          "-" if row["peak_memory"] is None
+                          else str(row["peak_memory"])))
+        widths = [max(len(row[i]) for row in cells)
+                  for i in range(len(columns))]
+        lines = []
+        for row in cells:
+            lines.append("  ".join(
+                [row[0].ljust(widths[0])] + [
+                    cell.rjust(width)
+                    for cell, width in zip(row[1:], widths[1:])]))
+        lines.insert(1, "-" * len(lines[0]))
+        return "\n".join(lines)
+
+    def chrome_trace(self):
+        """Converts the records to the Chrome trace event format, which can
+        be viewed with chrome://tracing or Perfetto.
+
+        Returns:
+            dict: Trace with complete events in µs.
+        """
+        events = []
+        for record in self.records:
+            args = {"cpu_time_us": record.cpu_time / 1e3}
+            if record.category == "block":
+                args.update(input_bytes=record.input_bytes,
+                            output_bytes=record.output_bytes)
+                if record.peak_memory is not None:
+                    args["peak_memory"] = record.peak_memory
+            events.append({"name": record.name, "cat": record.category,
+                           "ph": "X", "ts": record.start / 1e3,
+                           "dur": record.wall_time / 1e3,
+                           "pid": os.getpid(), "tid": record.thread_id,
+                           "args": args})
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def save_chrome_trace(self, file_name):
+        """Saves the records as a Chrome trace event json file.
+
+        Args:
+            file_name (str): Path of the file.
+        """
+        with open(file_name, "w") as file:
+            json.dump(self.chrome_trace(), file)
+
+
+@contextlib.contextmanager
+def profile(registry=None, trace_memory=False):
+    """Context manager which profiles the updates of a registry.
+
+    Args:
+        registry: :class:`.IORegistry` to profile. Defaults to the current
+                  registry.
+        trace_memory (bool): True, to trace the peak memory allocation.
+
+    Returns:
+        :class:`.Profiler` with the records.
+    """
+    if registry is None:
+        registry = io_registry.current_registry()
+    profiler = Profiler(trace_memory)
+    previous = registry.profiler
+    started = trace_memory and not tracemalloc.is_tracing()
+    if started:
+        tracemalloc.start()
+    registry.profiler = profiler
+    try:
+        yield profiler
+    finally:
+        registry.profiler = previous
+        if started:
+            tracemalloc.stop()
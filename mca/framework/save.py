@@ -12,7 +12,8 @@ def save_block_structure(file_path):
         file_path (str): Path of the .json file.
     """
     logging.info(f"Saving block structure to {file_path}")
-    block_structure = blocks_to_json(io_registry.Registry.get_all_blocks())
+    block_structure = blocks_to_json(
+        io_registry.current_registry().get_all_blocks())
     with open(file_path, "w") as save_file:
         save_file.write(block_structure)
 
@@ -0,0 +1,290 @@
+"""Streaming execution of block structures in chunks of the signals.
+
+:meth:`.IORegistry.compile_stream` freezes the blocks of a registry into a
+:class:`.StreamPlan`, which processes signals that do not fit into memory.
+The fed Outputs, e.g. the output of a loader, get consecutive chunks of
+their signal, which are signals themselves with the abscissa start of the
+chunk (see :func:`.iter_chunks`). Each chunk is passed through the blocks
+with :meth:`.Block.process_chunk`, so only a chunk of each signal is held at
+once.
+
+Blocks support streaming with :attr:`.Block.streamable`. Stateless blocks
+process a chunk like a whole signal, stateful blocks like the IIR Filter
+carry their state from one chunk to the next. Blocks which need the whole
+signal, and all blocks depending on them, are materialised: the chunks of
+their inputs are collected and the blocks are processed once at the end of
+the stream. Blocks which process in segments, like the Window and the FFT
+with a segment size, give the same results streamed and processed as a
+whole.
+
+After the stream, the fed Outputs hold their data again and the blocks of
+the plan are stale, so accessing their data processes them with the whole
+signals.
+
+Example:
+    >>> plan = io_registry.Registry.compile_stream(
+    ...     feeds=[loader.outputs[0]], outputs=[fft.outputs[0]])
+    >>> for results in plan.run({loader.outputs[0]: chunk}
+    ...                         for chunk in streaming.iter_chunks(signal)):
+    ...     frames.append(results[fft.outputs[0]])
+"""
+import numpy as np
+
+from mca import exceptions
+
+
+def iter_chunks(signal, values=65536):
+    """Yields consecutive chunks of a signal, which share the memory of its
+    ordinate.
+
+    Args:
+        signal (:class:`.Signal`): Signal to split.
+        values (int): Amount of values of each chunk. The last chunk holds
+                      the remaining values.
+    """
+    for start in range(0, signal.values, values):
+        stop = min(start + values, signal.values)
+        yield signal.replace(
+            abscissa_start=signal.abscissa_start + start * signal.increment,
+            values=stop - start, ordinate=signal.ordinate[..., start:stop])
+
+
+def split(signal, index):
+    """Splits a signal at the given index of its values.
+
+    Returns:
+        tuple: The signal before and from the index on. The ordinates are
+               views of the ordinate of the signal.
+    """
+    index = min(max(index, 0), signal.values)
+    head = signal.replace(values=index, ordinate=signal.ordinate[..., :index])
+    tail = signal.replace(
+        abscissa_start=signal.abscissa_start + index * signal.increment,
+        values=signal.values - index, ordinate=signal.ordinate[..., index:])
+    return head, tail
+
+
+def concatenate(signals):
+    """Joins consecutive chunks of a signal. Missing chunks, which are None,
+    are left out.
+
+    Returns:
+        :class:`.Signal`: Signal of all chunks or None if there are none.
+    """
+    signals = [signal for signal in signals if signal is not None]
+    if not signals:
+        return None
+    if len(signals) == 1:
+        return signals[0]
+    return signals[0].replace(
+        values=sum(signal.values for signal in signals),
+        ordinate=np.concatenate([signal.ordinate for signal in signals],
+                                axis=-1))
+
+
+class Segmenter:
+    """Collects the chunks of a signal into segments of a fixed amount of
+    values, e.g. for blocks which process a stream in segments.
+
+    Attributes:
+        values (int): Amount of values of each segment.
+    """
+
+    def __init__(self, values):
+        """Initializes Segmenter.
+
+        Args:
+            values (int): Amount of values of each segment.
+        """
+        self.values = values
+        self._pending = None
+
+    def push(self, chunk, final=False):
+        """Adds the next chunk and returns the completed segments.
+
+        Args:
+            chunk (:class:`.Signal`): Next chunk or None.
+            final (bool): True, if this is the end of the stream. The
+                          remaining values are returned as the last,
+                          shorter segment.
+
+        Returns:
+            list: Completed segments.
+        """
+        pending = concatenate([self._pending, chunk])
+        segments = []
+        while pending is not None and pending.values >= self.values:
+            segment, pending = split(pending, self.values)
+            segments.append(segment)
+        if final and pending is not None and pending.values:
+            segments.append(pending)
+            pending = None
+        # Keep a copy of the rest, so the chunk it is part of can be freed
+        if pending is not None:
+            pending = pending.replace(ordinate=pending.ordinate_copy())
+        self._pending = pending
+        return segments
+
+
+class StreamPlan:
+    """Blocks of a registry frozen into a plan which processes a stream of
+    chunks. Like an :class:`.ExecutionPlan`, the plan has to be compiled
+    again after the structure or the blocks changed.
+
+    Attributes:
+        registry (:class:`.IORegistry`): Registry the plan was compiled
+                                         from.
+        blocks (list): All blocks of the plan in topological order.
+        feeds (tuple): Outputs whose chunks are given to :meth:`.run`.
+        outputs (tuple): Outputs whose data is returned for each chunk.
+        constants (list): Blocks which do not depend on the feeds. They are
+                          processed once before the stream.
+        streamed (list): Blocks which process each chunk.
+        materialised (list): Blocks which cannot be streamed or depend on
+                             such blocks. They are processed once with the
+                             whole signals at the end of the stream, which
+                             holds the signals in memory.
+        generation (int): :attr:`.IORegistry.generation` at the time the
+                          plan was compiled.
+    """
+
+    def __init__(self, registry, blocks, dependencies, feeds=(), outputs=()):
+        """Initializes StreamPlan.
+
+        Args:
+            registry: Registry the plan is compiled from.
+            blocks: Blocks in topological order.
+            dependencies (dict): Maps each block to the blocks of the plan
+                                 it directly depends on.
+            feeds: Outputs whose chunks are given to :meth:`.run`.
+            outputs: Outputs whose data is returned for each chunk.
+        """
+        self.registry = registry
+        self.blocks = list(blocks)
+        self.feeds = tuple(feeds)
+        self.outputs = tuple(outputs)
+        self.generation = registry.generation
+        fed = dict.fromkeys(output.block for output in self.feeds)
+        varying = set(fed)
+        streaming = set(fed)
+        self.constants = []
+        self.streamed = []
+        self.materialised = []
+        for block in self.blocks:
+            if block in fed:
+                continue
+            if not block.side_effects and not any(
+                    dependency in varying
+                    for dependency in dependencies[block]):
+                self.constants.append(block)
+                continue
+            varying.add(block)
+            if block.streamable and all(
+                    dependency in streaming
+                    for dependency in dependencies[block]):
+                streaming.add(block)
+                self.streamed.append(block)
+            else:
+                self.materialised.append(block)
+        # The chunks of streamed outputs, which are read by materialised
+        # blocks, are collected until the end of the stream
+        self._collected = {}
+        for block in self.materialised:
+            for input_ in block.inputs:
+                output = input_.connected_output
+                if output is not None and output.block in streaming:
+                    self._collected[output] = []
+
+    def run(self, chunks):
+        """Processes a stream of chunks of the fed Outputs.
+
+        Args:
+            chunks: Iterable of dicts, which map each fed Output to its next
+                    chunk.
+
+        Yields:
+            dict: Maps :attr:`.outputs` to their data after each chunk. The
+                  Outputs of streamed blocks hold the results of the chunk,
+                  which may be None if a block waits for more data. The last
+                  dict is yielded after the end of the stream and holds the
+                  remaining data of the streamed blocks and the results of
+                  the materialised blocks.
+
+        Raises:
+            :class:`.ExecutionPlanError`: If the registry changed since the
+                                          plan was compiled or a chunk is
+                                          given for an Output which is not
+                                          fed.
+        """
+        if self.registry.generation != self.generation:
+            raise exceptions.ExecutionPlanError(
+                "The blocks changed since the plan was compiled")
+        # The data of the feeds is restored after the stream
+        fed = [(output, output._data, output._fingerprint)
+               for output in self.feeds]
+        try:
+            yield from self._stream(chunks)
+        finally:
+            for output, data, fingerprint in fed:
+                output.data = data
+                output.fingerprint = fingerprint
+            # The outputs hold the results of the last chunk, so the blocks
+            # are processed again with the whole signals when their data is
+            # accessed
+            self.registry._mark_stale(self.streamed + self.materialised)
+
+    def _stream(self, chunks):
+        """Processes the stream of chunks, see :meth:`.run`."""
+        # Consumers must not pull the blocks of the plan
+        self.registry._mark_processed(self.blocks)
+        for collected in self._collected.values():
+            collected.clear()
+        # Materialised blocks have no results until the end of the stream
+        for block in self.materialised:
+            for output in block.outputs:
+                output.data = None
+        for block in self.constants:
+            self._process(block, block.process)
+        for block in self.streamed:
+            block.start_stream()
+        for data in chunks:
+            for output, value in data.items():
+                if output not in self.feeds:
+                    raise exceptions.ExecutionPlanError(
+                        f"{output} is not fed into the plan")
+                output.data = value
+            for block in self.streamed:
+                self._process(block, block.process_chunk)
+            self._collect()
+            yield {output: output._data for output in self.outputs}
+        # The end of the stream is processed without data of the feeds
+        for output in self.feeds:
+            output.data = None
+        for block in self.streamed:
+            self._process(block, block.finish_stream)
+        self._collect()
+        for output, collected in self._collected.items():
+            output.data = concatenate(collected)
+            collected.clear()
+        for block in self.materialised:
+            self._process(block, block.process)
+        yield {output: output._data for output in self.outputs}
+
+    def _process(self, block, process):
+        """Processes a block and records it with the profiler of the
+        registry.
+        """
+        profiler = self.registry.profiler
+        if profiler is None:
+            process()
+        else:
+            with profiler.record(block):
+                process()
+
+    def _collect(self):
+        """Collects the current chunks of the Outputs read by materialised
+        blocks.
+        """
+        for output, collected in self._collected.items():
+            if output._data is not None:
+                collected.append(output._data)
@@ -1,7 +1,7 @@
 import numpy as np
 import matplotlib.colors as crl
 
-from mca.framework import parameters, validator, data_types
+from mca.framework import parameters, validator
 from mca.language import _
 
 
@@ -161,18 +161,21 @@ def fill_zeros(signals):
             )
             / increment
         )
-        # Set the signal attributes
-        new_ordinate = np.hstack(
+        # Set the signal attributes, multi-channel signals are filled along
+        # the sample axis
+        channels = signal.ordinate.shape[:-1]
+        dtype = signal.ordinate.dtype
+        new_ordinate = np.concatenate(
             (
-                np.zeros(zeros_insert),
+                np.zeros(channels + (zeros_insert,), dtype=dtype),
                 signal.ordinate,
-                np.zeros(zeros_append),
-            )
+                np.zeros(channels + (zeros_append,), dtype=dtype),
+            ),
+            axis=-1
         )
-        new_signal = data_types.Signal(abscissa_start=min_abscissa_start,
-                                       values=max_values,
-                                       increment=signal.increment,
-                                       ordinate=new_ordinate)
+        new_signal = signal.replace(abscissa_start=min_abscissa_start,
+                                    values=max_values,
+                                    ordinate=new_ordinate)
         new_signals.append(new_signal)
     return new_signals
 
@@ -208,7 +211,9 @@ def abort_any_inputs_empty(process):
 
 
 def validate_type_signal(process):
-    """Checks the data of all Inputs to be type of signal.
+    """Checks the data of all Inputs to be type of signal. Multi-channel
+    signals are only accepted by blocks which support them
+    (see :attr:`.Block.multi_channel`).
 
     This function is supposed to be used as decorator for the process method
     of a block.
@@ -216,7 +221,7 @@ def validate_type_signal(process):
     def tmp(self):
         for input_ in self.inputs:
             if input_.data is not None:
-                validator.check_type_signal(input_.data)
+                validator.check_type_signal(input_.data, self.multi_channel)
         process(self)
     return tmp
 
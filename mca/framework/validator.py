@@ -52,11 +52,13 @@ def check_intervals(signals):
                                                "due signal starts")
 
 
-def check_type_signal(data):
+def check_type_signal(data, multi_channel=False):
     """Check if the given data is a :class:`.Signal`.
 
     Args:
         data: Data object to validate.
+        multi_channel (bool): True, if a :class:`.MultiChannelSignal` is
+                              accepted as well.
 
     Raises:
         :class:`.DataTypeError`: If the given data is not a signal.
@@ -66,6 +68,27 @@ def check_type_signal(data):
             raise exceptions.DataTypeError("Block expects the data "
                                            "type signal and not {}".format(
                 type(data)))
+        if not multi_channel and \
+                isinstance(data, data_types.MultiChannelSignal):
+            raise exceptions.DataTypeError("Block does not support "
+                                           "multi-channel signals")
+
+
+def check_channels(signals):
+    """Check if the multi-channel signals have the same amount of channels.
+    Single channel signals are compatible with any amount of channels.
+
+    Args:
+        signals: List of Signals to be checked.
+
+    Raises:
+        :class:`.DataTypeError`: If the amounts of channels differ.
+    """
+    channels = {signal.channels for signal in signals
+                if isinstance(signal, data_types.MultiChannelSignal)}
+    if len(channels) > 1:
+        raise exceptions.DataTypeError("Multi-channel signals have different "
+                                       "amounts of channels")
 
 
 def check_same_units(units):
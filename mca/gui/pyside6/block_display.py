@@ -4,8 +4,8 @@ import pathlib
 
 from PySide6 import QtWidgets, QtCore, QtGui
 
-from mca.framework import load, save
-from mca.gui.pyside6 import block_item
+from mca.framework import io_registry, load, save
+from mca.gui.pyside6 import block_item, update_dispatcher
 from mca.language import _
 
 
@@ -157,16 +157,24 @@ class BlockScene(QtWidgets.QGraphicsScene):
 
     Attributes:
         block_list: Reference of the widget that holds all block classes.
+        update_dispatcher: :class:`.UpdateDispatcher` which runs updates
+                           caused by edits in the background or None, if
+                           updates run on the GUI thread.
     """
 
-    def __init__(self, parent):
+    def __init__(self, parent, background_updates=False):
         """Initializes BlockScene class.
 
         Args:
             parent: Parent of this widget.
+            background_updates (bool): True, to run updates caused by edits
+                                       in the background.
         """
         QtWidgets.QGraphicsScene.__init__(self, parent=parent)
         self.block_list = None
+        self.update_dispatcher = None
+        if background_updates:
+            self.update_dispatcher = update_dispatcher.UpdateDispatcher(self)
 
     def dragEnterEvent(self, event):
         """Method invoked when a drag enters this widget. Accepts only
@@ -194,9 +202,10 @@ class BlockScene(QtWidgets.QGraphicsScene):
 
     def clear(self):
         """Removes all items from the BlockScene."""
-        for item in self.items():
-            if isinstance(item, block_item.BlockItem):
-                item.delete()
+        with io_registry.Registry.batch():
+            for item in self.items():
+                if isinstance(item, block_item.BlockItem):
+                    item.delete()
 
     def create_block_item(self, block, pos=None, width=100, height=100,
                           open_edit_window=False):
@@ -312,9 +321,16 @@ class BlockScene(QtWidgets.QGraphicsScene):
         clipboard = app.clipboard()
         if not clipboard.mimeData().text():
             return
+        with io_registry.Registry.batch():
+            self._paste(clipboard.mimeData().text())
+
+    def _paste(self, json_string):
+        """Creates the blocks of a json string and adds them to the scene
+        centered to the mouse.
+        """
         # Check if clipboard has json string
         try:
-            pasted_blocks = load.json_to_blocks(clipboard.mimeData().text())
+            pasted_blocks = load.json_to_blocks(json_string)
         except json.decoder.JSONDecodeError:
             return
         # Map global mouse pos to view pos
@@ -361,9 +377,10 @@ class BlockScene(QtWidgets.QGraphicsScene):
 
     def delete_selected(self):
         """Deletes the selected block from the scene."""
-        for item in self.selectedItems():
-            if isinstance(item, block_item.BlockItem):
-                item.delete()
+        with io_registry.Registry.batch():
+            for item in self.selectedItems():
+                if isinstance(item, block_item.BlockItem):
+                    item.delete()
 
 
 def draw_pattern(step, color):
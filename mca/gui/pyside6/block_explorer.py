@@ -78,11 +78,13 @@ class BlockList(QtWidgets.QListWidget):
             lambda: self.scene.create_block_item(self.currentItem().data(3)())
         )
         self.menu.addAction(self.new_block_action)
-        # Add all blocks to the block list
-        for block_class in blocks.block_classes:
-            self.add_block(block_class)
+        # Add all blocks to the block list, the blocks are only imported
+        # once they get created
+        self.tag_dict = blocks.catalog.tag_dict
+        for entry in blocks.catalog.entries:
+            self.add_block(entry)
         # Add the tags to the lists
-        for tag in blocks.tag_dict.keys():
+        for tag in self.tag_dict.keys():
             self.add_tag(tag)
 
     def mouseMoveEvent(self, event):
@@ -171,7 +173,7 @@ class BlockList(QtWidgets.QListWidget):
         """Adds a block to the list.
 
         Args:
-            block: Class of the block to add.
+            block: :class:`.BlockEntry` of the block to add.
             related_block: Flag whether the block is related to a tag.
         """
         item = QtWidgets.QListWidgetItem()
@@ -179,7 +181,7 @@ class BlockList(QtWidgets.QListWidget):
         if block.icon_file:
             item.setIcon(QtGui.QIcon(os.path.dirname(
                 mca.__file__) + "/blocks/icons/" + block.icon_file))
-        # Save the block class
+        # Save the entry, calling it creates the block
         item.setData(3, block)
         # Set the list type
         item.setData(4, "block")
@@ -199,8 +201,8 @@ class BlockList(QtWidgets.QListWidget):
         """
         tag_item = TagListItem(tag_name=tag_name)
         self.addItem(tag_item)
-        for block_class in blocks.tag_dict[tag_name]:
-            block_item = self.add_block(block_class, related_block=True)
+        for entry in self.tag_dict[tag_name]:
+            block_item = self.add_block(entry, related_block=True)
             tag_item.related_blocks.append(block_item)
         return tag_item
 
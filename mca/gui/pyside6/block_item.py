@@ -27,6 +27,8 @@ class BlockItem(QtWidgets.QGraphicsItem):
         block: Instance of :class:`.Block' this block item is holding.
         default_color: Default color of the block.
         hover_color: Hover color of the block.
+        outdated_color: Color of the block while its results are computed
+                        or stale.
         selection_color: Color for the selection rectangle.
         name_color: Color of the name fonts.
         default_font: Default font of the block.
@@ -61,6 +63,7 @@ class BlockItem(QtWidgets.QGraphicsItem):
         # Color settings
         self.default_color = None
         self.hover_color = None
+        self.outdated_color = None
         self.selection_color = None
         self.name_color = None
 
@@ -121,6 +124,7 @@ class BlockItem(QtWidgets.QGraphicsItem):
             main_window.addDockWidget(QtCore.Qt.RightDockWidgetArea,
                                       dock_widget)
             block.gui_data["run_time_data"]["pyside6"]["dock_widget"] = dock_widget
+            dock_widget.visibilityChanged.connect(self.plot_visibility_changed)
             show_function = show_function_generator(self.block)
             self.action_buttons.append(
                 BlockButton(
@@ -201,10 +205,37 @@ class BlockItem(QtWidgets.QGraphicsItem):
         self.menu.addAction(self.delete_action)
         self.add_block_actions_to_menu()
 
-        self.block.update()
+        self.block.trigger_update()
 
         self.save_gui_data()
 
+    @property
+    def outdated(self):
+        """Whether the results of the block are currently computed or stale.
+        """
+        registry = self.block.registry
+        dispatcher = getattr(self.scene(), "update_dispatcher", None)
+        return registry.is_stale(self.block) or \
+            registry.is_updating(self.block) or \
+            (dispatcher is not None and self.block in dispatcher.computing)
+
+    def trigger_update(self):
+        """Triggers an update from the block. The update runs in the
+        background if the scene has an :class:`.UpdateDispatcher`.
+        """
+        dispatcher = getattr(self.scene(), "update_dispatcher", None)
+        if dispatcher is None:
+            self.block.trigger_update()
+        else:
+            dispatcher.trigger_update(self.block)
+
+    def plot_visibility_changed(self, visible):
+        """Updates the plot once it gets visible, since plots are not updated
+        while they are hidden in lazy mode.
+        """
+        if visible:
+            self.block.registry.pull(self.block)
+
     def add_block_actions_to_menu(self):
         """Add the :class:`.ActionParameter` of the block specified by
         the display_options.
@@ -272,6 +303,7 @@ class BlockItem(QtWidgets.QGraphicsItem):
         self.name_color = self.view.palette().color(QtGui.QPalette.Text)
         self.default_color = QtGui.QColor("#608a5c")
         self.hover_color = QtGui.QColor("#82bd7d")
+        self.outdated_color = QtGui.QColor("#8f9e8d")
         self.selection_color = QtGui.QColor("#259AE9")
 
         select_point_radius = self.select_point_diameter // 2
@@ -280,6 +312,8 @@ class BlockItem(QtWidgets.QGraphicsItem):
         # Draw the main block
         if self._hovering:
             painter.setBrush(self.hover_color)
+        elif self.outdated:
+            painter.setBrush(self.outdated_color)
         else:
             painter.setBrush(self.default_color)
 
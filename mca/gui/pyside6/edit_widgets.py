@@ -423,10 +423,12 @@ class FileParameterWidget(BaseParameterWidget, QtWidgets.QWidget):
 
 
 class MetaDataEditWidget(QtWidgets.QLineEdit):
-    """Widget to display attributes of metadata objects.
+    """Widget to display attributes of the user metadata of an Output.
+    Since :class:`.MetaData` is immutable, changes replace the user metadata
+    of the Output.
 
     Attributes:
-        metadata: Reference of the :class:`.MetaData` object.
+        output: Reference of the :class:`.Output` object.
         attr(str): Attribute name of the :class:`.MetaData` object.
         prev_value: Stores the last value of the attribute until changes get
                     finally applied.
@@ -434,31 +436,32 @@ class MetaDataEditWidget(QtWidgets.QLineEdit):
                         differs from the previous value.
     """
 
-    def __init__(self, metadata, attr):
+    def __init__(self, output, attr):
         """Initializes MetaDataEditWidget class.
 
         Args:
-            metadata: Reference of the :class:`.MetaData` object.
+            output: Reference of the :class:`.Output` object.
             attr(str): Attribute name of the :class:`.MetaData` object.
         """
         QtWidgets.QLineEdit.__init__(self)
-        self.metadata = metadata
+        self.output = output
         self.attr = attr
         self.changed = False
-        self.prev_value = getattr(self.metadata, self.attr)
+        self.prev_value = getattr(self.output.user_metadata, self.attr)
         self.textChanged.connect(self.check_changed)
         self.setFixedHeight(25)
 
     def write_attribute(self):
         """Writes the value from the widget to the attribute."""
         if self.changed:
-            setattr(self.metadata, self.attr, self.text())
+            self.output.user_metadata = self.output.user_metadata.replace(
+                **{self.attr: self.text()})
 
     def read_attribute(self):
         """Reads the value from the attribute and sets the widget text
         to it.
         """
-        attr = getattr(self.metadata, self.attr)
+        attr = getattr(self.output.user_metadata, self.attr)
         if isinstance(attr, Unit):
             attr = repr(attr)
         self.setText(attr)
@@ -467,7 +470,7 @@ class MetaDataEditWidget(QtWidgets.QLineEdit):
         """Checks whether the value has been changed compared to the
         previous value.
         """
-        attr = getattr(self.metadata, self.attr)
+        attr = getattr(self.output.user_metadata, self.attr)
         if isinstance(attr, Unit):
             attr = repr(attr)
         if attr != self.text():
@@ -481,7 +484,7 @@ class MetaDataEditWidget(QtWidgets.QLineEdit):
     def apply_changes(self):
         """Accepts changes to the attribute."""
         self.changed = False
-        self.prev_value = getattr(self.metadata, self.attr)
+        self.prev_value = getattr(self.output.user_metadata, self.attr)
         self.setStyleSheet("")
         self.window().block_item.modified()
 
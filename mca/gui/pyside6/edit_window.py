@@ -25,7 +25,8 @@ class EditWindow(QtWidgets.QDialog):
         warning_message: Dialogue window which pops up when errors occur during
                          editing.
         button_box: "Apply|Cancel|Ok" button widgets.
-
+        update_timer: Timer which delays applying changes, so successive
+                      edits only cause a single update of the blocks.
     """
 
     def __init__(self, block_item, block):
@@ -175,6 +176,13 @@ class EditWindow(QtWidgets.QDialog):
         self.button_box.rejected.connect(self.reject)
         self.button_box.clicked.connect(self.apply)
         self.main_layout.addWidget(self.button_box)
+        # Delay of the updates in ms
+        self.update_timer = QtCore.QTimer(self)
+        self.update_timer.setSingleShot(True)
+        self.update_timer.setInterval(
+            block_item.view.window().conf["update_debounce"])
+        self.update_timer.timeout.connect(self.apply_pending_changes)
+        self.pending_changes = (False, False, False)
         # Set custom window icon
         if self.block.icon_file:
             icon = QtGui.QIcon(os.path.dirname(
@@ -262,7 +270,7 @@ class EditWindow(QtWidgets.QDialog):
                                 (_("Ordinate unit:"), "unit_o"))
             for label, attribute in label_attributes:
                 entry_edit_line = edit_widgets.MetaDataEditWidget(
-                    metadata=output.user_metadata, attr=attribute
+                    output=output, attr=attribute
                 )
                 entry_edit_line.read_attribute()
                 entry_edit_line.setMaximumHeight(25)
@@ -343,13 +351,14 @@ class EditWindow(QtWidgets.QDialog):
     def accept(self):
         """Applies changes to all parameters and closes the window."""
         self.apply_changes()
+        self.flush_changes()
         super(EditWindow, self).accept()
 
     def apply_changes(self, parameter_changes=True, metadata_changes=True,
                       plot_parameter_changes=True):
-        """Tries to apply changes. In case of an error the user gets a
-        notification and can choose between reverting his last changes or
-        continue editing and potentially fix the error.
+        """Schedules applying the changes. Changes which are made within the
+        interval of the :attr:`.update_timer` are applied together, so the
+        blocks only get updated once.
 
         Args:
             parameter_changes (bool): True, if changes to the parameters
@@ -359,6 +368,27 @@ class EditWindow(QtWidgets.QDialog):
             plot_parameter_changes (bool): True, if changes to the
                                            plot_parameters should be applied.
         """
+        self.pending_changes = tuple(
+            pending or changes for pending, changes in zip(
+                self.pending_changes,
+                (parameter_changes, metadata_changes,
+                 plot_parameter_changes)))
+        self.update_timer.start()
+
+    def flush_changes(self):
+        """Applies the scheduled changes immediately."""
+        if self.update_timer.isActive():
+            self.update_timer.stop()
+            self.apply_pending_changes()
+
+    def apply_pending_changes(self):
+        """Tries to apply the scheduled changes. In case of an error the user
+        gets a notification and can choose between reverting his last
+        changes or continue editing and potentially fix the error.
+        """
+        parameter_changes, metadata_changes, plot_parameter_changes = \
+            self.pending_changes
+        self.pending_changes = (False, False, False)
         # Try writing the parameters
         try:
             if parameter_changes:
@@ -370,7 +400,7 @@ class EditWindow(QtWidgets.QDialog):
             if plot_parameter_changes:
                 for plot_parameter in self.plot_parameter_widgets:
                     plot_parameter.write_parameter()
-            self.block.trigger_update()
+            self.block_item.trigger_update()
             self.block_item.update()
         # Catch all exceptions and display them as a message
         except Exception as error:
@@ -395,13 +425,15 @@ class EditWindow(QtWidgets.QDialog):
 
     def revert_changes(self):
         """Revert the last changes made."""
+        self.update_timer.stop()
+        self.pending_changes = (False, False, False)
         for parameter_widget in self.parameter_widgets:
             parameter_widget.revert_changes()
         for entry in self.metadata_widgets:
             entry.revert_changes()
         for entry in self.plot_parameter_widgets:
             entry.revert_changes()
-        self.block.trigger_update()
+        self.block_item.trigger_update()
 
     def reject(self):
         """Reverts all not applied changes and closes the window."""
@@ -411,6 +443,7 @@ class EditWindow(QtWidgets.QDialog):
     def closeEvent(self, e):
         """Event triggered when the window get closed."""
         self.apply_changes()
+        self.flush_changes()
         super(EditWindow, self).closeEvent(e)
 
     def show(self):
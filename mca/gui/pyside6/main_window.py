@@ -5,7 +5,7 @@ from pathlib import Path
 from PySide6 import QtWidgets, QtGui
 
 from mca import config
-from mca.framework import save, load
+from mca.framework import cache, io_registry, save, load
 from mca.gui.pyside6 import block_explorer, block_display, about_window, introduction_window
 from mca.language import _
 
@@ -32,6 +32,20 @@ class MainWindow(QtWidgets.QMainWindow):
         """
         QtWidgets.QMainWindow.__init__(self)
         self.conf = config.Config()
+        io_registry.Registry.lazy = self.conf["lazy_evaluation"]
+        io_registry.Registry.dtype_policy = self.conf["dtype_policy"]
+        # The sizes of the caches are given in MiB
+        caches = []
+        if self.conf["memory_cache_size"]:
+            caches.append(cache.MemoryCache(
+                self.conf["memory_cache_size"] * 2 ** 20))
+        if self.conf["disk_cache_size"]:
+            caches.append(cache.DiskCache(
+                max_bytes=self.conf["disk_cache_size"] * 2 ** 20))
+        if len(caches) == 1:
+            io_registry.Registry.cache = caches[0]
+        elif caches:
+            io_registry.Registry.cache = cache.TieredCache(caches)
 
         self.showMaximized()
 
@@ -49,7 +63,8 @@ class MainWindow(QtWidgets.QMainWindow):
 
         self.main_widget = QtWidgets.QSplitter(self)
 
-        self.block_scene = block_display.BlockScene(self.main_widget)
+        self.block_scene = block_display.BlockScene(
+            self.main_widget, self.conf["background_updates"])
         self.block_view = block_display.BlockView(scene=self.block_scene,
                                                   parent=self)
         self.block_view.show()
@@ -163,6 +178,8 @@ class MainWindow(QtWidgets.QMainWindow):
         save unsaved changes.
         """
         if self.save_maybe():
+            if self.block_scene.update_dispatcher is not None:
+                self.block_scene.update_dispatcher.shutdown()
             event.accept()
         else:
             event.ignore()
@@ -208,15 +225,16 @@ class MainWindow(QtWidgets.QMainWindow):
                                           _("File does not exist"),
                                           QtWidgets.QMessageBox.Ok)
             return
-        self.block_scene.clear()
-        loaded_blocks = load.load_block_structure(file_path)
+        with io_registry.Registry.batch():
+            self.block_scene.clear()
+            loaded_blocks = load.load_block_structure(file_path)
+            self.block_scene.create_blocks(loaded_blocks)
         self.save_file_path = file_path
         self.conf["load_file_dir"] = file_path
         if file_path in self.conf["recent_files"]:
             self.conf["recent_files"].remove(file_path)
         self.conf["recent_files"] = [file_path] + self.conf["recent_files"][:3]
         self.update_recent_menu()
-        self.block_scene.create_blocks(loaded_blocks)
         self.modified = False
 
     def update_recent_menu(self):
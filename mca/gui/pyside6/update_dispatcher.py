@@ -0,0 +1,112 @@
+import collections
+import concurrent.futures
+import logging
+
+from PySide6 import QtWidgets, QtCore
+
+from mca.language import _
+
+
+class UpdateDispatcher(QtCore.QObject):
+    """Dispatches the updates caused by changes in the GUI to a background
+    thread, so the GUI stays responsive while blocks are processing. Blocks
+    which are not thread safe, e.g. plots, are deferred and updated on the
+    GUI thread once the update in the background has finished.
+
+    The dispatcher should be a child of the :class:`.BlockScene`, which gets
+    repainted when the state of the blocks changes.
+
+    Attributes:
+        computing (collections.Counter): Amount of requested or running
+                                         updates of each block.
+        finished: Signal emitted with the block after its update has
+                  finished in the background.
+        failed: Signal emitted with the block and the raised exception if
+                its update failed.
+    """
+    finished = QtCore.Signal(object)
+    failed = QtCore.Signal(object, object)
+
+    def __init__(self, parent=None):
+        """Initializes UpdateDispatcher.
+
+        Args:
+            parent: Parent of the dispatcher.
+        """
+        super().__init__(parent)
+        self.computing = collections.Counter()
+        # Blocks whose update has been requested but not started yet
+        self._queued = set()
+        # A single worker keeps the updates in the order of the requests
+        self._pool = concurrent.futures.ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="mca-update")
+        self.finished.connect(self.finish)
+        self.failed.connect(self.fail)
+
+    def trigger_update(self, block):
+        """Requests the update of the blocks affected by a change of the
+        block. An update of the block which is still in progress gets
+        cancelled since its results are outdated.
+
+        Args:
+            block: Block in which the change occurred.
+        """
+        block.registry.cancel(block)
+        # Requests which have not been started yet are merged
+        if block not in self._queued:
+            self._queued.add(block)
+            self.computing[block] += 1
+            self._pool.submit(self._run, block)
+        self.repaint()
+
+    def _run(self, block):
+        """Updates the blocks affected by a change of the block on the
+        background thread.
+        """
+        self._queued.discard(block)
+        try:
+            with block.registry.background():
+                block.trigger_update()
+        except Exception as error:
+            self.failed.emit(block, error)
+        else:
+            self.finished.emit(block)
+
+    def _done(self, block):
+        """Removes a finished update of the block."""
+        self.computing[block] -= 1
+        if self.computing[block] <= 0:
+            del self.computing[block]
+
+    def finish(self, block):
+        """Draws the plots deferred by the update on the GUI thread."""
+        self._done(block)
+        try:
+            block.registry.pull_deferred()
+        except Exception as error:
+            self._show_error(error)
+        self.repaint()
+
+    def fail(self, block, error):
+        """Informs the user about an update which failed."""
+        self._done(block)
+        self.repaint()
+        self._show_error(error)
+
+    def _show_error(self, error):
+        """Shows an error raised while updating the blocks."""
+        logging.error(repr(error))
+        QtWidgets.QMessageBox.warning(
+            None, _("MCA"),
+            _("Could not update the blocks") + "\n" + repr(error),
+            QtWidgets.QMessageBox.Ok)
+
+    def repaint(self):
+        """Repaints the block items to show whether they are up-to-date."""
+        parent = self.parent()
+        if parent is not None:
+            parent.update()
+
+    def shutdown(self):
+        """Waits for the running update and stops the background thread."""
+        self._pool.shutdown()
@@ -1,17 +1,22 @@
 import argparse
 import logging
 import os
+import sys
 
 import appdirs
 
 import mca
-from mca.gui.pyside6 import main as pyside6_main
 
 
 def main():
     """Main function of mca. Parses command line arguments and chooses a
-    GUI to start.
+    GUI to start. The subcommand ``run`` processes a block structure
+    without GUI (see :mod:`mca.batch`).
     """
+    if sys.argv[1:2] == ["run"]:
+        # The batch run must not import Qt
+        from mca import batch
+        sys.exit(batch.main(sys.argv[2:]))
     log_folder = appdirs.user_log_dir(appname="mca")
     if not os.path.exists(log_folder):
         os.makedirs(log_folder)
@@ -35,6 +40,7 @@ def main():
         return
 
     if args["gui"] == "pyside6":
+        from mca.gui.pyside6 import main as pyside6_main
         pyside6_main.main(args["file"])
 
 
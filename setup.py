@@ -32,9 +32,14 @@ setup(
 
     # Runtime dependencies
     install_requires=[
-        'numpy', 'scipy', 'networkx', 'matplotlib', 'appdirs', 'PySide6',
+        'numpy', 'scipy', 'matplotlib', 'appdirs', 'PySide6',
         'united', 'sounddevice', 'handyscope', 'dsch'],
 
+    # Optional dependencies
+    extras_require={
+        'graph': ['networkx'],  # For IORegistry.to_networkx
+    },
+
     # Python version requirement
     python_requires='>=3',
 
@@ -0,0 +1,109 @@
+import json
+import subprocess
+import sys
+
+import dsch
+import numpy as np
+import pytest
+
+from mca import batch, blocks, exceptions
+from mca.framework import data_types, io_registry, save
+
+
+@pytest.fixture
+def structure(tmp_path):
+    """Saves a structure loading a signal, amplifying it and saving it."""
+    io_registry.Registry.clear()
+    loader = blocks.SignalLoader()
+    amplifier = blocks.Amplifier(multiplier={"factor": 2})
+    saver = blocks.SignalSaver(name="Result")
+    amplifier.inputs[0].connect(loader.outputs[0])
+    saver.inputs[0].connect(amplifier.outputs[0])
+    structure = json.loads(save.blocks_to_json([loader, amplifier, saver]))
+    # Plots are left out of headless runs
+    structure["blocks"].append({"class": str(blocks.Plot)})
+    io_registry.Registry.clear()
+    return structure
+
+
+def write_signal(file_name, value):
+    """Saves a constant signal with the SignalSaver."""
+    registry = io_registry.IORegistry()
+    with registry.activate():
+        generator = blocks.DCGenerator(dc_value=value)
+        saver = blocks.SignalSaver(file_name=str(file_name))
+        saver.inputs[0].connect(generator.outputs[0])
+        generator.trigger_update()
+        saver.save_data()
+
+
+def read_signal(file_name):
+    storage = dsch.load(storage_path=str(file_name),
+                        required_schema=data_types.signal_schema)
+    return storage.data.signal.ordinate.value
+
+
+def test_make_jobs(structure):
+    jobs = batch.make_jobs(structure, ["in/a.npz", "in/b.npz"],
+                           outputs=[("Result", "out/{stem}.npz")],
+                           manifest={"parameters": {"Amplifier.x": 1}},
+                           overrides={"Amplifier.x": 2})
+    assert jobs == [
+        {"Amplifier.x": 2, "Signal Loader": "in/a.npz",
+         "Result": "out/a.npz"},
+        {"Amplifier.x": 2, "Signal Loader": "in/b.npz",
+         "Result": "out/b.npz"}]
+
+
+def test_batch_runner(structure, tmp_path):
+    runner = batch.BatchRunner(structure)
+    assert len(runner.blocks) == 3
+    assert runner.parameter("Amplifier.multiplier.factor").value == 2
+    with pytest.raises(exceptions.BatchError):
+        runner.parameter("Amplifier.missing")
+    with pytest.raises(exceptions.BatchError):
+        runner.parameter("Missing")
+    write_signal(tmp_path / "a.npz", 3)
+    saved = runner.run({"Signal Loader": str(tmp_path / "a.npz"),
+                        "Result": str(tmp_path / "out" / "a.npz"),
+                        "Amplifier.multiplier.factor": 4})
+    assert saved == [str(tmp_path / "out" / "a.npz")]
+    np.testing.assert_allclose(read_signal(saved[0]), 12)
+    assert runner.parameter("Amplifier.multiplier.factor").value == 2
+
+
+def test_batch_runner_processes_once(structure, tmp_path, monkeypatch):
+    runner = batch.BatchRunner(structure)
+    amplifier = next(block for block in runner.blocks
+                     if isinstance(block, blocks.Amplifier))
+    counts = []
+    process = amplifier.process
+    monkeypatch.setattr(amplifier, "process",
+                        lambda: counts.append(1) or process())
+    for value in range(1, 3):
+        write_signal(tmp_path / f"{value}.npz", value)
+        runner.run({"Signal Loader": str(tmp_path / f"{value}.npz"),
+                    "Result": str(tmp_path / "out" / f"{value}.npz"),
+                    "Amplifier.multiplier.factor": 4})
+        assert len(counts) == value
+    np.testing.assert_allclose(read_signal(tmp_path / "out" / "2.npz"), 8)
+
+
+def test_run_jobs(structure, tmp_path):
+    files = []
+    for value in range(1, 4):
+        files.append(str(tmp_path / f"{value}.npz"))
+        write_signal(files[-1], value)
+    jobs = batch.make_jobs(
+        structure, files, outputs=[("Result", str(tmp_path / "{stem}_out.npz"))])
+    futures = batch.run_jobs(structure, jobs, workers=2)
+    for value, future in enumerate(futures, 1):
+        np.testing.assert_allclose(read_signal(future.result()[0]),
+                                   2 * value)
+
+
+def test_batch_without_qt():
+    code = ("import sys, mca.batch; "
+            "sys.exit(any(name.startswith(('PySide6', 'sounddevice')) "
+            "for name in sys.modules))")
+    assert subprocess.run([sys.executable, "-c", code]).returncode == 0
@@ -165,7 +165,7 @@ def dynamic_output_scenario(add_output_scenario, two_input_one_output_block,
 
 def test_connect(basic_scenario):
     a, b = basic_scenario
-    assert [a.outputs[0], b.inputs[0]] in mca.framework.io_registry.Registry._graph.edges
+    assert [a.outputs[0], b.inputs[0]] in mca.framework.io_registry.Registry.to_networkx().edges
 
 
 def test_connect_2(one_input_block):
@@ -190,12 +190,12 @@ def test_disconnect_input(basic_scenario):
     assert [
         a.outputs[0],
         b.inputs[0],
-    ] not in mca.framework.io_registry.Registry._graph.edges
+    ] not in mca.framework.io_registry.Registry.to_networkx().edges
     b.inputs[0].disconnect()
     assert [
         a.outputs[0],
         b.inputs[0],
-    ] not in mca.framework.io_registry.Registry._graph.edges
+    ] not in mca.framework.io_registry.Registry.to_networkx().edges
 
 
 def test_disconnect_output(basic_scenario, one_input_block):
@@ -206,16 +206,16 @@ def test_disconnect_output(basic_scenario, one_input_block):
     assert [
         a.outputs[0],
         b.inputs[0],
-    ] not in mca.framework.io_registry.Registry._graph.edges
+    ] not in mca.framework.io_registry.Registry.to_networkx().edges
     assert [
         a.outputs[0],
         c.inputs[0],
-    ] not in mca.framework.io_registry.Registry._graph.edges
+    ] not in mca.framework.io_registry.Registry.to_networkx().edges
     a.outputs[0].disconnect()
     assert [
         a.outputs[0],
         c.inputs[0],
-    ] not in mca.framework.io_registry.Registry._graph.edges
+    ] not in mca.framework.io_registry.Registry.to_networkx().edges
 
 
 def test_get_output(basic_scenario):
@@ -386,13 +386,26 @@ def test_block_circle_error_2(one_output_block, two_input_one_output_block):
     mca.framework.io_registry.Registry.clear()
 
 
+def test_block_circle_error_not_connected(one_output_block,
+                                          two_input_one_output_block):
+    a = one_output_block()
+    b = two_input_one_output_block()
+    c = two_input_one_output_block()
+    b.inputs[0].connect(a.outputs[0])
+    c.inputs[0].connect(b.outputs[0])
+    with pytest.raises(exceptions.BlockCircleError):
+        b.inputs[1].connect(c.outputs[0])
+    assert b.inputs[1].connected_output is None
+    mca.framework.io_registry.Registry.clear()
+
+
 """Tests concerning the dynamic block."""
 
 
 def test_add_input(add_input_scenario, dynamic_output_block):
     a = add_input_scenario
     assert len(a.inputs) == 3
-    assert [a.inputs[1], a.outputs[0]] in mca.framework.io_registry.Registry._graph.edges
+    assert [a.inputs[1], a.outputs[0]] in mca.framework.io_registry.Registry.to_networkx().edges
     with pytest.raises(exceptions.DynamicIOError):
         a.add_input(mca.framework.block_io.Input(a))
     b = dynamic_output_block()
@@ -411,7 +424,7 @@ def test_add_input_2(dynamic_input_block):
 def test_delete_input(delete_input_scenario, dynamic_output_block):
     a = delete_input_scenario
     assert len(a.inputs) == 2
-    assert all([x in mca.framework.io_registry.Registry._graph.nodes() for x in a.inputs])
+    assert all([x in mca.framework.io_registry.Registry.to_networkx().nodes() for x in a.inputs])
     a.delete_input(1)
     with pytest.raises(exceptions.DynamicIOError):
         a.delete_input(0)
@@ -436,7 +449,7 @@ def test_dynamic_input_data(dynamic_input_scenario):
 def test_add_output(add_output_scenario):
     a = add_output_scenario
     assert len(a.outputs) == 3
-    assert [a.inputs[0], a.outputs[2]] in mca.framework.io_registry.Registry._graph.edges
+    assert [a.inputs[0], a.outputs[2]] in mca.framework.io_registry.Registry.to_networkx().edges
     with pytest.raises(exceptions.DynamicIOError):
         a.add_output(mca.framework.block_io.Output(a))
         a.add_output(mca.framework.block_io.Output(a))
@@ -445,7 +458,7 @@ def test_add_output(add_output_scenario):
 def test_delete_output(delete_output_scenario):
     a = delete_output_scenario
     assert len(a.outputs) == 2
-    assert all([x in mca.framework.io_registry.Registry._graph.nodes()
+    assert all([x in mca.framework.io_registry.Registry.to_networkx().nodes()
                 for x in a.outputs])
     a.delete_output(1)
     with pytest.raises(exceptions.DynamicIOError):
@@ -504,11 +517,11 @@ def test_disconnect_all(seventh_scenario):
     a, b, c, d = seventh_scenario
     c.disconnect_all()
     assert [a.outputs[0],
-            c.inputs[0]] not in mca.framework.io_registry.Registry._graph.edges
+            c.inputs[0]] not in mca.framework.io_registry.Registry.to_networkx().edges
     assert [b.outputs[0],
-            c.inputs[1]] not in mca.framework.io_registry.Registry._graph.edges
+            c.inputs[1]] not in mca.framework.io_registry.Registry.to_networkx().edges
     assert [c.outputs[0],
-            d.inputs[0]] not in mca.framework.io_registry.Registry._graph.edges
+            d.inputs[0]] not in mca.framework.io_registry.Registry.to_networkx().edges
 
 
 def test_output_metadata(default_metadata):
@@ -545,3 +558,16 @@ def test_output_metadata(default_metadata):
     result_metadata = output.metadata
     assert result_metadata == output_metadata
 
+
+def test_output_metadata_cached(default_metadata):
+    output = mca.framework.block_io.Output()
+    output.process_metadata = default_metadata
+    result_metadata = output.metadata
+    assert output.metadata is result_metadata
+    output.user_metadata = output.user_metadata.replace(name="renamed")
+    assert output.metadata is not result_metadata
+    assert output.metadata.name == "renamed"
+    result_metadata = output.metadata
+    output.process_metadata = default_metadata.replace(unit_o="A")
+    assert output.metadata is not result_metadata
+    assert output.metadata.unit_o == mca.framework.data_types.string_to_unit("A")
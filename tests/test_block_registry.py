@@ -1,11 +1,17 @@
-from mca.framework import io_registry
+import threading
+
+import numpy as np
+import pytest
+
+from mca import blocks, exceptions
+from mca.framework import executors, io_registry
 
 
 def test_clear(one_input_one_output_block):
     one_input_one_output_block()
-    assert io_registry.Registry._graph.nodes
+    assert io_registry.Registry.to_networkx().nodes
     io_registry.Registry.clear()
-    assert not io_registry.Registry._graph.nodes
+    assert not io_registry.Registry.to_networkx().nodes
 
 
 def test_get_all_blocks(one_input_block, one_output_block):
@@ -27,6 +33,316 @@ def test_remove_block(one_input_block, one_input_one_output_block):
     a.inputs[0].connect(b.outputs[0])
     io_registry.Registry.remove_block(b)
     assert a.inputs[0].connected_output is None
-    assert b.inputs[0] not in io_registry.Registry._graph.nodes
-    assert b.outputs[0] not in io_registry.Registry._graph.nodes
+    assert b.inputs[0] not in io_registry.Registry.to_networkx().nodes
+    assert b.outputs[0] not in io_registry.Registry.to_networkx().nodes
     assert b not in io_registry.Registry.get_all_blocks()
+
+
+def test_update_unequal_paths(one_output_block, one_input_one_output_block,
+                              two_input_one_output_block, one_input_block):
+    io_registry.Registry.clear()
+    a = one_output_block()
+    b = one_input_one_output_block()
+    c = one_input_one_output_block()
+    d = two_input_one_output_block()
+    e = one_input_block()
+    b.inputs[0].connect(a.outputs[0])
+    c.inputs[0].connect(b.outputs[0])
+    d.inputs[0].connect(a.outputs[0])
+    d.inputs[1].connect(c.outputs[0])
+    e.inputs[0].connect(d.outputs[0])
+    counts = [x.process_count for x in (a, b, c, d, e)]
+    assert a.trigger_update() == 5
+    assert [x.process_count for x in (a, b, c, d, e)] == [
+        count + 1 for count in counts]
+    assert e.inputs[0].data == 4
+    io_registry.Registry.clear()
+
+
+def test_update_report_count(one_output_block, one_input_block):
+    io_registry.Registry.clear()
+    a = one_output_block()
+    # Blocks without consumers are not updated
+    assert a.trigger_update() == 0
+    b = one_input_block()
+    c = one_input_block()
+    b.inputs[0].connect(a.outputs[0])
+    c.inputs[0].connect(a.outputs[0])
+    assert a.trigger_update() == 3
+    io_registry.Registry.clear()
+
+
+def test_batch(one_output_block, one_input_one_output_block, one_input_block):
+    io_registry.Registry.clear()
+    a = one_output_block()
+    b = one_input_one_output_block()
+    c = one_input_block()
+    with io_registry.Registry.batch():
+        b.inputs[0].connect(a.outputs[0])
+        c.inputs[0].connect(b.outputs[0])
+        assert a.trigger_update() == 0
+        assert b.process_count == 0
+        assert c.process_count == 0
+    assert b.process_count == 1
+    assert c.process_count == 1
+    io_registry.Registry.clear()
+
+
+def test_batch_remove_block(one_output_block, one_input_one_output_block,
+                            one_input_block):
+    io_registry.Registry.clear()
+    a = one_output_block()
+    b = one_input_one_output_block()
+    c = one_input_block()
+    with io_registry.Registry.batch():
+        b.inputs[0].connect(a.outputs[0])
+        c.inputs[0].connect(b.outputs[0])
+        b.delete()
+    assert c.inputs[0].connected_output is None
+    assert c.process_count == 1
+    io_registry.Registry.clear()
+
+
+def test_batch_exception(one_output_block, one_input_one_output_block,
+                         one_input_block):
+    io_registry.Registry.clear()
+    a = one_output_block()
+    b = one_input_one_output_block()
+    c = one_input_block()
+    with pytest.raises(ValueError):
+        with io_registry.Registry.batch():
+            b.inputs[0].connect(a.outputs[0])
+            c.inputs[0].connect(b.outputs[0])
+            raise ValueError
+    assert b.process_count == 0
+    assert c.process_count == 0
+    assert io_registry.Registry.is_stale(b)
+    assert io_registry.Registry.is_stale(c)
+    io_registry.Registry.pull(c)
+    assert b.process_count == 1
+    assert c.process_count == 1
+    io_registry.Registry.clear()
+
+
+def test_batch_other_thread(one_output_block, one_input_block):
+    io_registry.Registry.clear()
+    a = one_output_block()
+    b = one_input_block()
+    c = one_output_block()
+    d = one_input_block()
+    b.inputs[0].connect(a.outputs[0])
+    with io_registry.Registry.batch():
+        d.inputs[0].connect(c.outputs[0])
+        counts = []
+
+        def update():
+            with io_registry.Registry.background():
+                counts.append(a.trigger_update())
+
+        # Updates in the background are not deferred by the batch
+        thread = threading.Thread(target=update)
+        thread.start()
+        thread.join()
+        assert counts == [2]
+        assert b.process_count == 2
+        assert d.process_count == 0
+    assert d.process_count == 1
+    io_registry.Registry.clear()
+
+
+def test_activate(one_output_block, one_input_block):
+    io_registry.Registry.clear()
+    registry = io_registry.IORegistry()
+    with registry.activate():
+        assert io_registry.current_registry() is registry
+        a = one_output_block()
+        b = one_input_block()
+        b.inputs[0].connect(a.outputs[0])
+    assert io_registry.current_registry() is io_registry.Registry
+    assert a.registry is registry
+    assert b.inputs[0].registry is registry
+    assert not io_registry.Registry.get_all_blocks()
+    assert set(registry.get_all_blocks()) == {a, b}
+    assert a.trigger_update() == 2
+    c = one_input_block()
+    with pytest.raises(exceptions.BlockConnectionError):
+        c.inputs[0].connect(a.outputs[0])
+    io_registry.Registry.clear()
+
+
+def test_lazy(one_output_block, one_input_one_output_block, one_input_block):
+    registry = io_registry.IORegistry(lazy=True)
+    with registry.activate():
+        a = one_output_block()
+        b = one_input_one_output_block()
+        c = one_input_one_output_block()
+        b.inputs[0].connect(a.outputs[0])
+        c.inputs[0].connect(b.outputs[0])
+    assert a.trigger_update() == 0
+    assert registry.is_stale(c)
+    assert b.process_count == 0
+    # Accessing the data pulls the stale blocks
+    assert c.outputs[0].data == 3
+    assert b.process_count == 1
+    assert c.process_count == 1
+    assert not registry.is_stale(b)
+    assert c.outputs[0].data == 3
+    assert c.process_count == 1
+
+
+def test_lazy_observed(one_output_block, one_input_one_output_block):
+    class ObservedBlock(one_input_one_output_block):
+        is_observed = True
+
+    registry = io_registry.IORegistry(lazy=True)
+    with registry.activate():
+        a = one_output_block()
+        b = one_input_one_output_block()
+        c = ObservedBlock()
+        d = one_input_one_output_block()
+        b.inputs[0].connect(a.outputs[0])
+        c.inputs[0].connect(b.outputs[0])
+        d.inputs[0].connect(a.outputs[0])
+    # Only the observed block and the blocks it depends on get updated
+    assert a.trigger_update() == 3
+    assert c.process_count == 2
+    assert d.process_count == 0
+    assert registry.is_stale(d)
+
+
+def test_dead_branch(one_output_block, one_input_one_output_block,
+                     one_input_block):
+    io_registry.Registry.clear()
+    a = one_output_block()
+    b = one_input_one_output_block()
+    c = one_input_block()
+    d = one_input_one_output_block()
+    b.inputs[0].connect(a.outputs[0])
+    c.inputs[0].connect(b.outputs[0])
+    d.inputs[0].connect(a.outputs[0])
+    # Connecting updates the block once
+    assert d.process_count == 1
+    assert a.trigger_update() == 3
+    assert d.process_count == 1
+    assert io_registry.Registry.is_stale(d)
+    # Inspecting the data updates the block
+    assert d.outputs[0].data == 2
+    assert d.process_count == 2
+    d.outputs[0].pinned = True
+    assert a.trigger_update() == 4
+    assert d.process_count == 3
+    io_registry.Registry.clear()
+
+
+def test_early_cutoff(one_output_block, one_input_one_output_block,
+                      one_input_block):
+    class ComparingBlock(one_output_block):
+        compare_outputs = True
+
+    io_registry.Registry.clear()
+    a = ComparingBlock()
+    b = one_input_one_output_block()
+    c = one_input_block()
+    b.inputs[0].connect(a.outputs[0])
+    c.inputs[0].connect(b.outputs[0])
+    assert a.trigger_update() == 3
+    # The output of a does not change, so b and c are skipped
+    version = a.outputs[0].version
+    assert a.trigger_update() == 1
+    assert a.outputs[0].version == version
+    assert b.process_count == 2
+    assert c.process_count == 2
+    # Changes of a block itself are always processed and the new data of
+    # blocks which do not compare their outputs is always propagated
+    assert b.trigger_update() == 2
+    assert b.process_count == 3
+    assert c.process_count == 3
+    io_registry.Registry.clear()
+
+
+def test_early_cutoff_limiter():
+    io_registry.Registry.clear()
+    a = blocks.SignalGeneratorPeriodic(signal_type="rect", amp=2)
+    b = blocks.Limiter(mode="bipolar", threshold=1)
+    c = blocks.Amplifier(multiplier={"factor": 3})
+    c.outputs[0].pinned = True
+    b.inputs[0].connect(a.outputs[0])
+    c.inputs[0].connect(b.outputs[0])
+    a.trigger_update()
+    a.parameters["amp"].value = 3
+    assert a.trigger_update() == 2
+    a.parameters["amp"].value = 0.5
+    assert a.trigger_update() == 3
+    assert np.max(c.outputs[0].data.ordinate) == 1.5
+    io_registry.Registry.clear()
+
+
+def test_superseded_update(one_output_block, one_input_one_output_block,
+                           one_input_block):
+    io_registry.Registry.clear()
+    threads = []
+    processed = threading.Event()
+
+    class NotifyingBlock(one_output_block):
+        def process(self):
+            super().process()
+            processed.set()
+
+    class SlowBlock(one_input_one_output_block):
+        def process(self):
+            super().process()
+            if threads:
+                return
+            # A newer change arrives while the block is processing
+            threads.append(threading.Thread(target=a.trigger_update))
+            processed.clear()
+            threads[0].start()
+            assert processed.wait(timeout=10)
+
+    a = NotifyingBlock()
+    b = SlowBlock()
+    c = one_input_block()
+    threads.append(None)
+    b.inputs[0].connect(a.outputs[0])
+    c.inputs[0].connect(b.outputs[0])
+    threads.clear()
+    count = c.process_count
+    # The update gets cancelled before c, the newer update updates c
+    assert a.trigger_update() == 2
+    threads[0].join()
+    assert c.process_count == count + 1
+    assert not io_registry.Registry.is_stale(c)
+    io_registry.Registry.clear()
+
+
+def test_cancellation_token(one_output_block):
+    token = executors.CancellationToken()
+    blocks = [one_output_block() for _ in range(3)]
+
+    def update(block):
+        token.cancel()
+        return True
+
+    assert executors.SerialExecutor().run(
+        blocks, {block: set() for block in blocks}, update, token) == 1
+
+
+def test_background(one_output_block, one_input_block):
+    io_registry.Registry.clear()
+
+    class MainThreadBlock(one_input_block):
+        thread_safe = False
+
+    a = one_output_block()
+    b = MainThreadBlock()
+    c = one_input_block()
+    b.inputs[0].connect(a.outputs[0])
+    c.inputs[0].connect(a.outputs[0])
+    with io_registry.Registry.background():
+        assert a.trigger_update() == 2
+    assert b.process_count == 1
+    assert c.process_count == 2
+    assert io_registry.Registry.is_stale(b)
+    assert io_registry.Registry.pull_deferred() == 1
+    assert b.process_count == 2
+    io_registry.Registry.clear()
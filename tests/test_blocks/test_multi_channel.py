@@ -0,0 +1,61 @@
+import numpy as np
+import pytest
+
+from mca import blocks, exceptions
+from mca.framework import data_types
+
+rng = np.random.default_rng(0)
+multi_channel_signal = data_types.MultiChannelSignal(
+    0, 256, 0.01, rng.standard_normal((3, 256)))
+
+test_cases = [
+    (blocks.Amplifier, {"multiplier": {"factor": 2}}),
+    (blocks.Envelope, {}),
+    (blocks.FFT, {}),
+    (blocks.IRRFilter, {}),
+    (blocks.PowerSpectrum, {}),
+    (blocks.Resample, {"sample_freq": 50}),
+    (blocks.Window, {}),
+]
+
+
+@pytest.mark.parametrize("block_class, kwargs", test_cases)
+def test_channels_processed_at_once(block_class, kwargs, test_output_block):
+    block = block_class(**kwargs)
+    block.inputs[0].connect(test_output_block(multi_channel_signal).outputs[0])
+    result = block.outputs[0].data
+    assert isinstance(result, data_types.MultiChannelSignal)
+    assert result.channels == multi_channel_signal.channels
+    for index in range(multi_channel_signal.channels):
+        single = block_class(**kwargs)
+        single.inputs[0].connect(test_output_block(
+            multi_channel_signal.channel(index)).outputs[0])
+        assert result.channel(index) == single.outputs[0].data
+
+
+def test_adder_broadcasts_single_channel(test_output_block):
+    single = data_types.Signal(0, 256, 0.01, np.ones(256))
+    adder = blocks.Adder()
+    adder.inputs[0].connect(test_output_block(multi_channel_signal).outputs[0])
+    adder.inputs[1].connect(test_output_block(single).outputs[0])
+    expected = multi_channel_signal.replace(
+        ordinate=multi_channel_signal.ordinate + 1)
+    assert adder.outputs[0].data == expected
+
+
+def test_merge_and_select(test_output_block):
+    merger = blocks.ChannelMerger()
+    for index in range(2):
+        merger.inputs[index].connect(test_output_block(
+            multi_channel_signal.channel(index)).outputs[0])
+    selector = blocks.ChannelSelector(channel=2)
+    selector.inputs[0].connect(merger.outputs[0])
+    assert merger.outputs[0].data.channels == 2
+    assert selector.outputs[0].data == multi_channel_signal.channel(1)
+
+
+def test_multi_channel_rejected(test_output_block):
+    block = blocks.Absolute()
+    with pytest.raises(exceptions.DataTypeError):
+        block.inputs[0].connect(
+            test_output_block(multi_channel_signal).outputs[0])
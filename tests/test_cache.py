@@ -0,0 +1,121 @@
+import numpy as np
+import pytest
+
+from mca import blocks
+from mca.framework import cache, data_types, io_registry
+
+
+@pytest.fixture
+def memory_cache():
+    memory_cache = cache.MemoryCache()
+    io_registry.Registry.cache = memory_cache
+    io_registry.Registry.clear()
+    yield memory_cache
+    io_registry.Registry.clear()
+    io_registry.Registry.cache = None
+
+
+def test_fingerprint():
+    signal = data_types.Signal(0, 10, 0.1, np.arange(10.))
+    same = data_types.Signal(0, 10, 0.1, np.arange(10.))
+    other = data_types.Signal(0, 10, 0.1, np.arange(10.) + 1)
+    assert cache.fingerprint(signal) == cache.fingerprint(same)
+    assert cache.fingerprint(signal) != cache.fingerprint(other)
+    assert cache.fingerprint(None) == cache.fingerprint(None)
+
+
+def test_memory_cache_eviction():
+    signal = data_types.Signal(0, 1000, 1, np.zeros(1000))
+    size = cache.data_size(signal)
+    memory_cache = cache.MemoryCache(max_bytes=2 * size)
+    memory_cache.put("a", [(signal, None)])
+    memory_cache.put("b", [(signal, None)])
+    # Accessing an entry protects it from being evicted
+    assert memory_cache.get("a") is not None
+    memory_cache.put("c", [(signal, None)])
+    assert memory_cache.get("b") is None
+    assert memory_cache.get("a") is not None
+    assert memory_cache.get("c") is not None
+    assert memory_cache.size == 2 * size
+
+
+def test_memory_cache_restores_outputs(memory_cache):
+    a = blocks.SignalGeneratorPeriodic(amp=2, abscissa={"values": 100})
+    b = blocks.Amplifier(multiplier={"factor": 3})
+    b.outputs[0].pinned = True
+    b.inputs[0].connect(a.outputs[0])
+    expected = b.outputs[0].data
+    misses = memory_cache.misses
+    b.parameters["multiplier"].parameters["factor"].value = 4
+    b.trigger_update()
+    assert memory_cache.misses == misses + 1
+    b.parameters["multiplier"].parameters["factor"].value = 3
+    b.trigger_update()
+    assert memory_cache.hits == 1
+    assert b.outputs[0].data == expected
+    assert b.outputs[0].metadata == a.outputs[0].metadata
+
+
+def test_cache_dtype_policy(memory_cache):
+    a = blocks.SignalGeneratorPeriodic(abscissa={"values": 100})
+    a.outputs[0].pinned = True
+    io_registry.Registry.dtype_policy = "float32"
+    try:
+        a.trigger_update()
+        assert a.outputs[0].data.ordinate.dtype == np.float32
+        # Results stored under another policy are not restored
+        io_registry.Registry.dtype_policy = "float64"
+        hits = memory_cache.hits
+        a.trigger_update()
+        assert memory_cache.hits == hits
+        ordinate = a.outputs[0].data.ordinate
+        assert ordinate.dtype == np.float64
+        # The values have double precision
+        assert not np.array_equal(
+            ordinate, ordinate.astype(np.float32).astype(np.float64))
+    finally:
+        io_registry.Registry.dtype_policy = None
+
+
+def test_disk_cache(tmp_path):
+    signal = data_types.Signal(0, 100, 0.1, np.arange(100.))
+    metadata = data_types.MetaData("Test", "s", "V", "Time", "Voltage", "t",
+                                   "U")
+    disk_cache = cache.DiskCache(str(tmp_path), max_bytes=2 * 800)
+    disk_cache.put("a", [(signal, metadata), (None, None)])
+    # Entries persist between instances
+    results = cache.DiskCache(str(tmp_path)).get("a")
+    assert results[0][0] == signal
+    assert results[0][1] == metadata
+    assert results[1] == (None, None)
+    assert disk_cache.get("b") is None
+
+
+def test_disk_cache_eviction(tmp_path):
+    signal = data_types.Signal(0, 100, 1, np.zeros(100))
+    disk_cache = cache.DiskCache(str(tmp_path), max_bytes=3 * 800)
+    disk_cache.put("a", [(signal, None)])
+    disk_cache.put("b", [(signal, None)])
+    disk_cache.put("c", [(signal, None)])
+    assert disk_cache.get("a") is None
+    assert disk_cache.get("c") is not None
+    assert disk_cache.size <= 3 * 800
+
+
+def test_tiered_cache(tmp_path):
+    signal = data_types.Signal(0, 100, 1, np.zeros(100))
+    memory_cache = cache.MemoryCache()
+    disk_cache = cache.DiskCache(str(tmp_path))
+    disk_cache.put("a", [(signal, None)])
+    tiered_cache = cache.TieredCache([memory_cache, disk_cache])
+    assert tiered_cache.get("a")[0][0] == signal
+    assert memory_cache.get("a") is not None
+
+
+def test_file_fingerprint(tmp_path):
+    file_name = tmp_path / "test.txt"
+    file_name.write_text("a")
+    fingerprint = cache.file_fingerprint(str(file_name))
+    assert fingerprint == cache.file_fingerprint(str(file_name))
+    file_name.write_text("ab")
+    assert fingerprint != cache.file_fingerprint(str(file_name))
@@ -0,0 +1,76 @@
+import subprocess
+import sys
+import textwrap
+
+from mca import blocks
+from mca.framework import catalog, io_registry, save
+
+
+def test_builtin_entries():
+    for entry in blocks.catalog.entries:
+        block_class = entry.load()
+        assert entry.name == block_class.name
+        assert entry.tags == tuple(block_class.tags)
+        assert entry.class_string == str(block_class)
+    assert blocks.block_classes == [entry.load()
+                                    for entry in blocks.catalog.entries]
+    assert list(blocks.tag_dict) == blocks.tags
+
+
+def test_load_imports_used_blocks(tmp_path):
+    io_registry.Registry.clear()
+    structure = save.blocks_to_json([blocks.Amplifier()])
+    io_registry.Registry.clear()
+    file_name = tmp_path / "structure.json"
+    file_name.write_text(structure)
+    code = textwrap.dedent(f"""
+        import sys
+        from mca.framework import load
+        loaded = load.load_block_structure({str(file_name)!r})
+        assert type(loaded[0]).__name__ == "Amplifier"
+        assert "mca.blocks.fft" not in sys.modules
+        assert "scipy.signal" not in sys.modules
+    """)
+    assert subprocess.run([sys.executable, "-c", code]).returncode == 0
+
+
+def test_entry_point_discovery(tmp_path, monkeypatch):
+    dist_info = tmp_path / "mca_test_plugin-1.0.dist-info"
+    dist_info.mkdir()
+    (dist_info / "METADATA").write_text(
+        "Metadata-Version: 2.1\nName: mca-test-plugin\nVersion: 1.0\n")
+    (dist_info / "entry_points.txt").write_text(
+        "[mca.blocks]\nplugin = mca_test_plugin:entries\n")
+    (tmp_path / "mca_test_plugin.py").write_text(textwrap.dedent("""
+        from mca.framework.catalog import BlockEntry
+        entries = [BlockEntry("mca_test_blocks:Doubler", "Doubler",
+                              ("Processing",))]
+    """))
+    (tmp_path / "mca_test_blocks.py").write_text(textwrap.dedent("""
+        from mca.framework import Block
+
+        class Doubler(Block):
+            name = "Doubler"
+            tags = ("Processing",)
+
+            def setup_io(self):
+                self.new_input()
+                self.new_output()
+
+            def setup_parameters(self):
+                pass
+
+            def process(self):
+                if self.inputs[0].data is not None:
+                    self.outputs[0].data = 2 * self.inputs[0].data
+    """))
+    monkeypatch.syspath_prepend(str(tmp_path))
+    plugin_catalog = catalog.Catalog(blocks.catalog.entries)
+    names = [entry.name for entry in plugin_catalog.entries]
+    assert "Doubler" in names
+    assert "mca_test_blocks" not in sys.modules
+    entry = plugin_catalog.get("<class 'mca_test_blocks.Doubler'>")
+    io_registry.Registry.clear()
+    block = entry()
+    assert type(block).__name__ == "Doubler"
+    io_registry.Registry.clear()
@@ -0,0 +1,67 @@
+import numpy as np
+import pytest
+
+from mca import blocks
+from mca.framework import data_types, io_registry
+
+test_cases_working_dtype = [
+    (np.int16, None, np.float64),
+    (np.int16, "preserve", np.float32),
+    (np.int32, "preserve", np.float64),
+    (np.float32, "preserve", np.float32),
+    (np.float64, "float32", np.float32),
+    (np.complex128, "float32", np.complex64),
+    (np.float32, "float64", np.float64),
+]
+
+
+@pytest.mark.parametrize("dtype, policy, expected", test_cases_working_dtype)
+def test_working_dtype(dtype, policy, expected):
+    assert data_types.working_dtype(dtype, policy) == expected
+
+
+def test_unknown_policy():
+    with pytest.raises(ValueError):
+        data_types.working_dtype(np.float64, "float16")
+
+
+@pytest.mark.parametrize("block_class, kwargs, dtype, expected", [
+    (blocks.Amplifier, {"multiplier": {"factor": 0.5}}, np.int16, np.float32),
+    (blocks.IRRFilter, {}, np.float32, np.float32),
+    (blocks.FFT, {}, np.float32, np.complex64),
+    (blocks.Adder, {}, np.float32, np.float32),
+    (blocks.Amplifier, {"multiplier": {"factor": 0.5}}, np.float64,
+     np.float64),
+])
+def test_preserve_policy(block_class, kwargs, dtype, expected,
+                         test_output_block):
+    registry = io_registry.IORegistry(dtype_policy="preserve")
+    ordinate = (np.sin(np.arange(1000) / 10) * 1000).astype(dtype)
+    with registry.activate():
+        source = test_output_block(data_types.Signal(0, 1000, 0.01, ordinate))
+        block = block_class(**kwargs)
+    block.inputs[0].connect(source.outputs[0])
+    assert block.outputs[0].data.ordinate.dtype == expected
+
+
+def test_integer_pass_through(test_output_block):
+    registry = io_registry.IORegistry(dtype_policy="float32")
+    ordinate = np.arange(10, dtype=np.int16)
+    with registry.activate():
+        source = test_output_block(data_types.Signal(0, 10, 1, ordinate))
+        amplified = test_output_block(
+            data_types.Signal(0, 10, 1, ordinate * 2.))
+    assert source.outputs[0].data.ordinate.dtype == np.int16
+    assert amplified.outputs[0].data.ordinate.dtype == np.float32
+
+
+@pytest.mark.parametrize("policy, expected", [
+    ("preserve", np.float64),
+    ("float32", np.float32),
+])
+def test_generator_policy(policy, expected):
+    registry = io_registry.IORegistry(dtype_policy=policy)
+    with registry.activate():
+        generator = blocks.SignalGeneratorPeriodic()
+        generator.trigger_update()
+    assert generator.outputs[0].data.ordinate.dtype == expected
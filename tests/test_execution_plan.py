@@ -0,0 +1,92 @@
+import numpy as np
+import pytest
+
+from mca import blocks, exceptions
+from mca.framework import data_types, io_registry
+
+
+@pytest.fixture
+def registry():
+    io_registry.Registry.clear()
+    yield io_registry.Registry
+    io_registry.Registry.clear()
+
+
+def test_plan_order(registry, one_output_block, one_input_one_output_block,
+                    two_input_one_output_block):
+    a = one_output_block()
+    b = one_input_one_output_block()
+    c = one_input_one_output_block()
+    d = two_input_one_output_block()
+    d.inputs[1].connect(c.outputs[0])
+    d.inputs[0].connect(b.outputs[0])
+    c.inputs[0].connect(b.outputs[0])
+    b.inputs[0].connect(a.outputs[0])
+    plan = registry.compile(feeds=[a.outputs[0]])
+    assert plan.blocks == [a, b, c, d]
+    assert [block for block, process in plan.steps] == [b, c, d]
+    count = d.process_count
+    plan.run({a.outputs[0]: 5})
+    assert d.outputs[0].data == 13
+    assert d.process_count == count + 1
+
+
+def test_plan_targets(registry, one_output_block, one_input_one_output_block):
+    a = one_output_block()
+    b = one_input_one_output_block()
+    c = one_input_one_output_block()
+    b.inputs[0].connect(a.outputs[0])
+    c.inputs[0].connect(a.outputs[0])
+    plan = registry.compile(targets=[b])
+    assert plan.blocks == [a, b]
+
+
+def test_plan_constants(registry):
+    generator = blocks.SignalGeneratorPeriodic(abscissa={"values": 100})
+    offset = blocks.SignalGeneratorPeriodic(abscissa={"values": 100})
+    source = blocks.SignalGeneratorPeriodic(abscissa={"values": 100})
+    adder = blocks.Adder()
+    amplifier = blocks.Amplifier(multiplier={"factor": 2})
+    adder.inputs[0].connect(source.outputs[0])
+    amplifier.inputs[0].connect(offset.outputs[0])
+    adder.inputs[1].connect(amplifier.outputs[0])
+    plan = registry.compile(feeds=[source.outputs[0]], targets=[adder])
+    assert [block for block, process in plan.constants] == [offset, amplifier]
+    assert generator not in plan.blocks
+    assert plan.run() == 3
+    for factor in range(3):
+        signal = data_types.Signal(0, 100, 0.01, np.full(100, factor))
+        assert plan.run({source.outputs[0]: signal}) == 1
+        np.testing.assert_allclose(
+            adder.outputs[0].data.ordinate,
+            factor + 2 * offset.outputs[0].data.ordinate)
+    assert not registry.is_stale(adder)
+
+
+def test_plan_outdated(registry, one_output_block,
+                       one_input_one_output_block):
+    a = one_output_block()
+    b = one_input_one_output_block()
+    b.inputs[0].connect(a.outputs[0])
+    plan = registry.compile(feeds=[a.outputs[0]])
+    with pytest.raises(exceptions.ExecutionPlanError):
+        plan.run({b.outputs[0]: 1})
+    b.trigger_update()
+    with pytest.raises(exceptions.ExecutionPlanError):
+        plan.run({a.outputs[0]: 1})
+
+
+def test_plan_lazy(registry, one_output_block, one_input_one_output_block):
+    registry.lazy = True
+    try:
+        a = one_output_block()
+        b = one_input_one_output_block()
+        b.inputs[0].connect(a.outputs[0])
+        a.trigger_update()
+        plan = registry.compile(feeds=[a.outputs[0]])
+        plan.run({a.outputs[0]: 3})
+        assert b.outputs[0].data == 4
+        assert a.process_count == 0
+        assert b.process_count == 1
+    finally:
+        registry.lazy = False
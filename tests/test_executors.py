@@ -0,0 +1,148 @@
+import threading
+
+import numpy as np
+import pytest
+
+from mca import blocks
+from mca.framework import data_types, executors, io_registry
+
+
+class ThreadRecordBlock:
+    """Mixin recording the thread on which the block was processed."""
+
+    def process(self):
+        self.thread = threading.current_thread()
+        super().process()
+
+
+@pytest.fixture
+def thread_executor():
+    executor = executors.ThreadExecutor(max_workers=4)
+    io_registry.Registry.executor = executor
+    io_registry.Registry.clear()
+    yield executor
+    io_registry.Registry.clear()
+    io_registry.Registry.executor = executors.SerialExecutor()
+    executor.shutdown()
+
+
+def test_thread_executor_fan_out(thread_executor, one_output_block,
+                                 one_input_one_output_block,
+                                 two_input_one_output_block):
+    a = one_output_block()
+    chains = []
+    for _ in range(8):
+        b = one_input_one_output_block()
+        c = one_input_one_output_block()
+        b.inputs[0].connect(a.outputs[0])
+        c.inputs[0].connect(b.outputs[0])
+        c.outputs[0].pinned = True
+        chains.append((b, c))
+    d = two_input_one_output_block()
+    d.outputs[0].pinned = True
+    d.inputs[0].connect(chains[0][1].outputs[0])
+    d.inputs[1].connect(chains[1][1].outputs[0])
+    counts = [c.process_count for b, c in chains]
+    assert a.trigger_update() == 18
+    assert [c.process_count for b, c in chains] == [
+        count + 1 for count in counts]
+    assert all(c.outputs[0].data == 3 for b, c in chains)
+    assert d.outputs[0].data == 6
+
+
+def test_thread_executor_not_thread_safe(thread_executor, one_output_block,
+                                         one_input_block):
+    class MainThreadBlock(ThreadRecordBlock, one_input_block):
+        thread_safe = False
+
+    class WorkerBlock(ThreadRecordBlock, one_input_block):
+        pass
+
+    a = one_output_block()
+    blocks = [MainThreadBlock() for _ in range(3)] + [
+        WorkerBlock() for _ in range(3)]
+    for block in blocks:
+        block.inputs[0].connect(a.outputs[0])
+    a.trigger_update()
+    for block in blocks[:3]:
+        assert block.thread is threading.current_thread()
+
+
+def test_thread_executor_error(thread_executor, one_output_block,
+                               one_input_block):
+    class ErrorBlock(one_input_block):
+        def process(self):
+            if self.inputs[0].data:
+                raise ValueError
+
+    a = one_output_block()
+    b = ErrorBlock()
+    c = one_input_block()
+    b.inputs[0].connect(a.outputs[0])
+    c.inputs[0].connect(a.outputs[0])
+    with pytest.raises(ValueError):
+        a.trigger_update()
+
+
+@pytest.fixture(scope="module")
+def process_executor():
+    executor = executors.ProcessExecutor(max_workers=2)
+    yield executor
+    executor.shutdown()
+
+
+def test_process_executor(process_executor):
+    io_registry.Registry.clear()
+    a = blocks.SignalGeneratorPeriodic(amp=2, abscissa={"values": 1000})
+    b = blocks.Amplifier(multiplier={"factor": 3})
+    c = blocks.Absolute()
+    d = blocks.Adder()
+    d.outputs[0].pinned = True
+    b.inputs[0].connect(a.outputs[0])
+    c.inputs[0].connect(a.outputs[0])
+    d.inputs[0].connect(b.outputs[0])
+    d.inputs[1].connect(c.outputs[0])
+    a.trigger_update()
+    expected = [x.outputs[0].data for x in (b, c, d)]
+    io_registry.Registry.executor = process_executor
+    try:
+        assert a.trigger_update() == 4
+    finally:
+        io_registry.Registry.executor = executors.SerialExecutor()
+    for x, signal in zip((b, c, d), expected):
+        assert x.outputs[0].data == signal
+    assert executors._array_buffer(b.outputs[0].data.ordinate) is not None
+    assert b.outputs[0].metadata == a.outputs[0].metadata
+    io_registry.Registry.clear()
+
+
+def test_shared_array(process_executor):
+    ordinate = np.arange(10, dtype=float)
+    buffers = []
+    name, offset, shape, dtype = executors._export_array(ordinate, buffers)
+    shared = executors._import_array(name, offset, shape, dtype)
+    assert np.array_equal(shared, ordinate)
+    # Views of shared arrays are exported without copying
+    assert executors._export_array(shared[2:5], buffers)[:2] == (
+        name, 2 * ordinate.itemsize)
+
+
+def test_pack_multi_channel_signal(process_executor):
+    signal = data_types.MultiChannelSignal(0, 4, 1, np.ones((2, 4)))
+    buffers = []
+    unpacked = executors._unpack(executors._pack(signal, buffers))
+    assert isinstance(unpacked, data_types.MultiChannelSignal)
+    assert unpacked == signal
+
+
+def test_pack_memory_mapped_signal(tmp_path):
+    file_name = str(tmp_path / "signal.npz")
+    np.savez(file_name, ordinate=np.arange(100.).reshape(4, 25))
+    mapped = data_types.memory_map_npz(file_name, "ordinate")
+    signal = data_types.Signal(0, 9, 1, mapped[2, ::-3])
+    packed = executors._pack(signal, [])
+    assert packed[0] == "mapped"
+    unpacked = executors._unpack(packed)
+    assert unpacked == signal
+    assert data_types.mapped_file(unpacked.ordinate) == \
+        data_types.mapped_file(signal.ordinate)
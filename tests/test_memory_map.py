@@ -0,0 +1,129 @@
+import numpy as np
+import pytest
+import scipy.io.wavfile
+
+from mca import blocks, exceptions
+from mca.blocks import audio_saver
+from mca.framework import cache, data_types
+
+
+@pytest.fixture
+def npz_file(tmp_path):
+    file_name = str(tmp_path / "signal.npz")
+    generator = blocks.SignalGeneratorPeriodic(abscissa={"values": 1000})
+    generator.trigger_update()
+    saver = blocks.SignalSaver(file_name=file_name)
+    saver.inputs[0].connect(generator.outputs[0])
+    saver.save_data()
+    return file_name
+
+
+def test_memory_map_npz(tmp_path):
+    file_name = str(tmp_path / "arrays.npz")
+    array = np.arange(1000.).reshape(10, 100)
+    np.savez(file_name, c=array, f=np.asfortranarray(array))
+    for key in ("c", "f"):
+        mapped = data_types.memory_map_npz(file_name, key)
+        np.testing.assert_array_equal(mapped, array)
+    np.savez_compressed(file_name, c=array)
+    assert data_types.memory_map_npz(file_name, "c") is None
+
+
+def test_mapped_file(tmp_path):
+    file_name = str(tmp_path / "arrays.npz")
+    np.savez(file_name, c=np.arange(1000.).reshape(10, 100))
+    mapped = data_types.memory_map_npz(file_name, "c")
+    path, offset = data_types.mapped_file(np.asarray(mapped)[3, 5:])
+    assert np.fromfile(path, count=1, offset=offset)[0] == 305
+    assert data_types.mapped_file(np.arange(3)) is None
+
+
+def test_signal_loader_memory_mapped(npz_file):
+    loaded = []
+    for memory_map in (True, False):
+        loader = blocks.SignalLoader(file_name=npz_file, memory_map=memory_map)
+        loader.load_file()
+        loaded.append((loader.outputs[0].data, loader.outputs[0].metadata))
+    (mapped, mapped_metadata), (read, read_metadata) = loaded
+    assert data_types.mapped_file(mapped.ordinate) is not None
+    assert data_types.mapped_file(read.ordinate) is None
+    assert mapped == read
+    assert mapped_metadata == read_metadata
+
+
+def test_audio_loader_memory_mapped(tmp_path):
+    file_name = str(tmp_path / "audio.wav")
+    data = (np.sin(np.arange(2000) / 10) * 30000).astype(np.int16)
+    scipy.io.wavfile.write(file_name, 48000, data.reshape(-1, 2))
+    # Normalizing, which is the default, reads the whole file
+    loader = blocks.AudioLoader(file_name=file_name)
+    loader.load_wav()
+    assert data_types.mapped_file(loader.outputs[1].data.ordinate) is None
+    loader.parameters["normalize"].value = False
+    loader.load_wav()
+    right = loader.outputs[1].data
+    assert data_types.mapped_file(right.ordinate) is not None
+    np.testing.assert_array_equal(right.ordinate, data[1::2])
+    assert cache.data_size(right) < right.ordinate.nbytes
+    # Slicing blocks keep the data mapped
+    cutter = blocks.Cutter(start_value=0.001, end_value=0.01)
+    cutter.inputs[0].connect(loader.outputs[1])
+    assert data_types.mapped_file(cutter.outputs[0].data.ordinate) is not None
+    # Normalizing reads the data
+    loader.parameters["normalize"].value = True
+    loader.load_wav()
+    assert data_types.mapped_file(loader.outputs[1].data.ordinate) is None
+    assert np.max(np.abs(loader.outputs[1].data.ordinate)) == 1
+
+
+def test_audio_saver_replace_in_use(tmp_path, monkeypatch):
+    file_name = str(tmp_path / "audio.wav")
+    scipy.io.wavfile.write(file_name, 48000, np.zeros(10, dtype=np.int16))
+    generator = blocks.SignalGeneratorPeriodic()
+    saver = blocks.AudioSaver(file_name=file_name)
+    saver.inputs[0].connect(generator.outputs[0])
+    generator.trigger_update()
+
+    def replace(source, destination):
+        # Windows refuses to replace files which are mapped into memory
+        raise PermissionError(destination)
+
+    monkeypatch.setattr(audio_saver.os, "replace", replace)
+    with pytest.raises(exceptions.DataSavingError):
+        saver.save_as_wav()
+    assert [path.name for path in tmp_path.iterdir()] == ["audio.wav"]
+
+
+def test_audio_saver_write_fails(tmp_path, monkeypatch):
+    file_name = str(tmp_path / "audio.wav")
+    data = np.arange(10, dtype=np.int16)
+    scipy.io.wavfile.write(file_name, 48000, data)
+    loader = blocks.AudioLoader(file_name=file_name, normalize=False)
+    loader.load_wav()
+    saver = blocks.AudioSaver(file_name=file_name)
+    saver.inputs[0].connect(loader.outputs[0])
+
+    def write(file_name, rate, data):
+        with open(file_name, "wb") as file:
+            file.write(b"RIFF")
+        raise ValueError("Unsupported data type")
+
+    monkeypatch.setattr(audio_saver.scipy.io.wavfile, "write", write)
+    with pytest.raises(ValueError):
+        saver.save_as_wav()
+    # The file is neither removed nor partially overwritten
+    assert [path.name for path in tmp_path.iterdir()] == ["audio.wav"]
+    np.testing.assert_array_equal(scipy.io.wavfile.read(file_name)[1], data)
+
+
+def test_loader_fingerprint_parameters(tmp_path):
+    file_name = str(tmp_path / "audio.wav")
+    scipy.io.wavfile.write(file_name, 48000, np.arange(10, dtype=np.int16))
+    loader = blocks.AudioLoader(file_name=file_name)
+    loader.load_wav()
+    fingerprint = loader.outputs[0].fingerprint
+    # All parameters which affect the outputs are part of the fingerprint
+    loader.parameters["memory_map"].value = False
+    loader.load_wav()
+    assert loader.outputs[0].fingerprint != fingerprint
+    assert loader.outputs[0].fingerprint != loader.outputs[1].fingerprint
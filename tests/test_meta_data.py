@@ -1,3 +1,5 @@
+import pickle
+
 import pytest
 import numpy as np
 
@@ -43,6 +45,33 @@ def test_signal_equal():
     assert reference_signal == second_signal
 
 
+def test_signal_immutable():
+    signal = data_types.Signal(0, 10, 1, np.arange(10.))
+    with pytest.raises(AttributeError):
+        signal.values = 5
+    with pytest.raises(ValueError):
+        signal.ordinate[0] = 1
+    ordinate = signal.ordinate_copy()
+    ordinate[0] = 1
+    assert signal.ordinate[0] == 0
+
+
+def test_signal_replace():
+    signal = data_types.Signal(0, 10, 1, np.arange(10.))
+    shifted = signal.replace(abscissa_start=5)
+    assert shifted.abscissa_start == 5
+    assert shifted.ordinate is signal.ordinate
+    with pytest.raises(TypeError):
+        signal.replace(unknown=1)
+
+
+def test_signal_pickle():
+    signal = data_types.Signal(0, 10, 1, np.arange(10.))
+    restored = pickle.loads(pickle.dumps(signal))
+    assert restored == signal
+    assert not restored.ordinate.flags.writeable
+
+
 test_cases_string_to_unit = [
               ("V", Unit(["V"])), ("1/V", Unit([], ["V"])),
               ("s*V", Unit(["s", "V"])), ("1/(V*s)", Unit([], ["s", "V"])),
@@ -60,22 +89,36 @@ def test_metadata_to_axis_label():
     assert data_types.metadata_to_axis_label("V", "Voltage", "U") == "Voltage U / V"
 
 
-test_cases_unit_setters = [("m/s", Unit(["m"], ["s"])),
+test_cases_unit_replace = [("m/s", Unit(["m"], ["s"])),
                            (Unit(["V"]), Unit(["V"]))]
 
 
-@pytest.mark.parametrize("unit_a, result", test_cases_unit_setters)
-def test_unit_a_setters(unit_a, result):
+@pytest.mark.parametrize("unit_a, result", test_cases_unit_replace)
+def test_unit_a_replace(unit_a, result):
     metadata = data_types.MetaData("test", Unit(["s"]), Unit(["I"]))
-    metadata.unit_a = unit_a
-    assert metadata.unit_a == result
+    assert metadata.replace(unit_a=unit_a).unit_a == result
+    assert metadata.unit_a == Unit(["s"])
 
 
-@pytest.mark.parametrize("unit_o, result", test_cases_unit_setters)
-def test_unit_o_setters(unit_o, result):
+@pytest.mark.parametrize("unit_o, result", test_cases_unit_replace)
+def test_unit_o_replace(unit_o, result):
     metadata = data_types.MetaData("test", Unit(["s"]), Unit(["I"]))
-    metadata.unit_o = unit_o
-    assert metadata.unit_o == result
+    assert metadata.replace(unit_o=unit_o).unit_o == result
+    assert metadata.unit_o == Unit(["I"])
+
+
+def test_metadata_immutable():
+    metadata = data_types.MetaData("test", "s", "V")
+    with pytest.raises(AttributeError):
+        metadata.name = "changed"
+    with pytest.raises(TypeError):
+        metadata.replace(unknown="changed")
+    assert metadata.replace(name="changed").name == "changed"
+    assert metadata.name == "test"
+
+
+def test_string_to_unit_memoized():
+    assert data_types.string_to_unit("m/s") is data_types.string_to_unit("m/s")
 
 
 reference_metadata = data_types.MetaData("Test", Unit(["s"]), Unit(["V"]),
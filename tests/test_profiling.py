@@ -0,0 +1,40 @@
+import json
+
+from mca import blocks
+from mca.framework import io_registry, profiling
+
+
+def test_profile():
+    io_registry.Registry.clear()
+    a = blocks.SignalGeneratorPeriodic(abscissa={"values": 1000})
+    b = blocks.Amplifier(multiplier={"factor": 3})
+    b.outputs[0].pinned = True
+    b.inputs[0].connect(a.outputs[0])
+    with profiling.profile(trace_memory=True) as profiler:
+        a.trigger_update()
+    assert io_registry.Registry.profiler is None
+    summary = {row["name"]: row for row in profiler.summary()}
+    assert summary["Amplifier"]["calls"] == 1
+    assert summary["Amplifier"]["input_bytes"] >= 8000
+    assert summary["Amplifier"]["output_bytes"] >= 8000
+    assert summary["Amplifier"]["peak_memory"] >= 8000
+    assert summary["Amplifier"]["wall_time"] > 0
+    assert len(profiler.summary_table().splitlines()) == 4
+    io_registry.Registry.clear()
+
+
+def test_chrome_trace(tmp_path):
+    io_registry.Registry.clear()
+    a = blocks.SignalGeneratorPeriodic()
+    b = blocks.Absolute()
+    b.outputs[0].pinned = True
+    b.inputs[0].connect(a.outputs[0])
+    with profiling.profile() as profiler:
+        a.trigger_update()
+    file_name = tmp_path / "trace.json"
+    profiler.save_chrome_trace(str(file_name))
+    with open(file_name) as file:
+        events = json.load(file)["traceEvents"]
+    assert [event["cat"] for event in events] == ["block", "block", "update"]
+    assert all(event["ph"] == "X" for event in events)
+    io_registry.Registry.clear()
@@ -0,0 +1,177 @@
+import numpy as np
+import pytest
+
+from mca import blocks, exceptions
+from mca.framework import data_types, io_registry, streaming
+
+rng = np.random.default_rng(0)
+signal = data_types.Signal(0.5, 1003, 0.001, rng.standard_normal(1003))
+
+
+@pytest.fixture
+def registry():
+    io_registry.Registry.clear()
+    yield io_registry.Registry
+    io_registry.Registry.clear()
+
+
+def stream(registry, source, block, chunk_values=100):
+    """Streams the signal of the source through the block and returns the
+    joined results and the plan.
+    """
+    plan = registry.compile_stream(feeds=[source.outputs[0]],
+                                   outputs=[block.outputs[0]])
+    results = [result[block.outputs[0]] for result in plan.run(
+        {source.outputs[0]: chunk}
+        for chunk in streaming.iter_chunks(signal, chunk_values))]
+    return streaming.concatenate(results), plan
+
+
+def test_iter_chunks():
+    chunks = list(streaming.iter_chunks(signal, 100))
+    assert [chunk.values for chunk in chunks] == [100] * 10 + [3]
+    assert chunks[1].abscissa_start == pytest.approx(0.6)
+    assert np.shares_memory(chunks[1].ordinate, signal.ordinate)
+    assert streaming.concatenate(chunks) == signal
+
+
+def test_segmenter():
+    segmenter = streaming.Segmenter(250)
+    chunks = list(streaming.iter_chunks(signal, 100))
+    segments = []
+    for chunk in chunks[:-1]:
+        segments += segmenter.push(chunk)
+    assert [segment.values for segment in segments] == [250] * 4
+    segments += segmenter.push(chunks[-1], final=True)
+    assert segments[-1].values == 3
+    assert streaming.concatenate(segments) == signal
+
+
+@pytest.mark.parametrize("block_class, kwargs", [
+    (blocks.Amplifier, {"multiplier": {"factor": 2}}),
+    (blocks.IRRFilter, {"cut_off": 50, "order": 4}),
+    (blocks.Integrator, {}),
+    (blocks.Integrator, {"int_rule": "rect"}),
+    (blocks.Differentiator, {}),
+])
+def test_streamed_like_whole_signal(block_class, kwargs, registry,
+                                    test_output_block):
+    source = test_output_block(signal)
+    block = block_class(**kwargs)
+    block.inputs[0].connect(source.outputs[0])
+    whole = block.outputs[0].data
+    result, plan = stream(registry, source, block)
+    assert plan.streamed == [block]
+    assert result == whole
+
+
+def test_adder_aligns_inputs(registry, test_output_block):
+    first = data_types.Signal(0, 1000, 0.01, rng.standard_normal(1000))
+    second = data_types.Signal(2.5, 500, 0.01, rng.standard_normal(500))
+    sources = [test_output_block(first), test_output_block(second)]
+    adder = blocks.Adder()
+    for input_, source in zip(adder.inputs, sources):
+        input_.connect(source.outputs[0])
+    whole = adder.outputs[0].data
+    plan = registry.compile_stream(
+        feeds=[source.outputs[0] for source in sources],
+        outputs=[adder.outputs[0]])
+    second_chunks = list(streaming.iter_chunks(second, 40))
+    chunks = [{sources[0].outputs[0]: chunk,
+               sources[1].outputs[0]: second_chunks[index]
+               if index < len(second_chunks) else None}
+              for index, chunk in enumerate(streaming.iter_chunks(first, 70))]
+    results = [result[adder.outputs[0]] for result in plan.run(chunks)]
+    assert streaming.concatenate(results) == whole
+
+
+def test_materialised_fallback(registry, test_output_block):
+    source = test_output_block(signal)
+    amplifier = blocks.Amplifier(multiplier={"factor": 2})
+    envelope = blocks.Envelope()
+    absolute = blocks.Absolute()
+    amplifier.inputs[0].connect(source.outputs[0])
+    envelope.inputs[0].connect(amplifier.outputs[0])
+    absolute.inputs[0].connect(envelope.outputs[0])
+    whole = absolute.outputs[0].data
+    result, plan = stream(registry, source, absolute)
+    assert plan.streamed == [amplifier]
+    assert plan.materialised == [envelope, absolute]
+    assert result == whole
+
+
+def test_phase_correction_materialised(registry, test_output_block):
+    source = test_output_block(signal)
+    iir_filter = blocks.IRRFilter(cut_off=50, phase_corr=True)
+    iir_filter.inputs[0].connect(source.outputs[0])
+    whole = iir_filter.outputs[0].data
+    result, plan = stream(registry, source, iir_filter)
+    assert plan.materialised == [iir_filter]
+    assert result == whole
+
+
+def test_segmented_fft(registry, test_output_block):
+    source = test_output_block(signal)
+    window = blocks.Window(segment=256)
+    fft = blocks.FFT(segment=256)
+    window.inputs[0].connect(source.outputs[0])
+    fft.inputs[0].connect(window.outputs[0])
+    whole = fft.outputs[0].data
+    plan = registry.compile_stream(feeds=[source.outputs[0]],
+                                   outputs=[fft.outputs[0]])
+    frames = [result[fft.outputs[0]] for result in plan.run(
+        {source.outputs[0]: chunk}
+        for chunk in streaming.iter_chunks(signal, 100))]
+    frames = data_types.MultiChannelSignal.from_signals(
+        [frame for frame in frames if frame is not None])
+    assert frames.channels == 4
+    # Processing the whole signal transforms the same segments
+    assert frames == whole
+    segment = streaming.split(signal, 256)[0]
+    window.parameters["segment"].value = 0
+    fft.parameters["segment"].value = 0
+    source.outputs[0].data = segment
+    source.trigger_update()
+    assert frames.channel(0) == fft.outputs[0].data
+    # The last segment is filled with zeros
+    assert frames.channel(3).values == 256
+
+
+def test_data_after_stream(registry, test_output_block):
+    source = test_output_block(signal)
+    amplifier = blocks.Amplifier(multiplier={"factor": 2})
+    envelope = blocks.Envelope()
+    amplifier.inputs[0].connect(source.outputs[0])
+    envelope.inputs[0].connect(amplifier.outputs[0])
+    whole = envelope.outputs[0].data
+    stream(registry, source, amplifier)
+    # The blocks are processed with the whole signal again
+    assert source.outputs[0].data == signal
+    assert registry.is_stale(amplifier)
+    assert amplifier.outputs[0].data == signal.replace(
+        ordinate=signal.ordinate * 2)
+    assert envelope.outputs[0].data == whole
+
+
+def test_data_after_stopped_stream(registry, test_output_block):
+    source = test_output_block(signal)
+    amplifier = blocks.Amplifier(multiplier={"factor": 2})
+    amplifier.inputs[0].connect(source.outputs[0])
+    plan = registry.compile_stream(feeds=[source.outputs[0]],
+                                   outputs=[amplifier.outputs[0]])
+    results = plan.run({source.outputs[0]: chunk}
+                       for chunk in streaming.iter_chunks(signal, 100))
+    assert next(results)[amplifier.outputs[0]].values == 100
+    results.close()
+    assert source.outputs[0].data == signal
+    assert amplifier.outputs[0].data.values == signal.values
+
+
+def test_stream_plan_outdated(registry, test_output_block):
+    source = test_output_block(signal)
+    amplifier = blocks.Amplifier()
+    amplifier.inputs[0].connect(source.outputs[0])
+    plan = registry.compile_stream(feeds=[source.outputs[0]])
+    blocks.Amplifier().inputs[0].connect(source.outputs[0])
+    with pytest.raises(exceptions.ExecutionPlanError):
+        list(plan.run([{source.outputs[0]: signal}]))